@@ -5,28 +5,46 @@ import argparse
 import json
 import random
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # Fall back to loading the whole file
+    ijson = None
+
 VALID_CONDITIONS = ["simple_voting", "simple_passive", "clarified_passive", "acp"]
 
 
-def load_participants(pilot_id: str) -> list[dict]:
-    """Load participants from the pilot's output directory."""
+def load_participants(pilot_id: str) -> Iterator[dict]:
+    """Stream participants from the pilot's output directory.
+
+    Uses ijson when available so only one participant record is held in
+    memory at a time; otherwise falls back to loading the whole file.
+    """
     path = Path("outputs") / pilot_id / "participants.json"
     if not path.exists():
         print(f"Error: File not found: {path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(path) as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        if ijson is None:
+            data = json.load(f)
+            # Handle both flat list and nested structure
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield from data.get("participants", [])
+            return
 
-    # Handle both flat list and nested structure
-    if isinstance(data, list):
-        return data
-    return data.get("participants", [])
+        # Handle both flat list and nested structure
+        head = f.read(64).lstrip()
+        f.seek(0)
+        prefix = "item" if head.startswith(b"[") else "participants.item"
+        yield from ijson.items(f, prefix, use_float=True)
 
 
-def find_participant_by_id(participants: list[dict], participant_id: str) -> dict | None:
+def find_participant_by_id(participants: Iterable[dict], participant_id: str) -> dict | None:
     """Find a participant by their ID."""
     for p in participants:
         if p.get("participant_id") == participant_id:
@@ -34,15 +52,20 @@ def find_participant_by_id(participants: list[dict], participant_id: str) -> dic
     return None
 
 
-def get_random_participant(participants: list[dict], condition: str) -> dict | None:
-    """Get a random non-failed participant from a condition."""
-    candidates = [
-        p for p in participants
-        if p.get("condition") == condition and p.get("status") != "failed"
-    ]
-    if not candidates:
-        return None
-    return random.choice(candidates)
+def get_random_participant(participants: Iterable[dict], condition: str) -> dict | None:
+    """Get a random non-failed participant from a condition.
+
+    Uses reservoir sampling so the participants can be a stream.
+    """
+    chosen = None
+    seen = 0
+    for p in participants:
+        if p.get("condition") != condition or p.get("status") == "failed":
+            continue
+        seen += 1
+        if random.randrange(seen) == 0:
+            chosen = p
+    return chosen
 
 
 def print_header(participant: dict) -> None:
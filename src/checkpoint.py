@@ -1,14 +1,181 @@
 """Checkpoint utilities for experiment resume support."""
 
+import hashlib
+import io
 import json
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json if orjson is unavailable
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Fall back to the JSONL participant log
+    msgpack = None
+
+try:
+    import ijson
+except ImportError:  # Fall back to a full parse when reading pilot_id
+    ijson = None
+
+from .clustering import ClusterInfo, LazyClusterInfo
 from .participants import Participant, to_dict, from_dict
 
 logger = logging.getLogger(__name__)
 
+# Append-only participant log written at each phase boundary. msgpack is
+# used when available (smaller and faster to encode than JSON); the JSONL
+# log is the fallback and is still read when resuming older runs.
+PARTICIPANTS_LOG = "participants.jsonl"
+PARTICIPANTS_MSGPACK_LOG = "participants.msgpack"
+
+# Binary sidecar holding cluster embeddings referenced by checkpoint.json
+CLUSTER_EMBEDDINGS_NPY = "cluster_embeddings.npy"
+
+# Binary sidecar holding individual summary embeddings referenced by
+# participants.json, which stores a row index instead of the float list
+INDIVIDUAL_EMBEDDINGS_NPY = "individual_embeddings.npy"
+_EMBEDDING_FIELD = "individual_summary_embedding"
+_EMBEDDING_IDX_FIELD = "individual_summary_embedding_idx"
+
+# Digest of the last serialized value of each participant field, keyed by
+# output_dir, then participant_id, then field name. Used to append only the
+# fields that changed since the last checkpoint.
+_last_saved: dict[str, dict[str, dict[str, bytes]]] = {}
+
+# Cluster lists last written per output_dir and their serialized form. Clusters
+# are only produced in phase 4, so later phases reuse the serialized dicts and
+# skip rewriting the embeddings sidecar.
+_last_clusters: dict[str, tuple] = {}
+
+# Single background writer so checkpoint I/O overlaps the next phase.
+# Only one write is in flight; the next save waits for it first.
+_checkpoint_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+_pending_write: Future | None = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize object to indented JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NAIVE_UTC
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Deserialize JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize object to compact single-line JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NAIVE_UTC
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _msgpack_default(obj):
+    """Convert numpy values msgpack cannot encode natively."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to msgpack")
+
+
+def _packb(obj) -> bytes:
+    """Serialize object to msgpack bytes."""
+    return msgpack.packb(obj, use_bin_type=True, default=_msgpack_default)
+
+
+def _pack_map_header(size: int) -> bytes:
+    """Serialize a msgpack map header for size entries."""
+    return msgpack.Packer().pack_map_header(size)
+
+
+def _field_digest(encoded: bytes) -> bytes:
+    """Short digest of a serialized field value for change detection."""
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _log_path(output_dir: str) -> Path:
+    """Get the participant log path for output_dir.
+
+    An existing log keeps its format; a new log is msgpack if available.
+    """
+    output_path = Path(output_dir)
+    for name in (PARTICIPANTS_MSGPACK_LOG, PARTICIPANTS_LOG):
+        if (output_path / name).exists():
+            return output_path / name
+    name = PARTICIPANTS_MSGPACK_LOG if msgpack is not None else PARTICIPANTS_LOG
+    return output_path / name
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path atomically via a temp file and os.replace.
+
+    The temp file is deliberately not fsync'd: a crash can lose the latest
+    checkpoint but never leaves a half-written one behind. Durability is
+    traded for throughput since checkpoints are rewritten every phase.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def atomic_open(path: Path, buffering: int = -1):
+    """Open a temp file for writing that replaces path on successful exit.
+
+    Streaming counterpart of atomic_write_bytes: if the block raises, the
+    temp file is removed and any existing file at path is left untouched.
+
+    Args:
+        path: Destination file path
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Binary file object for the temp file
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=buffering) as f:
+            yield f
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
 
 def save_checkpoint(
     output_dir: str,
@@ -19,10 +186,17 @@ def save_checkpoint(
     clusters_by_option: dict | None = None,
     terminated_early: bool = False,
     termination_reason: str | None = None,
+    pilot_id: str | None = None,
 ) -> None:
     """Save checkpoint after completing a phase.
 
-    Saves both checkpoint metadata and full participant state to allow resume.
+    Appends the participant fields that changed during the phase to the
+    participant log, then saves checkpoint metadata. Clusters that are
+    the same objects as in the previous save are not re-serialized. On the final phase
+    (or early termination) the log is consolidated into participants.json.
+
+    State is serialized synchronously, but the files are written on a
+    background thread; call flush_checkpoints() to wait for the write.
 
     Args:
         output_dir: Path to output directory
@@ -33,10 +207,97 @@ def save_checkpoint(
         clusters_by_option: Dict mapping option -> list of ClusterInfo
         terminated_early: Whether experiment terminated early
         termination_reason: Reason for early termination
+        pilot_id: Pilot ID recorded in the consolidated participants.json
     """
     output_path = Path(output_dir)
+    final = phase >= 9 or terminated_early
+
+    # Serialize everything now so the snapshot reflects state at this phase;
+    # only the file writes happen in the background
+    if final:
+        participants_bytes, individual_npy_bytes = _participants_bytes(
+            output_dir, participants, pilot_id
+        )
+        _last_saved.pop(str(Path(output_dir)), None)
+        _last_clusters.pop(str(Path(output_dir)), None)
+    else:
+        log_path = _log_path(output_dir)
+        log_bytes = b"".join(_changed_participant_records(log_path, phase, participants))
+
+    cached = _last_clusters.get(str(Path(output_dir)))
+    if cached and cached[0] is clusters and cached[1] is clusters_by_option:
+        clusters_data, clusters_by_option_data = cached[2], cached[3]
+        npy_bytes = None
+    else:
+        clusters_data, clusters_by_option_data, npy_bytes = _serialize_clusters(
+            clusters, clusters_by_option
+        )
+        _last_clusters[str(Path(output_dir))] = (
+            clusters, clusters_by_option, clusters_data, clusters_by_option_data
+        )
+
+    # Save checkpoint metadata
+    checkpoint = {
+        "last_completed_phase": phase,
+        "terminated_early": terminated_early,
+        "termination_reason": termination_reason,
+        "phase4_summary": summary,
+        "clusters": clusters_data,
+        "clusters_by_option": clusters_by_option_data,
+        "checkpoint_time": datetime.utcnow().isoformat() + "Z",
+    }
+    checkpoint_bytes = _dumps(checkpoint)
+
+    def write() -> None:
+        # Participants first, so checkpoint.json never claims a phase whose
+        # participant state is missing
+        if final:
+            if individual_npy_bytes is not None:
+                atomic_write_bytes(
+                    output_path / INDIVIDUAL_EMBEDDINGS_NPY, individual_npy_bytes
+                )
+            atomic_write_bytes(output_path / "participants.json", participants_bytes)
+            for name in (PARTICIPANTS_MSGPACK_LOG, PARTICIPANTS_LOG):
+                if (output_path / name).exists():
+                    (output_path / name).unlink()
+        elif log_bytes:
+            with open(log_path, "ab") as f:
+                f.write(log_bytes)
+        if npy_bytes is not None:
+            atomic_write_bytes(output_path / CLUSTER_EMBEDDINGS_NPY, npy_bytes)
+        atomic_write_bytes(output_path / "checkpoint.json", checkpoint_bytes)
+        logger.info(f"Checkpoint saved: phase {phase} completed")
+
+    _submit_write(write)
+
+
+def _submit_write(write) -> None:
+    """Run a checkpoint write on the background writer.
+
+    Waits for the previous write first, so writes stay ordered and any
+    error from it is raised here.
+    """
+    global _pending_write
+    flush_checkpoints()
+    _pending_write = _checkpoint_executor.submit(write)
+
 
-    # Convert clusters to serializable format
+def flush_checkpoints() -> None:
+    """Block until the pending background checkpoint write (if any) finishes.
+
+    Raises:
+        Exception: Whatever the pending write raised
+    """
+    global _pending_write
+    if _pending_write is not None:
+        pending, _pending_write = _pending_write, None
+        pending.result()
+
+
+def _serialize_clusters(
+    clusters: list | None, clusters_by_option: dict | None
+) -> tuple[list[dict] | None, dict[str, list[dict]] | None, bytes | None]:
+    """Convert clusters to checkpoint dicts plus the embeddings sidecar bytes."""
     clusters_data = None
     if clusters:
         clusters_data = [
@@ -54,25 +315,82 @@ def save_checkpoint(
             for option, cluster_list in clusters_by_option.items()
         }
 
-    # Save checkpoint metadata
-    checkpoint = {
-        "last_completed_phase": phase,
-        "terminated_early": terminated_early,
-        "termination_reason": termination_reason,
-        "phase4_summary": summary,
-        "clusters": clusters_data,
-        "clusters_by_option": clusters_by_option_data,
-        "checkpoint_time": datetime.utcnow().isoformat() + "Z",
-    }
+    npy_bytes = _externalize_embeddings(clusters_data, clusters_by_option_data)
+    return clusters_data, clusters_by_option_data, npy_bytes
+
+
+def _externalize_embeddings(
+    clusters_data: list[dict] | None,
+    clusters_by_option_data: dict[str, list[dict]] | None,
+) -> bytes | None:
+    """Move cluster embeddings out of the checkpoint dicts into a .npy sidecar.
+
+    Each cluster dict's 'embedding' list is replaced with an 'embedding_idx'
+    row index into cluster_embeddings.npy (float32, shape (K, d)). Clusters
+    shared between clusters and clusters_by_option get the same index.
 
-    checkpoint_path = output_path / "checkpoint.json"
-    with open(checkpoint_path, "w") as f:
-        json.dump(checkpoint, f, indent=2)
+    Returns:
+        Serialized .npy bytes, or None if no cluster has an embedding
+    """
+    all_dicts = list(clusters_data or [])
+    for cluster_list in (clusters_by_option_data or {}).values():
+        all_dicts.extend(cluster_list)
+
+    rows = []
+    index_by_id = {}
+    for data in all_dicts:
+        embedding = data.pop("embedding", None)
+        if not embedding:
+            data["embedding_idx"] = None
+            continue
+        cluster_id = data["cluster_id"]
+        if cluster_id not in index_by_id:
+            index_by_id[cluster_id] = len(rows)
+            rows.append(embedding)
+        data["embedding_idx"] = index_by_id[cluster_id]
+
+    if not rows:
+        return None
 
-    # Save participants state
-    save_participants(output_dir, participants)
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(rows, dtype=np.float32))
+    return buffer.getvalue()
 
-    logger.info(f"Checkpoint saved: phase {phase} completed")
+
+def _materialize_clusters(output_path: Path, checkpoint: dict) -> None:
+    """Replace checkpoint cluster dicts with cluster objects.
+
+    Dicts carrying an 'embedding_idx' become LazyClusterInfo objects backed by
+    the memory-mapped cluster_embeddings.npy; older checkpoints with inline
+    embeddings become ClusterInfo. A cluster listed in both 'clusters' and
+    'clusters_by_option' is restored as a single shared object.
+    """
+    npy_path = output_path / CLUSTER_EMBEDDINGS_NPY
+    embeddings = None
+    by_id = {}
+
+    def materialize(data: dict):
+        nonlocal embeddings
+        cluster_id = data["cluster_id"]
+        if cluster_id in by_id:
+            return by_id[cluster_id]
+        if "embedding_idx" in data:
+            if embeddings is None and npy_path.exists():
+                embeddings = np.load(npy_path, mmap_mode="r")
+            cluster = LazyClusterInfo(data, embeddings, data["embedding_idx"])
+        else:
+            cluster = ClusterInfo.from_dict(data)
+        by_id[cluster_id] = cluster
+        return cluster
+
+    if checkpoint.get("clusters"):
+        checkpoint["clusters"] = [materialize(d) for d in checkpoint["clusters"]]
+
+    if checkpoint.get("clusters_by_option"):
+        checkpoint["clusters_by_option"] = {
+            option: [materialize(d) for d in cluster_list]
+            for option, cluster_list in checkpoint["clusters_by_option"].items()
+        }
 
 
 def _cluster_to_dict(cluster) -> dict:
@@ -87,31 +405,252 @@ def _cluster_to_dict(cluster) -> dict:
     }
 
 
-def save_participants(output_dir: str, participants: list[Participant]) -> None:
+def append_participants(
+    output_dir: str, phase: int, participants: list[Participant]
+) -> int:
+    """Append changed participant fields to the participant log.
+
+    Each record is {"phase": N, "participant_id": ..., "fields": {...}},
+    holding only the fields whose serialized value differs from the last
+    appended one. A participant's first record carries every field. Records
+    are msgpack-encoded in participants.msgpack, or one JSON object per line
+    in participants.jsonl.
+
+    Args:
+        output_dir: Path to output directory
+        phase: The phase number just completed
+        participants: All participants with current state
+
+    Returns:
+        Number of participant delta records appended
+    """
+    flush_checkpoints()
+    log_path = _log_path(output_dir)
+    records = _changed_participant_records(log_path, phase, participants)
+    if records:
+        with open(log_path, "ab") as f:
+            f.write(b"".join(records))
+    return len(records)
+
+
+def _changed_participant_records(
+    log_path: Path, phase: int, participants: list[Participant]
+) -> list[bytes]:
+    """Serialize per-participant field deltas since the last append.
+
+    Records are encoded for the log format at log_path (msgpack or JSONL).
+    """
+    binary = log_path.name == PARTICIPANTS_MSGPACK_LOG
+    encode = _packb if binary else _dumps_line
+    last_saved = _last_saved.setdefault(str(log_path.parent), {})
+
+    records = []
+    for p in participants:
+        encoded = {key: encode(value) for key, value in to_dict(p).items()}
+        digests = {key: _field_digest(value) for key, value in encoded.items()}
+        previous = last_saved.get(p.participant_id, {})
+        changed = [key for key, digest in digests.items() if previous.get(key) != digest]
+        if not changed:
+            continue
+        last_saved[p.participant_id] = digests
+        if binary:
+            # Same bytes as _packb() of the record dict, reusing the encoded
+            # field values instead of packing them again
+            fields = b"".join(_packb(key) + encoded[key] for key in changed)
+            records.append(
+                b"\x83"  # fixmap with 3 entries
+                + _packb("phase") + _packb(phase)
+                + _packb("participant_id") + _packb(p.participant_id)
+                + _packb("fields") + _pack_map_header(len(changed)) + fields
+            )
+        else:
+            fields = b",".join(
+                b"%s:%s" % (_dumps_line(key), encoded[key]) for key in changed
+            )
+            records.append(
+                b'{"phase":%d,"participant_id":%s,"fields":{%s}}\n'
+                % (phase, _dumps_line(p.participant_id), fields)
+            )
+
+    logger.debug(f"{len(records)} participants changed in phase {phase}")
+    return records
+
+
+def _read_log_entries(log_path: Path):
+    """Yield entries from a participant log, skipping unreadable data.
+
+    A truncated JSONL line is skipped. A truncated trailing msgpack record
+    (crash mid-append) is cut off the file so later appends stay readable.
+    """
+    if log_path.name != PARTICIPANTS_MSGPACK_LOG:
+        with open(log_path, "rb") as f:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    logger.warning(
+                        f"Skipping unreadable line {line_num} in {log_path}"
+                    )
+        return
+
+    if msgpack is None:
+        raise ImportError(f"msgpack is required to read {log_path}")
+
+    with open(log_path, "r+b") as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        end = 0  # Offset just past the last complete record
+        try:
+            for entry in unpacker:
+                end = unpacker.tell()
+                yield entry
+        except (msgpack.UnpackException, ValueError) as e:
+            logger.warning(f"Stopping at unreadable record in {log_path}: {e}")
+        if end < log_path.stat().st_size:
+            logger.warning(f"Truncating incomplete trailing record in {log_path}")
+            f.truncate(end)
+
+
+def _replay_participants_log(output_dir: str) -> list[dict]:
+    """Rebuild latest participant dicts from the participant log.
+
+    Field deltas are merged in log order per participant_id; order follows
+    first appearance. Whole-record entries ({"participant": {...}}) written by
+    older versions replace the record.
+    """
+    log_path = _log_path(output_dir)
+    encode = _packb if log_path.name == PARTICIPANTS_MSGPACK_LOG else _dumps_line
+    latest: dict[str, dict] = {}
+
+    for entry in _read_log_entries(log_path):
+        if "participant" in entry:
+            data = entry["participant"]
+            latest[data["participant_id"]] = data
+        else:
+            latest.setdefault(entry["participant_id"], {}).update(entry["fields"])
+
+    _last_saved[str(Path(output_dir))] = {
+        participant_id: {
+            key: _field_digest(encode(value)) for key, value in data.items()
+        }
+        for participant_id, data in latest.items()
+    }
+
+    return list(latest.values())
+
+
+def save_participants(
+    output_dir: str, participants: list[Participant], pilot_id: str | None = None
+) -> None:
     """Save participants state to JSON file.
 
     Args:
         output_dir: Path to output directory
         participants: All participants with current state
+        pilot_id: Pilot ID to record. If None, preserved from the existing file.
     """
-    output_path = Path(output_dir)
-    participants_path = output_path / "participants.json"
+    data, npy_bytes = _participants_bytes(output_dir, participants, pilot_id)
+    flush_checkpoints()
+    if npy_bytes is not None:
+        atomic_write_bytes(Path(output_dir) / INDIVIDUAL_EMBEDDINGS_NPY, npy_bytes)
+    atomic_write_bytes(Path(output_dir) / "participants.json", data)
+
+
+def _participants_bytes(
+    output_dir: str, participants: list[Participant], pilot_id: str | None
+) -> tuple[bytes, bytes | None]:
+    """Serialize the consolidated participants.json payload.
+
+    Returns:
+        Tuple of (participants.json bytes, individual_embeddings.npy bytes or
+        None if no participant has an embedding)
+    """
+    participants_path = Path(output_dir) / "participants.json"
 
-    # Load existing data to preserve pilot_id if present
-    pilot_id = None
-    if participants_path.exists():
-        with open(participants_path, "r") as f:
-            existing = json.load(f)
-            pilot_id = existing.get("pilot_id")
+    if pilot_id is None:
+        flush_checkpoints()
+        if participants_path.exists():
+            pilot_id = _read_pilot_id(participants_path)
 
+    rows = []
     participants_data = {
         "pilot_id": pilot_id,
         "generated_at": datetime.utcnow().isoformat() + "Z",
-        "participants": [to_dict(p) for p in participants],
+        "participants": [participant_record(p, rows) for p in participants],
     }
 
-    with open(participants_path, "w") as f:
-        json.dump(participants_data, f, indent=2)
+    return _dumps(participants_data), embeddings_npy_bytes(rows)
+
+
+def participant_record(participant: Participant, rows: list) -> dict:
+    """Build a participant's participants.json record.
+
+    The 'individual_summary_embedding' list is moved to rows and replaced
+    with an 'individual_summary_embedding_idx' row index into
+    individual_embeddings.npy, keeping float lists out of the JSON.
+
+    Args:
+        participant: Participant to serialize
+        rows: Embedding rows collected so far; appended to in place
+
+    Returns:
+        Participant dict for participants.json
+    """
+    record = to_dict(participant)
+    embedding = record.pop(_EMBEDDING_FIELD)
+    if embedding is None:
+        record[_EMBEDDING_IDX_FIELD] = None
+    else:
+        record[_EMBEDDING_IDX_FIELD] = len(rows)
+        rows.append(embedding)
+    return record
+
+
+def embeddings_npy_bytes(rows: list) -> bytes | None:
+    """Serialize embedding rows as float32 .npy bytes, or None if empty."""
+    if not rows:
+        return None
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(rows, dtype=np.float32))
+    return buffer.getvalue()
+
+
+def _restore_participant_embeddings(output_path: Path, records: list[dict]) -> None:
+    """Put sidecar embeddings back into participants.json records in place.
+
+    Records from older files with inline embeddings are left unchanged.
+    """
+    embeddings = None
+    for record in records:
+        if _EMBEDDING_IDX_FIELD not in record:
+            continue
+        idx = record.pop(_EMBEDDING_IDX_FIELD)
+        if idx is None:
+            record[_EMBEDDING_FIELD] = None
+            continue
+        if embeddings is None:
+            npy_path = output_path / INDIVIDUAL_EMBEDDINGS_NPY
+            if not npy_path.exists():
+                logger.warning(f"Missing {npy_path}; individual embeddings not restored")
+                embeddings = np.empty((0, 0), dtype=np.float32)
+            else:
+                embeddings = np.load(npy_path)
+        record[_EMBEDDING_FIELD] = (
+            embeddings[idx].tolist() if idx < len(embeddings) else None
+        )
+
+
+def _read_pilot_id(participants_path: Path) -> str | None:
+    """Read pilot_id from participants.json without parsing every participant."""
+    if ijson is None:
+        return _loads(participants_path.read_bytes()).get("pilot_id")
+
+    with open(participants_path, "rb") as f:
+        for key, value in ijson.kvitems(f, ""):
+            if key == "pilot_id":
+                return value
+    return None
 
 
 def load_checkpoint(output_dir: str) -> dict | None:
@@ -126,18 +665,19 @@ def load_checkpoint(output_dir: str) -> dict | None:
             - terminated_early: bool
             - termination_reason: str | None
             - phase4_summary: str | None (deprecated)
-            - clusters: list[dict] | None
-            - clusters_by_option: dict[str, list[dict]] | None
+            - clusters: list[ClusterInfo | LazyClusterInfo] | None
+            - clusters_by_option: dict[str, list[ClusterInfo | LazyClusterInfo]] | None
             - checkpoint_time: str
         Or None if no checkpoint exists
     """
+    flush_checkpoints()
     checkpoint_path = Path(output_dir) / "checkpoint.json"
 
     if not checkpoint_path.exists():
         return None
 
-    with open(checkpoint_path, "r") as f:
-        checkpoint = json.load(f)
+    checkpoint = _loads(checkpoint_path.read_bytes())
+    _materialize_clusters(checkpoint_path.parent, checkpoint)
 
     logger.info(
         f"Loaded checkpoint: phase {checkpoint['last_completed_phase']} "
@@ -150,21 +690,28 @@ def load_checkpoint(output_dir: str) -> dict | None:
 def load_participants(output_dir: str) -> list[Participant] | None:
     """Load participants from checkpoint.
 
+    Replays the participant log if present (in-progress experiment),
+    otherwise reads the consolidated participants.json.
+
     Args:
         output_dir: Path to output directory
 
     Returns:
-        List of Participant objects, or None if file doesn't exist
+        List of Participant objects, or None if neither file exists
     """
+    flush_checkpoints()
+    log_path = _log_path(output_dir)
     participants_path = Path(output_dir) / "participants.json"
 
-    if not participants_path.exists():
+    if log_path.exists():
+        records = _replay_participants_log(output_dir)
+    elif participants_path.exists():
+        records = _loads(participants_path.read_bytes())["participants"]
+        _restore_participant_embeddings(Path(output_dir), records)
+    else:
         return None
 
-    with open(participants_path, "r") as f:
-        data = json.load(f)
-
-    participants = [from_dict(p) for p in data["participants"]]
+    participants = [from_dict(p) for p in records]
     logger.info(f"Loaded {len(participants)} participants from checkpoint")
 
     return participants
@@ -179,4 +726,5 @@ def checkpoint_exists(output_dir: str) -> bool:
     Returns:
         True if checkpoint.json exists
     """
+    flush_checkpoints()
     return (Path(output_dir) / "checkpoint.json").exists()
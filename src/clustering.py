@@ -1,17 +1,25 @@
 """Clustering algorithms for embedding-based position grouping."""
 
 import logging
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
 import numpy as np
-from sklearn.cluster import KMeans, AgglomerativeClustering
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
+from sklearn.cluster import KMeans, MiniBatchKMeans, AgglomerativeClustering
 from sklearn.metrics import silhouette_score
+from sklearn.metrics.pairwise import cosine_distances
+
+from .embeddings import EMBEDDING_DTYPE
 
 logger = logging.getLogger(__name__)
 
 # Valid clustering algorithms
 VALID_ALGORITHMS = ["kmeans", "agglomerative"]
 
+# Above this many samples, KMeans is replaced by MiniBatchKMeans
+MINIBATCH_THRESHOLD = 200
+
 
 @dataclass
 class ClusterInfo:
@@ -25,8 +33,19 @@ class ClusterInfo:
     member_ids: list = field(default_factory=list)  # Participant IDs
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Built by hand rather than with asdict() to avoid deep-copying the
+        embedding and member_ids lists; the result shares them.
+        """
+        return {
+            "cluster_id": self.cluster_id,
+            "option": self.option,
+            "description": self.description,
+            "embedding": self.embedding,
+            "member_count": self.member_count,
+            "member_ids": self.member_ids,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "ClusterInfo":
@@ -34,22 +53,97 @@ class ClusterInfo:
         return cls(**data)
 
 
+class LazyClusterInfo:
+    """ClusterInfo restored from a checkpoint, with the embedding loaded on demand.
+
+    Metadata fields are plain attributes. The embedding is read from a row of
+    the (memory-mapped) checkpoint embedding array on first access, so resumed
+    phases that only use descriptions or member counts never decode it.
+    """
+
+    __slots__ = (
+        "cluster_id",
+        "option",
+        "description",
+        "member_count",
+        "member_ids",
+        "_embedding",
+        "_source",
+        "_index",
+    )
+
+    def __init__(self, data: dict, source=None, index: int | None = None):
+        self.cluster_id = data["cluster_id"]
+        self.option = data["option"]
+        self.description = data["description"]
+        self.member_count = data.get("member_count", 0)
+        self.member_ids = data.get("member_ids", [])
+        self._embedding = None
+        self._source = source
+        self._index = index
+
+    @property
+    def embedding(self) -> list:
+        """Embedding of the description, decoded on first access."""
+        if self._embedding is None:
+            if self._source is None or self._index is None:
+                self._embedding = []
+            else:
+                self._embedding = self._source[self._index].tolist()
+        return self._embedding
+
+    @embedding.setter
+    def embedding(self, value: list) -> None:
+        self._embedding = value
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "cluster_id": self.cluster_id,
+            "option": self.option,
+            "description": self.description,
+            "embedding": self.embedding,
+            "member_count": self.member_count,
+            "member_ids": self.member_ids,
+        }
+
+
+def _make_clusterer(algorithm: str, k: int, n_samples: int):
+    """Create a clusterer for k clusters.
+
+    KMeans uses a single k-means++ initialization (n_init=1) since the
+    silhouette sweep already compares several k; large inputs switch to
+    MiniBatchKMeans.
+    """
+    if algorithm == "kmeans":
+        if n_samples > MINIBATCH_THRESHOLD:
+            return MiniBatchKMeans(
+                n_clusters=k, batch_size=256, random_state=42, n_init=1
+            )
+        return KMeans(n_clusters=k, random_state=42, n_init=1, algorithm="elkan")
+    return AgglomerativeClustering(n_clusters=k)
+
+
 def cluster_embeddings(
-    embeddings: list[list[float]],
+    embeddings: list[list[float]] | np.ndarray,
     max_clusters: int = 6,
     algorithm: str = "kmeans",
     min_cluster_size: int = 1,
+    early_stop: bool = True,
 ) -> list[int]:
     """Cluster embeddings and return cluster labels.
 
     Automatically determines optimal number of clusters (up to max_clusters)
-    using silhouette score.
+    using silhouette score. With early_stop, the sweep ends once the score
+    has fallen below the best for two consecutive k.
 
     Args:
-        embeddings: List of embedding vectors
+        embeddings: Embedding vectors, as a list or a (n, d) array; a
+                    contiguous float32 array is used without conversion
         max_clusters: Maximum number of clusters (default 6)
         algorithm: Clustering algorithm ("kmeans" or "agglomerative")
         min_cluster_size: Minimum points to attempt clustering (default 1)
+        early_stop: Stop the k sweep after two consecutive score drops
 
     Returns:
         List of cluster labels (0-indexed), same length as embeddings
@@ -71,7 +165,12 @@ def cluster_embeddings(
     if n_samples == 1:
         return [0]
 
-    embeddings_arr = np.array(embeddings)
+    embeddings_arr = np.ascontiguousarray(embeddings, dtype=EMBEDDING_DTYPE)
+
+    # L2-normalize once so Euclidean KMeans on unit vectors matches cosine
+    norms = np.linalg.norm(embeddings_arr, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    embeddings_arr = embeddings_arr / norms
 
     # Determine optimal number of clusters
     # Can't have more clusters than samples
@@ -83,36 +182,49 @@ def cluster_embeddings(
 
     # If only 2 samples, just use 2 clusters
     if n_samples == 2:
-        if algorithm == "kmeans":
-            labels = KMeans(n_clusters=2, random_state=42, n_init=10).fit_predict(
-                embeddings_arr
-            )
-        else:
-            labels = AgglomerativeClustering(n_clusters=2).fit_predict(embeddings_arr)
+        labels = _make_clusterer(algorithm, 2, n_samples).fit_predict(embeddings_arr)
         return labels.tolist()
 
+    # Pairwise distances are fixed across the sweep, so compute them once
+    distances = cosine_distances(embeddings_arr)
+
+    # Agglomerative: build one average-linkage tree on the precomputed
+    # distances and cut it at each k instead of refitting per k
+    tree = None
+    if algorithm == "agglomerative":
+        tree = linkage(squareform(distances, checks=False), method="average")
+
     # Find optimal k using silhouette score
     best_k = 1
     best_score = -1
     best_labels = [0] * n_samples
+    consecutive_drops = 0
 
     for k in range(2, max_k + 1):
         try:
-            if algorithm == "kmeans":
-                clusterer = KMeans(n_clusters=k, random_state=42, n_init=10)
+            if tree is not None:
+                labels = fcluster(tree, t=k, criterion="maxclust") - 1
             else:
-                clusterer = AgglomerativeClustering(n_clusters=k)
-
-            labels = clusterer.fit_predict(embeddings_arr)
+                clusterer = _make_clusterer(algorithm, k, n_samples)
+                labels = clusterer.fit_predict(embeddings_arr)
 
             # Calculate silhouette score
-            score = silhouette_score(embeddings_arr, labels)
+            score = silhouette_score(distances, labels, metric="precomputed")
 
             if score > best_score:
                 best_score = score
                 best_k = k
                 best_labels = labels.tolist()
 
+            # Silhouette is typically unimodal in k
+            if score < best_score:
+                consecutive_drops += 1
+            else:
+                consecutive_drops = 0
+            if early_stop and consecutive_drops >= 2:
+                logger.debug(f"Silhouette score dropped twice, stopping at k={k}")
+                break
+
         except Exception as e:
             logger.warning(f"Clustering failed for k={k}: {e}")
             continue
@@ -157,16 +269,18 @@ def get_cluster_centroids(
     Returns:
         Dict mapping cluster label to centroid embedding
     """
-    embeddings_arr = np.array(embeddings)
-    labels_arr = np.array(labels)
+    if not labels:
+        return {}
 
-    centroids = {}
-    unique_labels = set(labels)
+    embeddings_arr = np.ascontiguousarray(embeddings, dtype=EMBEDDING_DTYPE)
 
-    for label in unique_labels:
-        mask = labels_arr == label
-        cluster_embeddings = embeddings_arr[mask]
-        centroid = np.mean(cluster_embeddings, axis=0)
-        centroids[label] = centroid.tolist()
+    # Map labels to contiguous indices, then scatter-add all rows in one pass
+    unique_labels, inverse = np.unique(np.array(labels), return_inverse=True)
+    sums = np.zeros((len(unique_labels), embeddings_arr.shape[1]), dtype=embeddings_arr.dtype)
+    np.add.at(sums, inverse, embeddings_arr)
+    counts = np.bincount(inverse, minlength=len(unique_labels)).astype(sums.dtype)
+    centroids_mat = sums / counts[:, None]
 
-    return centroids
+    return {
+        int(label): centroids_mat[i].tolist() for i, label in enumerate(unique_labels)
+    }
@@ -1,9 +1,16 @@
 """Configuration loading and validation for experiment framework."""
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader
+
 REQUIRED_FIELDS = [
     "pilot_id",
     "pilot_name",
@@ -29,16 +36,40 @@ VALID_OPPOSITION_METHODS = [
 
 VALID_CLUSTERING_ALGORITHMS = ["kmeans", "agglomerative"]
 
+VALID_EMBEDDING_FORMATS = ["json", "msgpack"]
+
 DEFAULTS = {
     "api_sleep_seconds": 3,
+    "rpm": 500,
+    "tpm": 30000,
     "arguments_per_option": 3,
     "include_vote_distribution": False,
     "max_clarification_exchanges": 5,
     "max_socratic_exchanges": 5,
+    "dialogue_max_concurrency": 4,
+    "vote_max_concurrency": 16,
+    "llm_max_concurrency": 16,
+    "summary_batch_size": 1,
+    "description_batch_size": 1,
+    "enrich_concurrency": 16,
+    "use_responses_api": False,
+    "llm_cache": False,
+    "enrich_cache": True,
+    "summary_cache": True,
+    "force_resummarize": False,
+    "max_input_tokens": 6000,
+    "llm_judge_semantic_cache": False,
+    "semantic_cache_threshold": 0.95,
+    "aggressive_checkpointing": False,
     "disagreement_threshold": 0.5,
     "clustering_algorithm": "kmeans",
     "max_clusters_per_option": 6,
+    "silhouette_early_stop": True,
     "embedding_model": "text-embedding-3-small",
+    "fuzzy_embedding_cache": False,
+    "embeddings_json": False,
+    "participants_ndjson": False,
+    "embedding_format": "json",
 }
 
 
@@ -59,8 +90,9 @@ def load_config(path: str) -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    raw = _load_raw(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    # Copy so callers can't mutate the cached dict
+    config = copy.deepcopy(raw)
 
     # Apply defaults for missing optional fields
     for key, default_value in DEFAULTS.items():
@@ -71,6 +103,17 @@ def load_config(path: str) -> dict:
     return config
 
 
+@functools.lru_cache(maxsize=32)
+def _load_raw(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file, cached by (absolute path, mtime).
+
+    The mtime argument is only part of the cache key, so edits to the file
+    invalidate the cached parse.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def validate_config(config: dict) -> None:
     """Validate config has all required fields and valid values.
 
@@ -116,6 +159,14 @@ def validate_config(config: dict) -> None:
             f"Must be one of: {VALID_CLUSTERING_ALGORITHMS}"
         )
 
+    # Validate cluster embeddings output format
+    embedding_format = config.get("embedding_format", "json")
+    if embedding_format not in VALID_EMBEDDING_FORMATS:
+        raise ValueError(
+            f"Invalid embedding_format '{embedding_format}'. "
+            f"Must be one of: {VALID_EMBEDDING_FORMATS}"
+        )
+
     # Validate max clusters
     max_clusters = config.get("max_clusters_per_option", 6)
     if max_clusters < 1:
@@ -0,0 +1,140 @@
+"""Content-addressed on-disk cache for embedding vectors.
+
+Embeddings are stored as float32 .npy files under
+cache/emb/<model>/<sha256[:2]>/<sha256>.npy, keyed by model and text.
+
+With fuzzy lookups enabled, each entry is also indexed under a normalized
+form of its text (case, punctuation and whitespace removed), so texts that
+differ only in those reuse the cached vector.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "cache" / "emb"
+
+# Lookup counters for this process, see cache_stats()
+_stats = {"hits": 0, "misses": 0, "fuzzy_hits": 0}
+
+# Suffix of the model directory holding normalized-text entries, so they
+# never collide with the exact entry of a text that is already normalized
+_NORMALIZED_SUFFIX = "#normalized"
+
+_RE_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for fuzzy lookups: lowercase, no punctuation, single spaces."""
+    return " ".join(_RE_PUNCTUATION.sub("", text.casefold()).split())
+
+
+def cache_key(model: str, text: str) -> str:
+    """Compute cache key for a (model, text) pair.
+
+    Also used to key in-process embedding caches, so they never reuse a
+    vector across models.
+    """
+    return hashlib.sha256((model + "\n" + text).encode("utf-8")).hexdigest()
+
+
+def _entry_path(model: str, text: str, cache_dir: Path | None = None) -> Path:
+    """Get the .npy path for a (model, text) pair."""
+    key = cache_key(model, text)
+    return (cache_dir or DEFAULT_CACHE_DIR) / model / key[:2] / f"{key}.npy"
+
+
+def get_cached(
+    model: str, text: str, cache_dir: Path | None = None, fuzzy: bool = False
+) -> list[float] | None:
+    """Look up a cached embedding.
+
+    Args:
+        model: Embedding model name
+        text: Text that was embedded
+        cache_dir: Cache root directory. Uses default if None.
+        fuzzy: Fall back to the entry for the normalized text on an exact miss
+
+    Returns:
+        Embedding vector, or None if not cached
+    """
+    embedding = _load_entry(_entry_path(model, text, cache_dir))
+    if embedding is None and fuzzy:
+        embedding = _load_entry(
+            _entry_path(model + _NORMALIZED_SUFFIX, normalize_text(text), cache_dir)
+        )
+        if embedding is not None:
+            _stats["fuzzy_hits"] += 1
+
+    _stats["hits" if embedding is not None else "misses"] += 1
+    return embedding
+
+
+def _load_entry(path: Path) -> list[float] | None:
+    """Read one .npy entry, or None if missing or unreadable."""
+    if not path.exists():
+        return None
+
+    try:
+        return np.load(path).tolist()
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable embedding cache entry {path}: {e}")
+        return None
+
+
+def cache_stats() -> dict:
+    """Get cache lookup counts since the process started.
+
+    Returns:
+        Dict with 'hits' and 'misses' counts; 'fuzzy_hits' counts the hits
+        served by a normalized-text entry
+    """
+    return dict(_stats)
+
+
+def put_cached(
+    model: str,
+    text: str,
+    embedding: list[float],
+    cache_dir: Path | None = None,
+    fuzzy: bool = False,
+) -> None:
+    """Store an embedding in the cache.
+
+    Args:
+        model: Embedding model name
+        text: Text that was embedded
+        embedding: Embedding vector
+        cache_dir: Cache root directory. Uses default if None.
+        fuzzy: Also index the entry under the normalized text
+    """
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(embedding, dtype=np.float32))
+    data = buffer.getvalue()
+
+    _write_entry(_entry_path(model, text, cache_dir), data)
+    if fuzzy:
+        _write_entry(
+            _entry_path(model + _NORMALIZED_SUFFIX, normalize_text(text), cache_dir),
+            data,
+        )
+
+
+def _write_entry(path: Path, data: bytes) -> None:
+    """Write one .npy entry atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file and rename so concurrent readers never see partial
+    # data; the name is per process and thread, since thread pools may store
+    # the same key at once
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
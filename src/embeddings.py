@@ -1,28 +1,49 @@
 """Embedding generation utilities using OpenAI API."""
 
+import asyncio
 import logging
-import time
+import math
 
 import numpy as np
 from openai import RateLimitError
 
-from .llm import _get_client, _parse_retry_after, _is_quota_exceeded
+try:
+    import simsimd
+except ImportError:  # optional: SIMD cosine kernels, NumPy fallback below
+    simsimd = None
+
+from .embedding_cache import get_cached, put_cached
+from .llm import _new_async_client, _parse_retry_after, _is_quota_exceeded
 
 logger = logging.getLogger(__name__)
 
 # Default embedding model
 DEFAULT_MODEL = "text-embedding-3-small"
 
+# Largest input list the embeddings endpoint accepts in one request
+MAX_BATCH_SIZE = 2048
+
+# Embeddings carry no precision beyond float32; float64 only doubles memory traffic
+EMBEDDING_DTYPE = np.float32
+
+# Dtype for normalized matrices that are only used for cosine ranking. SimSIMD
+# has native float16 kernels, halving memory traffic again; NumPy has no fast
+# float16 matmul, so stay at float32 without it.
+COMPACT_EMBEDDING_DTYPE = np.float16 if simsimd is not None else EMBEDDING_DTYPE
+
 
 def get_embeddings(
     texts: list[str], config: dict, batch_size: int = 100
 ) -> list[list[float]]:
     """Get embeddings for a list of texts.
 
+    Synchronous wrapper around get_embeddings_async().
+
     Args:
         texts: List of text strings to embed
         config: Experiment config with optional 'embedding_model',
-                'max_api_retries', 'api_retry_base_seconds'
+                'max_api_retries', 'api_retry_base_seconds',
+                'embedding_max_concurrency'
         batch_size: Maximum texts per API call (default 100)
 
     Returns:
@@ -34,37 +55,112 @@ def get_embeddings(
     if not texts:
         return []
 
-    client = _get_client()
+    return asyncio.run(get_embeddings_async(texts, config, batch_size))
+
+
+async def get_embeddings_async(
+    texts: list[str], config: dict, batch_size: int = 100
+) -> list[list[float]]:
+    """Get embeddings for a list of texts, submitting batches concurrently.
+
+    Duplicate texts are embedded once. Texts already in the on-disk
+    embedding cache (keyed by model and text) are not sent to the API; set
+    'use_embedding_cache: false' to disable. With 'fuzzy_embedding_cache:
+    true', texts differing from a cached one only in case, punctuation or
+    whitespace reuse its embedding. At most 'embedding_max_concurrency'
+    (default 4) batches are in flight at once. Each batch retries
+    independently and throttles for 'api_sleep_seconds' after completing
+    before releasing its slot. Output order matches input order.
+
+    Args:
+        texts: List of text strings to embed
+        config: Experiment config (see get_embeddings)
+        batch_size: Maximum texts per API call (default 100)
+
+    Returns:
+        List of embedding vectors (each is a list of floats)
+
+    Raises:
+        RuntimeError: If embedding API fails after all retries
+    """
+    if not texts:
+        return []
+
+    # Embed each distinct text once, then fan results back out in input order
+    unique_texts = list(dict.fromkeys(texts))
+    if len(unique_texts) < len(texts):
+        logger.debug(
+            f"Embedding {len(unique_texts)} unique texts out of {len(texts)}"
+        )
+        unique_embeddings = await get_embeddings_async(unique_texts, config, batch_size)
+        embedding_by_text = dict(zip(unique_texts, unique_embeddings))
+        return [embedding_by_text[text] for text in texts]
+
     model = config.get("embedding_model", DEFAULT_MODEL)
+
+    if config.get("use_embedding_cache", True):
+        fuzzy = config.get("fuzzy_embedding_cache", False)
+        cached = [get_cached(model, text, fuzzy=fuzzy) for text in texts]
+        miss_indices = [i for i, emb in enumerate(cached) if emb is None]
+        logger.info(
+            f"Embedding cache: {len(texts) - len(miss_indices)} hits, "
+            f"{len(miss_indices)} misses"
+        )
+
+        if miss_indices:
+            fetched = await _fetch_embeddings(
+                [texts[i] for i in miss_indices], model, config, batch_size
+            )
+            for i, emb in zip(miss_indices, fetched):
+                cached[i] = emb
+                put_cached(model, texts[i], emb, fuzzy=fuzzy)
+
+        return cached
+
+    return await _fetch_embeddings(texts, model, config, batch_size)
+
+
+async def _fetch_embeddings(
+    texts: list[str], model: str, config: dict, batch_size: int
+) -> list[list[float]]:
+    """Fetch embeddings from the API in concurrent, throttled batches."""
     max_retries = config.get("max_api_retries", 5)
     base_wait = config.get("api_retry_base_seconds", 2)
     sleep_seconds = config.get("api_sleep_seconds", 1)
+    max_concurrency = config.get("embedding_max_concurrency", 4)
     quota_wait = 60
 
-    all_embeddings = []
+    semaphore = asyncio.Semaphore(max_concurrency)
+    n_batches = (len(texts) + batch_size - 1) // batch_size
 
-    # Process in batches
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        batch_embeddings = _get_batch_embeddings(
-            client, batch, model, max_retries, base_wait, quota_wait
+    async def run_batch(client, batch: list[str], batch_num: int):
+        async with semaphore:
+            batch_embeddings = await _get_batch_embeddings(
+                client, batch, model, max_retries, base_wait, quota_wait
+            )
+            # Throttle before releasing the slot to the next batch
+            if batch_num < n_batches - 1:
+                await asyncio.sleep(sleep_seconds)
+            return batch_embeddings
+
+    async with _new_async_client() as client:
+        results = await asyncio.gather(
+            *(
+                run_batch(client, texts[i : i + batch_size], i // batch_size)
+                for i in range(0, len(texts), batch_size)
+            )
         )
 
+    all_embeddings = []
+    for batch_num, batch_embeddings in enumerate(results):
         if batch_embeddings is None:
-            raise RuntimeError(
-                f"Failed to get embeddings for batch {i // batch_size + 1}"
-            )
-
+            raise RuntimeError(f"Failed to get embeddings for batch {batch_num + 1}")
         all_embeddings.extend(batch_embeddings)
 
-        # Throttle between batches
-        if i + batch_size < len(texts):
-            time.sleep(sleep_seconds)
-
     return all_embeddings
 
 
-def _get_batch_embeddings(
+async def _get_batch_embeddings(
     client,
     texts: list[str],
     model: str,
@@ -75,7 +171,7 @@ def _get_batch_embeddings(
     """Get embeddings for a single batch with retry logic.
 
     Args:
-        client: OpenAI client
+        client: AsyncOpenAI client
         texts: List of texts to embed
         model: Embedding model name
         max_retries: Maximum retry attempts
@@ -87,7 +183,7 @@ def _get_batch_embeddings(
     """
     for attempt in range(max_retries):
         try:
-            response = client.embeddings.create(
+            response = await client.embeddings.create(
                 model=model,
                 input=texts,
             )
@@ -102,7 +198,7 @@ def _get_batch_embeddings(
                         f"Quota exceeded. Waiting {quota_wait}s before retry "
                         f"(attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(quota_wait)
+                    await asyncio.sleep(quota_wait)
                 else:
                     logger.error(
                         "Quota exceeded after retry. Check billing at "
@@ -118,7 +214,7 @@ def _get_batch_embeddings(
                         f"Rate limited. Waiting {wait_time:.1f}s "
                         f"(attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     logger.error(f"Max retries exceeded after rate limiting: {e}")
                     return None
@@ -140,10 +236,79 @@ def cosine_distance(a: np.ndarray, b: np.ndarray) -> float:
     Returns:
         Cosine distance (1 - cosine similarity), range [0, 2]
     """
-    a = np.asarray(a)
-    b = np.asarray(b)
-    similarity = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
-    return 1.0 - similarity
+    # Skip conversion when already given float32 arrays (the common case)
+    if not (isinstance(a, np.ndarray) and a.dtype == EMBEDDING_DTYPE):
+        a = np.asarray(a, dtype=EMBEDDING_DTYPE)
+    if not (isinstance(b, np.ndarray) and b.dtype == EMBEDDING_DTYPE):
+        b = np.asarray(b, dtype=EMBEDDING_DTYPE)
+
+    if simsimd is not None:
+        return float(simsimd.cosine(a, b))
+
+    # Three dot products are cheaper than dot + two np.linalg.norm calls
+    denominator = math.sqrt(float(a @ a) * float(b @ b))
+    if denominator == 0.0:
+        return float("nan")  # Undefined for a zero-norm vector
+    return 1.0 - float(a @ b) / denominator
+
+
+def compact_normalized(embeddings: np.ndarray) -> np.ndarray:
+    """Return an L2-normalized copy stored as COMPACT_EMBEDDING_DTYPE.
+
+    Normalization happens at float32 precision before narrowing.
+
+    Args:
+        embeddings: Single embedding vector or matrix of embedding vectors
+
+    Returns:
+        Normalized array with the same shape for cosine_distances_prenormed()
+    """
+    normalized = normalize_rows(np.asarray(embeddings, dtype=EMBEDDING_DTYPE))
+    return normalized.astype(COMPACT_EMBEDDING_DTYPE, copy=False)
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """Return an L2-normalized copy of a vector or matrix (one vector per row).
+
+    Zero-norm rows are left as zeros.
+
+    Args:
+        embeddings: Single embedding vector or matrix of embedding vectors
+
+    Returns:
+        Normalized array with the same shape
+    """
+    embeddings = np.asarray(embeddings)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def cosine_distances_prenormed(
+    embedding_norm: np.ndarray, embeddings_norm: np.ndarray
+) -> np.ndarray:
+    """Calculate cosine distances from one normalized embedding to many.
+
+    Use with normalize_rows() to normalize a matrix once and query it repeatedly.
+
+    Args:
+        embedding_norm: Single L2-normalized embedding vector
+        embeddings_norm: Matrix of L2-normalized embedding vectors (one per row)
+
+    Returns:
+        Array of cosine distances
+    """
+    if (
+        simsimd is not None
+        and embedding_norm.dtype == embeddings_norm.dtype
+        and embeddings_norm.dtype in (EMBEDDING_DTYPE, COMPACT_EMBEDDING_DTYPE)
+    ):
+        return np.asarray(
+            simsimd.cdist(embedding_norm[None], embeddings_norm, metric="cosine"),
+            dtype=EMBEDDING_DTYPE,
+        ).ravel()
+
+    return 1.0 - embeddings_norm @ embedding_norm
 
 
 def cosine_distances(embedding: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
@@ -156,21 +321,15 @@ def cosine_distances(embedding: np.ndarray, embeddings: np.ndarray) -> np.ndarra
     Returns:
         Array of cosine distances
     """
-    embedding = np.asarray(embedding)
-    embeddings = np.asarray(embeddings)
+    embedding = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
+    embeddings = np.asarray(embeddings, dtype=EMBEDDING_DTYPE)
 
     if len(embeddings.shape) == 1:
         embeddings = embeddings.reshape(1, -1)
 
-    # Normalize
-    embedding_norm = embedding / np.linalg.norm(embedding)
-    embeddings_norms = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
-
-    # Cosine similarity
-    similarities = np.dot(embeddings_norms, embedding_norm)
-
-    # Convert to distance
-    return 1.0 - similarities
+    return cosine_distances_prenormed(
+        normalize_rows(embedding), normalize_rows(embeddings)
+    )
 
 
 def weighted_mean_embedding(
@@ -185,13 +344,13 @@ def weighted_mean_embedding(
     Returns:
         Weighted mean embedding vector
     """
-    embeddings_arr = np.array(embeddings)
+    embeddings_arr = np.asarray(embeddings, dtype=EMBEDDING_DTYPE)
 
     if weights is None:
-        mean = np.mean(embeddings_arr, axis=0)
+        mean = embeddings_arr.mean(axis=0)
     else:
-        weights_arr = np.array(weights)
-        weights_arr = weights_arr / weights_arr.sum()  # Normalize
-        mean = np.average(embeddings_arr, axis=0, weights=weights_arr)
+        # Single weighted reduction over rows; normalize the result, not the weights
+        weights_arr = np.asarray(weights, dtype=EMBEDDING_DTYPE)
+        mean = (weights_arr @ embeddings_arr) / weights_arr.sum()
 
     return mean.tolist()
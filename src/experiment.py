@@ -1,9 +1,16 @@
 """Main experiment orchestration."""
 
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
-from .checkpoint import save_checkpoint, load_checkpoint, load_participants
+from .checkpoint import (
+    save_checkpoint,
+    load_checkpoint,
+    load_participants,
+    flush_checkpoints,
+)
 from .config import setup_output_directory
 from .personas import prepare_personas
 from .participants import Participant, create_participants
@@ -21,6 +28,96 @@ from .phases import (
 
 logger = logging.getLogger(__name__)
 
+_PHASE_RULE = "=" * 50
+
+
+def _log_phase_header(title: str) -> None:
+    """Log a phase banner as a single record."""
+    logger.info(f"{_PHASE_RULE}\n{title}\n{_PHASE_RULE}")
+
+
+@dataclass
+class _RunState:
+    """Mutable experiment state threaded through the phase runners."""
+
+    participants: list[Participant]
+    clusters: list = field(default_factory=list)
+    clusters_by_option: dict = field(default_factory=dict)
+
+
+class _EarlyTermination(Exception):
+    """Raised by a phase runner to stop the experiment after that phase."""
+
+    def __init__(self, result: dict, reason: str):
+        super().__init__(reason)
+        self.result = result
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """One entry of the phase dispatch table.
+
+    Attributes:
+        num: Phase number (also the checkpoint's last_completed_phase)
+        name: Title shown in the phase banner
+        run: Runner taking (state, config) and returning the phase result
+        recomputable: True if the phase only reads state, so its checkpoint
+            is skipped unless 'aggressive_checkpointing' is set
+    """
+
+    num: int
+    name: str
+    run: Callable[[_RunState, dict], dict]
+    recomputable: bool = False
+
+
+def _run_threshold_check(state: _RunState, config: dict) -> dict:
+    result = phase2_threshold_check.run(state.participants, config)
+    if not result["continue"]:
+        raise _EarlyTermination(
+            result,
+            f"Option '{result['termination_option']}' exceeded "
+            f"{result['threshold']:.0%} threshold",
+        )
+    return result
+
+
+def _run_summaries(state: _RunState, config: dict) -> dict:
+    result = phase4_summaries.run(state.participants, config)
+    state.clusters = result.get("clusters", [])
+    state.clusters_by_option = result.get("clusters_by_option", {})
+    return result
+
+
+def _run_opposition(state: _RunState, config: dict) -> dict:
+    # Pass clusters_by_option to opposition selection via config
+    config_with_clusters = config.copy()
+    config_with_clusters["_clusters_by_option"] = state.clusters_by_option
+    return phase5_opposition.run(state.participants, config_with_clusters)
+
+
+def _run_cross_pollination(state: _RunState, config: dict) -> dict:
+    return phase6_cross_pollination.run(
+        state.participants, config, clusters_by_option=state.clusters_by_option
+    )
+
+
+# Phases 1-8 in execution order. Phase 9 (save results) always runs last.
+PHASES: list[PhaseSpec] = [
+    PhaseSpec(1, "Initial Vote", lambda s, c: phase1_initial_vote.run(s.participants, c)),
+    PhaseSpec(2, "Threshold Check", _run_threshold_check, recomputable=True),
+    PhaseSpec(3, "Clarification", lambda s, c: phase3_clarification.run(s.participants, c)),
+    PhaseSpec(4, "Generate Summaries (Clustering)", _run_summaries),
+    PhaseSpec(5, "Opposition Selection", _run_opposition),
+    PhaseSpec(6, "Cross-Pollination", _run_cross_pollination),
+    PhaseSpec(7, "ACP Adversarial Dialogue", lambda s, c: phase7_acp.run(s.participants, c)),
+    PhaseSpec(
+        8, "Final Vote", lambda s, c: phase8_final_vote.run(s.participants, c),
+        recomputable=True,
+    ),
+]
+
 
 def run_experiment(
     config: dict,
@@ -32,7 +129,8 @@ def run_experiment(
     Args:
         config: Validated experiment config
         resume: If True, resume from last checkpoint
-        output_dir: Output directory (required if resume=True)
+        output_dir: Output directory (required if resume=True). For a new
+            run, an already created directory; created here if None.
 
     Returns:
         Dict with experiment results and statistics
@@ -85,7 +183,8 @@ def run_experiment(
         logger.info(f"Starting experiment: {pilot_id}")
 
         # Setup output directory
-        output_dir = setup_output_directory(config)
+        if output_dir is None:
+            output_dir = setup_output_directory(config)
         logger.info(f"Output directory: {output_dir}")
 
         # Prepare personas
@@ -98,155 +197,79 @@ def run_experiment(
         participants = create_participants(personas, config, seed)
         logger.info(f"Created {len(participants)} participants across 4 conditions")
 
+    state = _RunState(participants, clusters, clusters_by_option)
     results = {
         "pilot_id": pilot_id,
         "output_dir": output_dir,
         "phases": {},
     }
 
-    # Phase 1: Initial Vote
-    if start_phase <= 1:
-        logger.info("=" * 50)
-        logger.info("PHASE 1: Initial Vote")
-        logger.info("=" * 50)
-        results["phases"][1] = phase1_initial_vote.run(participants, config)
-        save_checkpoint(output_dir, 1, participants)
-
-    # Phase 2: Threshold Check
-    if start_phase <= 2:
-        logger.info("=" * 50)
-        logger.info("PHASE 2: Threshold Check")
-        logger.info("=" * 50)
-        phase2_result = phase2_threshold_check.run(participants, config)
-        results["phases"][2] = phase2_result
-
-        if not phase2_result["continue"]:
-            logger.warning("Experiment terminated early due to consensus")
-            results["terminated_early"] = True
-            results["termination_reason"] = (
-                f"Option '{phase2_result['termination_option']}' exceeded "
-                f"{phase2_result['threshold']:.0%} threshold"
-            )
-            # Save results and exit
-            results["phases"][9] = phase9_save.run(
-                participants,
-                config,
-                output_dir,
-                clusters=clusters,
-                terminated_early=True,
-                termination_reason=results["termination_reason"],
-            )
-            save_checkpoint(
-                output_dir, 9, participants,
-                terminated_early=True,
-                termination_reason=results["termination_reason"],
-            )
-            return results
-
-        save_checkpoint(output_dir, 2, participants)
-
-    # Phase 3: Clarification
-    if start_phase <= 3:
-        logger.info("=" * 50)
-        logger.info("PHASE 3: Clarification")
-        logger.info("=" * 50)
-        results["phases"][3] = phase3_clarification.run(participants, config)
-        save_checkpoint(output_dir, 3, participants)
-
-    # Phase 4: Generate Summaries (with clustering)
-    if start_phase <= 4:
-        logger.info("=" * 50)
-        logger.info("PHASE 4: Generate Summaries (Clustering)")
-        logger.info("=" * 50)
-        phase4_result = phase4_summaries.run(participants, config)
-        results["phases"][4] = phase4_result
-        clusters = phase4_result.get("clusters", [])
-        clusters_by_option = phase4_result.get("clusters_by_option", {})
-        # Save clusters in checkpoint for resume support
-        save_checkpoint(
-            output_dir, 4, participants,
-            clusters=clusters,
-            clusters_by_option=clusters_by_option,
-        )
+    for spec in PHASES:
+        if spec.num < start_phase:
+            continue
 
-    # Phase 5: Opposition Selection
-    if start_phase <= 5:
-        logger.info("=" * 50)
-        logger.info("PHASE 5: Opposition Selection")
-        logger.info("=" * 50)
-        # Pass clusters_by_option to opposition selection via config
-        config_with_clusters = config.copy()
-        config_with_clusters["_clusters_by_option"] = clusters_by_option
-        results["phases"][5] = phase5_opposition.run(
-            participants, config_with_clusters
-        )
-        save_checkpoint(
-            output_dir, 5, participants,
-            clusters=clusters,
-            clusters_by_option=clusters_by_option,
-        )
+        _log_phase_header(f"PHASE {spec.num}: {spec.name}")
+        try:
+            results["phases"][spec.num] = spec.run(state, config)
+        except _EarlyTermination as e:
+            results["phases"][spec.num] = e.result
+            return _finish_early(state, config, output_dir, results, e.reason)
 
-    # Phase 6: Cross-Pollination
-    if start_phase <= 6:
-        logger.info("=" * 50)
-        logger.info("PHASE 6: Cross-Pollination")
-        logger.info("=" * 50)
-        results["phases"][6] = phase6_cross_pollination.run(
-            participants, config, clusters_by_option=clusters_by_option
-        )
-        save_checkpoint(
-            output_dir, 6, participants,
-            clusters=clusters,
-            clusters_by_option=clusters_by_option,
-        )
+        # Pure phases are recomputed on resume instead of checkpointed
+        if spec.recomputable and not config.get("aggressive_checkpointing", False):
+            continue
 
-    # Phase 7: ACP Adversarial Dialogue
-    if start_phase <= 7:
-        logger.info("=" * 50)
-        logger.info("PHASE 7: ACP Adversarial Dialogue")
-        logger.info("=" * 50)
-        results["phases"][7] = phase7_acp.run(participants, config)
         save_checkpoint(
-            output_dir, 7, participants,
-            clusters=clusters,
-            clusters_by_option=clusters_by_option,
-        )
-
-    # Phase 8: Final Vote (statistics)
-    if start_phase <= 8:
-        logger.info("=" * 50)
-        logger.info("PHASE 8: Final Vote")
-        logger.info("=" * 50)
-        results["phases"][8] = phase8_final_vote.run(participants, config)
-        save_checkpoint(
-            output_dir, 8, participants,
-            clusters=clusters,
-            clusters_by_option=clusters_by_option,
+            output_dir, spec.num, state.participants, pilot_id=pilot_id,
+            clusters=state.clusters,
+            clusters_by_option=state.clusters_by_option,
         )
 
     # Phase 9: Save Results
-    logger.info("=" * 50)
-    logger.info("PHASE 9: Save Results")
-    logger.info("=" * 50)
+    _log_phase_header("PHASE 9: Save Results")
     results["phases"][9] = phase9_save.run(
-        participants,
+        state.participants,
         config,
         output_dir,
-        clusters=clusters,
+        clusters=state.clusters,
         terminated_early=False,
         termination_reason=None,
     )
     save_checkpoint(
-        output_dir, 9, participants,
-        clusters=clusters,
-        clusters_by_option=clusters_by_option,
+        output_dir, 9, state.participants, pilot_id=pilot_id,
+        clusters=state.clusters,
+        clusters_by_option=state.clusters_by_option,
     )
+    flush_checkpoints()
 
     results["terminated_early"] = False
     results["termination_reason"] = None
 
-    logger.info("=" * 50)
-    logger.info("EXPERIMENT COMPLETE")
-    logger.info("=" * 50)
+    _log_phase_header("EXPERIMENT COMPLETE")
+
+    return results
+
+
+def _finish_early(
+    state: _RunState, config: dict, output_dir: str, results: dict, reason: str
+) -> dict:
+    """Save results and the final checkpoint for an early-terminated run."""
+    logger.warning("Experiment terminated early due to consensus")
+    results["terminated_early"] = True
+    results["termination_reason"] = reason
 
+    results["phases"][9] = phase9_save.run(
+        state.participants,
+        config,
+        output_dir,
+        clusters=state.clusters,
+        terminated_early=True,
+        termination_reason=reason,
+    )
+    save_checkpoint(
+        output_dir, 9, state.participants, pilot_id=config["pilot_id"],
+        terminated_early=True,
+        termination_reason=reason,
+    )
+    flush_checkpoints()
     return results
@@ -1,11 +1,25 @@
 """LLM API wrapper with throttling and retry logic."""
 
+import asyncio
+import contextlib
+import contextvars
+import hashlib
 import logging
 import os
 import re
+import threading
 import time
 
-from openai import OpenAI, RateLimitError
+import httpx
+from openai import AsyncOpenAI, OpenAI, RateLimitError
+
+from . import llm_cache
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:  # Fall back to HTTP/1.1 keep-alive if h2 is unavailable
+    _HTTP2 = False
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +28,123 @@ _API_KEY_ENV_VARS = {
     "openai": "OPENAI_API_KEY",
     "maria": "MARIA_API_KEY",
 }
+API_KEY_NAMES = list(_API_KEY_ENV_VARS)
+
+# Keep connections warm across dialogue turns instead of re-handshaking TLS
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=64, keepalive_expiry=60
+)
+_HTTP_TIMEOUT = httpx.Timeout(connect=5, read=120, write=10, pool=5)
+
+# Rate limit wait hints embedded in error messages
+_RE_RETRY_AFTER = re.compile(r"retry after (\d+(?:\.\d+)?)\s*(?:seconds?)?", re.IGNORECASE)
+_RE_TRY_AGAIN_MS = re.compile(r"try again in (\d+(?:\.\d+)?)\s*ms", re.IGNORECASE)
+_RE_TRY_AGAIN_S = re.compile(r"try again in (\d+(?:\.\d+)?)\s*s(?:econds?)?", re.IGNORECASE)
 
 _api_key = None
 _client = None
 
+# AsyncOpenAI client of the enclosing async_client_session(), if any
+_async_client: contextvars.ContextVar[AsyncOpenAI | None] = contextvars.ContextVar(
+    "async_client", default=None
+)
+
+
+# Default provider budget (OpenAI gpt-4o, usage tier 1)
+DEFAULT_RPM = 500
+DEFAULT_TPM = 30000
+
+# AIMD tuning: halve the budget on a 429, recover 5% per successful call
+_AIMD_DECREASE = 0.5
+_AIMD_INCREASE = 0.05
+_AIMD_MIN_SCALE = 0.05
+
+
+class TokenBucket:
+    """Shared requests-per-minute and tokens-per-minute rate limiter.
+
+    Both budgets refill continuously from a monotonic clock, so callers only
+    block when a bucket is actually empty. Token cost is not known until the
+    response arrives, so acquire() reserves an estimate and settle() charges
+    the difference once usage is reported. Rate limit errors shrink the
+    effective budget multiplicatively; successes grow it back additively.
+    """
+
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._scale = 1.0
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        rpm = self.rpm * self._scale
+        tpm = self.tpm * self._scale
+        self._requests = min(rpm, self._requests + elapsed * rpm / 60)
+        self._tokens = min(tpm, self._tokens + elapsed * tpm / 60)
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and `tokens` tokens, or return seconds to wait."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Never ask for more than the bucket can ever hold
+            tokens = min(tokens, self.tpm * self._scale)
+            if self._requests >= 1 and self._tokens >= tokens:
+                self._requests -= 1
+                self._tokens -= tokens
+                return 0.0
+            request_wait = max(0.0, 1 - self._requests) * 60 / (self.rpm * self._scale)
+            token_wait = max(0.0, tokens - self._tokens) * 60 / (self.tpm * self._scale)
+            return max(request_wait, token_wait)
+
+    def acquire(self, tokens: int) -> None:
+        """Block until a request carrying an estimated `tokens` may be sent."""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int) -> None:
+        """Async version of acquire() that yields to other coroutines while waiting."""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def settle(self, estimated: int, actual: int | None) -> None:
+        """Charge the gap between the reserved estimate and reported usage."""
+        with self._lock:
+            if actual is not None:
+                self._tokens -= actual - estimated
+            self._scale = min(1.0, self._scale + _AIMD_INCREASE)
+
+    def on_rate_limit(self) -> None:
+        """Shrink the effective budget after the provider rejected a request."""
+        with self._lock:
+            self._scale = max(_AIMD_MIN_SCALE, self._scale * _AIMD_DECREASE)
+            self._requests = min(self._requests, self.rpm * self._scale)
+            self._tokens = min(self._tokens, self.tpm * self._scale)
+        logger.info(f"Rate limit budget reduced to {self._scale:.0%} of configured")
+
+
+_rate_limiters: dict[tuple[float, float], TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _get_rate_limiter(config: dict) -> TokenBucket:
+    """Get the process-wide TokenBucket for the configured rpm/tpm budget."""
+    key = (config.get("rpm", DEFAULT_RPM), config.get("tpm", DEFAULT_TPM))
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = TokenBucket(*key)
+        return _rate_limiters[key]
+
+
+def _estimate_tokens(messages: list[dict]) -> int:
+    """Rough prompt-plus-reply token estimate (~4 characters per token)."""
+    chars = sum(len(m.get("content") or "") for m in messages)
+    return chars // 4 + 4 * len(messages) + 256
+
 
 def set_api_key(key_name: str) -> None:
     """Set which API key to use.
@@ -32,7 +159,7 @@ def set_api_key(key_name: str) -> None:
 
     key_name_lower = key_name.lower()
     if key_name_lower not in _API_KEY_ENV_VARS:
-        raise ValueError(f"Unknown API key: {key_name}. Must be one of: {list(_API_KEY_ENV_VARS.keys())}")
+        raise ValueError(f"Unknown API key: {key_name}. Must be one of: {API_KEY_NAMES}")
 
     env_var = _API_KEY_ENV_VARS[key_name_lower]
     _api_key = os.environ.get(env_var)
@@ -40,7 +167,7 @@ def set_api_key(key_name: str) -> None:
     if not _api_key:
         raise ValueError(f"Environment variable {env_var} is not set")
 
-    # Reset client so it gets recreated with new key
+    # Reset clients so they get recreated with new key
     _client = None
     logger.info(f"Using API key: {key_name}")
 
@@ -51,10 +178,52 @@ def _get_client() -> OpenAI:
     if _client is None:
         if _api_key is None:
             set_api_key("openai")  # Default to openai if not set
-        _client = OpenAI(api_key=_api_key)
+        _client = OpenAI(
+            api_key=_api_key,
+            http_client=httpx.Client(
+                http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            ),
+        )
     return _client
 
 
+@contextlib.asynccontextmanager
+async def async_client_session():
+    """Share one AsyncOpenAI client among the async calls made inside.
+
+    The client's connection pool is bound to the running event loop, so each
+    coroutine passed to asyncio.run() that makes async LLM calls should open
+    a session; the client is closed when the session exits. Tasks created
+    inside the session (e.g. by asyncio.gather) inherit its client.
+
+    Yields:
+        The session's AsyncOpenAI client
+    """
+    async with _new_async_client() as client:
+        token = _async_client.set(client)
+        try:
+            yield client
+        finally:
+            _async_client.reset(token)
+
+
+def _new_async_client() -> AsyncOpenAI:
+    """Create an AsyncOpenAI client for a single event loop.
+
+    Not cached like _get_client(): the underlying connection pool is bound to
+    the event loop it was created in, and each asyncio.run() uses a new loop.
+    Callers close it with 'async with' (see async_client_session()).
+    """
+    if _api_key is None:
+        set_api_key("openai")  # Default to openai if not set
+    return AsyncOpenAI(
+        api_key=_api_key,
+        http_client=httpx.AsyncClient(
+            http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+        ),
+    )
+
+
 def _parse_retry_after(error: RateLimitError) -> float | None:
     """Parse wait time from rate limit error.
 
@@ -77,17 +246,17 @@ def _parse_retry_after(error: RateLimitError) -> float | None:
 
     # Try to parse from error message (e.g., "Please retry after 20 seconds")
     error_str = str(error)
-    match = re.search(r"retry after (\d+(?:\.\d+)?)\s*(?:seconds?)?", error_str, re.IGNORECASE)
+    match = _RE_RETRY_AFTER.search(error_str)
     if match:
         return float(match.group(1))
 
     # Try to parse "Please try again in Xms" format
-    match = re.search(r"try again in (\d+(?:\.\d+)?)\s*ms", error_str, re.IGNORECASE)
+    match = _RE_TRY_AGAIN_MS.search(error_str)
     if match:
         return float(match.group(1)) / 1000.0
 
     # Try to parse "Please try again in Xs" format
-    match = re.search(r"try again in (\d+(?:\.\d+)?)\s*s(?:econds?)?", error_str, re.IGNORECASE)
+    match = _RE_TRY_AGAIN_S.search(error_str)
     if match:
         return float(match.group(1))
 
@@ -107,71 +276,316 @@ def _is_quota_exceeded(error: RateLimitError) -> bool:
     return "insufficient_quota" in error_str or "quota" in error_str
 
 
-def call_llm(messages: list[dict], config: dict) -> str | None:
+def _rate_limit_wait(
+    error: RateLimitError,
+    attempt: int,
+    max_retries: int,
+    base_wait: float,
+    quota_wait: float,
+) -> float | None:
+    """Decide how long to wait before retrying after a rate limit error.
+
+    Quota exceeded errors are retried once after quota_wait. Regular rate limits
+    use the Retry-After hint if present, otherwise exponential backoff.
+
+    Args:
+        error: The RateLimitError from OpenAI
+        attempt: Zero-based attempt number that just failed
+        max_retries: Maximum retry attempts
+        base_wait: Base wait time for exponential backoff
+        quota_wait: Wait time for quota exceeded errors
+
+    Returns:
+        Seconds to wait before retrying, or None to give up
+    """
+    if _is_quota_exceeded(error):
+        # Quota exceeded: retry once with longer wait
+        if attempt == 0:
+            logger.warning(
+                f"Quota exceeded. Waiting {quota_wait}s before retry "
+                f"(attempt {attempt + 1}/{max_retries})"
+            )
+            return quota_wait
+        logger.error(
+            f"Quota exceeded after retry. Check billing at "
+            "https://platform.openai.com/account/billing"
+        )
+        return None
+
+    # Regular rate limit: exponential backoff with Retry-After
+    if attempt < max_retries - 1:
+        parsed_wait = _parse_retry_after(error)
+        wait_time = parsed_wait if parsed_wait else (base_wait * (2 ** attempt))
+
+        logger.warning(
+            f"Rate limited. Waiting {wait_time:.1f}s "
+            f"(attempt {attempt + 1}/{max_retries})"
+        )
+        return wait_time
+
+    logger.error(f"Max retries exceeded after rate limiting: {error}")
+    return None
+
+
+def prompt_cache_key(system_prompt: str) -> str:
+    """Stable key grouping requests that share a system prompt for prompt caching.
+
+    Args:
+        system_prompt: The fixed system prompt prefix
+
+    Returns:
+        Short hex digest of the prompt
+    """
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:32]
+
+
+def _completion_kwargs(
+    prompt_cache_key: str | None, response_format: dict | None = None
+) -> dict:
+    """Extra chat completion arguments for optional request features."""
+    kwargs = {}
+    if prompt_cache_key is not None:
+        kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+    return kwargs
+
+
+def call_llm(
+    messages: list[dict],
+    config: dict,
+    prompt_cache_key: str | None = None,
+    response_format: dict | None = None,
+) -> str | None:
     """Make an OpenAI API call with throttling and retry logic.
 
-    Handles rate limit errors with exponential backoff and Retry-After header parsing.
-    For quota exceeded errors, retries once with a 60s wait before failing.
+    Calls are throttled by a shared TokenBucket sized by 'rpm' and 'tpm', which
+    only blocks when the budget is exhausted. Handles rate limit errors with
+    exponential backoff and Retry-After header parsing. For quota exceeded
+    errors, retries once with a 60s wait before failing.
+
+    With 'llm_cache: true', responses are memoized on disk by model and
+    messages, so identical requests (e.g. after --resume) skip the API.
 
     Args:
         messages: List of message dicts with 'role' and 'content' keys
-        config: Config dict containing 'model', 'api_sleep_seconds', 'max_api_retries',
+        config: Config dict containing 'model', 'rpm', 'tpm', 'max_api_retries',
                 and 'api_retry_base_seconds'
+        prompt_cache_key: Optional key routing requests with a shared prompt
+                prefix to the same server-side prompt cache
+        response_format: Optional chat completion response format, e.g.
+                {"type": "json_object"} for JSON mode
 
     Returns:
         Response content string, or None if the call failed
     """
     client = _get_client()
     model = config.get("model", "gpt-4o")
-    sleep_seconds = config.get("api_sleep_seconds", 3)
+    use_cache = config.get("llm_cache", False)
+    if use_cache:
+        cached = llm_cache.get_cached(
+            model, messages, response_format=response_format
+        )
+        if cached is not None:
+            return cached
+
+    limiter = _get_rate_limiter(config)
+    estimated = _estimate_tokens(messages)
     max_retries = config.get("max_api_retries", 5)
     base_wait = config.get("api_retry_base_seconds", 2)
     quota_wait = 60  # Wait time for quota exceeded errors
 
     for attempt in range(max_retries):
+        limiter.acquire(estimated)
         try:
             response = client.chat.completions.create(
                 model=model,
                 messages=messages,
+                **_completion_kwargs(prompt_cache_key, response_format),
             )
+            usage = getattr(response, "usage", None)
+            limiter.settle(estimated, usage.total_tokens if usage else None)
             content = response.choices[0].message.content
+            if use_cache and content is not None:
+                llm_cache.put_cached(
+                    model, messages, content, response_format=response_format
+                )
+            return content
 
-            # Throttle after successful call
-            time.sleep(sleep_seconds)
+        except RateLimitError as e:
+            limiter.on_rate_limit()
+            wait_time = _rate_limit_wait(e, attempt, max_retries, base_wait, quota_wait)
+            if wait_time is None:
+                return None
+            time.sleep(wait_time)
 
-            return content
+        except Exception as e:
+            logger.error(f"LLM API call failed: {e}")
+            return None
+
+    return None
+
+
+async def call_llm_async(
+    messages: list[dict],
+    config: dict,
+    prompt_cache_key: str | None = None,
+    response_format: dict | None = None,
+) -> str | None:
+    """Async variant of call_llm() for running many conversations concurrently.
+
+    Same throttling, retry and caching behavior as call_llm(), but waits with
+    asyncio.sleep so other coroutines keep running.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content' keys
+        config: Config dict (see call_llm)
+        prompt_cache_key: Optional prompt cache routing key (see call_llm)
+        response_format: Optional response format (see call_llm)
+
+    Returns:
+        Response content string, or None if the call failed
+    """
+    client = _async_client.get()
+    if client is None:  # Not inside a session: use a client for this call only
+        async with async_client_session():
+            return await call_llm_async(
+                messages, config, prompt_cache_key, response_format
+            )
+    model = config.get("model", "gpt-4o")
+    use_cache = config.get("llm_cache", False)
+    if use_cache:
+        cached = llm_cache.get_cached(
+            model, messages, response_format=response_format
+        )
+        if cached is not None:
+            return cached
+
+    response = await _request_with_retries_async(
+        lambda: client.chat.completions.create(
+            model=model,
+            messages=messages,
+            **_completion_kwargs(prompt_cache_key, response_format),
+        ),
+        _estimate_tokens(messages),
+        config,
+    )
+    if response is None:
+        return None
+    content = response.choices[0].message.content
+    if use_cache and content is not None:
+        llm_cache.put_cached(
+            model, messages, content, response_format=response_format
+        )
+    return content
+
+
+def call_llm_batch(
+    messages_list: list[list[dict]], config: dict, max_concurrency: int = 16
+) -> list[str | None]:
+    """Run many independent chat completions as one concurrent batch.
+
+    All requests share one async client, so they are multiplexed over the
+    same pooled (HTTP/2 when available) connections instead of paying
+    connection setup per prompt. Throttling, retries and caching are those
+    of call_llm_async().
+
+    Args:
+        messages_list: One messages list per request
+        config: Config dict (see call_llm)
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Response content strings (None for failed calls), aligned with
+        messages_list
+    """
+    if not messages_list:
+        return []
+
+    async def run_all() -> list[str | None]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(messages: list[dict]) -> str | None:
+            async with semaphore:
+                return await call_llm_async(messages, config)
+
+        async with async_client_session():
+            return await asyncio.gather(*(run_one(m) for m in messages_list))
+
+    return asyncio.run(run_all())
+
+
+async def call_responses_async(
+    input_messages: list[dict],
+    config: dict,
+    previous_response_id: str | None = None,
+    prompt_cache_key: str | None = None,
+) -> tuple[str, str] | None:
+    """Make a Responses API call that continues server-side conversation state.
+
+    Only the messages added since previous_response_id need to be sent; the
+    earlier turns (including the system prompt) are kept by the server.
+
+    Args:
+        input_messages: New message dicts with 'role' and 'content' keys
+        config: Config dict (see call_llm)
+        previous_response_id: ID of the response this turn continues, if any
+        prompt_cache_key: Optional prompt cache routing key (see call_llm)
+
+    Returns:
+        Tuple of (response text, response ID), or None if the call failed
+    """
+    client = _async_client.get()
+    if client is None:  # Not inside a session: use a client for this call only
+        async with async_client_session():
+            return await call_responses_async(
+                input_messages, config, previous_response_id, prompt_cache_key
+            )
+    model = config.get("model", "gpt-4o")
+
+    response = await _request_with_retries_async(
+        lambda: client.responses.create(
+            model=model,
+            input=input_messages,
+            previous_response_id=previous_response_id,
+            **_completion_kwargs(prompt_cache_key),
+        ),
+        _estimate_tokens(input_messages),
+        config,
+    )
+    return None if response is None else (response.output_text, response.id)
+
+
+async def _request_with_retries_async(create, estimated: int, config: dict):
+    """Await create() under the shared rate limiter, retrying on rate limits.
+
+    Args:
+        create: Zero-argument callable returning an awaitable API response
+        estimated: Estimated token cost reserved before each attempt
+        config: Config dict with 'max_api_retries' and 'api_retry_base_seconds'
+
+    Returns:
+        The API response, or None if the call failed
+    """
+    limiter = _get_rate_limiter(config)
+    max_retries = config.get("max_api_retries", 5)
+    base_wait = config.get("api_retry_base_seconds", 2)
+    quota_wait = 60  # Wait time for quota exceeded errors
+
+    for attempt in range(max_retries):
+        await limiter.acquire_async(estimated)
+        try:
+            response = await create()
+            usage = getattr(response, "usage", None)
+            limiter.settle(estimated, usage.total_tokens if usage else None)
+            return response
 
         except RateLimitError as e:
-            is_quota = _is_quota_exceeded(e)
-
-            if is_quota:
-                # Quota exceeded: retry once with longer wait
-                if attempt == 0:
-                    logger.warning(
-                        f"Quota exceeded. Waiting {quota_wait}s before retry "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(quota_wait)
-                else:
-                    logger.error(
-                        f"Quota exceeded after retry. Check billing at "
-                        "https://platform.openai.com/account/billing"
-                    )
-                    return None
-            else:
-                # Regular rate limit: exponential backoff with Retry-After
-                if attempt < max_retries - 1:
-                    parsed_wait = _parse_retry_after(e)
-                    wait_time = parsed_wait if parsed_wait else (base_wait * (2 ** attempt))
-
-                    logger.warning(
-                        f"Rate limited. Waiting {wait_time:.1f}s "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Max retries exceeded after rate limiting: {e}")
-                    return None
+            limiter.on_rate_limit()
+            wait_time = _rate_limit_wait(e, attempt, max_retries, base_wait, quota_wait)
+            if wait_time is None:
+                return None
+            await asyncio.sleep(wait_time)
 
         except Exception as e:
             logger.error(f"LLM API call failed: {e}")
@@ -0,0 +1,97 @@
+"""Content-addressed on-disk cache for chat completion responses.
+
+Responses are stored as UTF-8 text files under
+cache/llm/<model>/<sha256[:2]>/<sha256>.txt, keyed by model, messages and
+response format.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "cache" / "llm"
+
+
+def _key(
+    model: str, messages: list[dict], response_format: dict | None = None
+) -> str:
+    """Compute cache key for a (model, messages, response format) triple.
+
+    Requests without a response format keep the original (model, messages)
+    key, so existing entries stay valid.
+    """
+    payload = model + "\n" + json.dumps(messages, sort_keys=True, ensure_ascii=False)
+    if response_format is not None:
+        payload += "\n" + json.dumps(response_format, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _entry_path(
+    model: str,
+    messages: list[dict],
+    cache_dir: Path | None = None,
+    response_format: dict | None = None,
+) -> Path:
+    """Get the .txt path for a request."""
+    key = _key(model, messages, response_format)
+    return (cache_dir or DEFAULT_CACHE_DIR) / model / key[:2] / f"{key}.txt"
+
+
+def get_cached(
+    model: str,
+    messages: list[dict],
+    cache_dir: Path | None = None,
+    response_format: dict | None = None,
+) -> str | None:
+    """Look up a cached completion.
+
+    Args:
+        model: Chat model name
+        messages: Messages that were sent
+        cache_dir: Cache root directory. Uses default if None.
+        response_format: Response format that was requested, if any
+
+    Returns:
+        Response content, or None if not cached
+    """
+    path = _entry_path(model, messages, cache_dir, response_format)
+    if not path.exists():
+        return None
+
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring unreadable LLM cache entry {path}: {e}")
+        return None
+
+
+def put_cached(
+    model: str,
+    messages: list[dict],
+    content: str,
+    cache_dir: Path | None = None,
+    response_format: dict | None = None,
+) -> None:
+    """Store a completion in the cache.
+
+    Args:
+        model: Chat model name
+        messages: Messages that were sent
+        content: Response content
+        cache_dir: Cache root directory. Uses default if None.
+        response_format: Response format that was requested, if any
+    """
+    path = _entry_path(model, messages, cache_dir, response_format)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file and rename so concurrent readers never see partial
+    # data; the name is per process and thread, since thread pools may store
+    # the same key at once
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
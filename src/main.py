@@ -1,22 +1,35 @@
 """Main entry point for the LLM-Mediated Deliberation Experiment."""
 
 import argparse
+import io
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from .checkpoint import checkpoint_exists, save_checkpoint, load_participants
-from .config import load_config, get_output_directory
+from .checkpoint import (
+    checkpoint_exists, flush_checkpoints, save_checkpoint, load_participants
+)
+from .config import load_config, get_output_directory, setup_output_directory
 from .experiment import run_experiment
-from .llm import set_api_key
+from .llm import API_KEY_NAMES, set_api_key
 
 
-def setup_logging(output_dir: str | None = None) -> None:
+def setup_logging(output_dir: str | None = None) -> QueueListener | None:
     """Configure logging to console and optionally to file.
 
+    The console handler is installed once. File records go through a
+    QueueHandler to a background QueueListener, so phases never block on
+    log file writes.
+
     Args:
         output_dir: If provided, also log to file in this directory
+
+    Returns:
+        The started QueueListener for the file log (stop it on exit to
+        flush remaining records), or None if output_dir is None
     """
     # Create formatter
     formatter = logging.Formatter(
@@ -24,38 +37,52 @@ def setup_logging(output_dir: str | None = None) -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
 
-    # File handler (if output_dir provided)
-    if output_dir:
-        log_path = Path(output_dir) / "experiment.log"
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+    # Console handler
+    if not any(getattr(h, "is_console", False) for h in root_logger.handlers):
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        console_handler.is_console = True
+        root_logger.addHandler(console_handler)
+
+    if not output_dir:
+        return None
+
+    # File handler, fed from a queue on a background thread
+    log_path = Path(output_dir) / "experiment.log"
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    return listener
 
 
 def print_summary(results: dict) -> None:
-    """Print experiment summary to console."""
-    print("\n" + "=" * 60)
-    print("EXPERIMENT SUMMARY")
-    print("=" * 60)
+    """Print experiment summary to console.
 
-    print(f"\nPilot ID: {results['pilot_id']}")
-    print(f"Output Directory: {results['output_dir']}")
+    The report is built in memory and written in one call so it is not
+    interleaved with log output.
+    """
+    out = io.StringIO()
+    print("\n" + "=" * 60, file=out)
+    print("EXPERIMENT SUMMARY", file=out)
+    print("=" * 60, file=out)
+
+    print(f"\nPilot ID: {results['pilot_id']}", file=out)
+    print(f"Output Directory: {results['output_dir']}", file=out)
 
     if results.get("terminated_early"):
-        print(f"\n⚠️  TERMINATED EARLY: {results['termination_reason']}")
+        print(f"\n⚠️  TERMINATED EARLY: {results['termination_reason']}", file=out)
 
-    print("\nPhase Results:")
+    print("\nPhase Results:", file=out)
     for phase_num, phase_result in sorted(results.get("phases", {}).items()):
         phase_name = {
             1: "Initial Vote",
@@ -68,20 +95,22 @@ def print_summary(results: dict) -> None:
             8: "Save Results",
         }.get(phase_num, f"Phase {phase_num}")
 
-        print(f"\n  Phase {phase_num}: {phase_name}")
+        print(f"\n  Phase {phase_num}: {phase_name}", file=out)
 
         if "completed" in phase_result:
-            print(f"    Completed: {phase_result['completed']}")
+            print(f"    Completed: {phase_result['completed']}", file=out)
         if "failed" in phase_result:
-            print(f"    Failed: {phase_result['failed']}")
+            print(f"    Failed: {phase_result['failed']}", file=out)
         if "position_changed" in phase_result and phase_result["position_changed"] is not None:
-            print(f"    Position Changed: {phase_result['position_changed']}")
+            print(f"    Position Changed: {phase_result['position_changed']}", file=out)
         if "vote_counts" in phase_result:
-            print("    Vote Distribution:")
+            print("    Vote Distribution:", file=out)
             for opt, count in phase_result["vote_counts"].items():
-                print(f"      - {opt}: {count}")
+                print(f"      - {opt}: {count}", file=out)
+
+    print("\n" + "=" * 60, file=out)
 
-    print("\n" + "=" * 60)
+    sys.stdout.write(out.getvalue())
 
 
 def main():
@@ -108,10 +137,10 @@ def main():
     )
     parser.add_argument(
         "--key",
-        type=str,
-        choices=["openai", "maria", "Maria"],
+        type=str.lower,
+        choices=API_KEY_NAMES,
         default="openai",
-        help="Which API key to use: openai, maria (default: openai)",
+        help=f"Which API key to use: {', '.join(API_KEY_NAMES)} (default: openai)",
     )
 
     args = parser.parse_args()
@@ -129,6 +158,7 @@ def main():
     # Track state for interrupt handling
     output_dir = None
     participants = None
+    log_listener = None
 
     try:
         # Load config
@@ -156,6 +186,12 @@ def main():
                     "Use --resume to continue from where you left off."
                 )
 
+            # Create the output directory up front so the file log covers the run
+            output_dir = setup_output_directory(config)
+
+        # Add file logging to output directory
+        log_listener = setup_logging(output_dir)
+
         # Run experiment
         start_time = datetime.now()
         if args.resume:
@@ -166,16 +202,13 @@ def main():
         results = run_experiment(
             config,
             resume=args.resume,
-            output_dir=output_dir if args.resume else None,
+            output_dir=output_dir,
         )
 
         end_time = datetime.now()
         duration = end_time - start_time
         logger.info(f"Experiment completed in {duration}")
 
-        # Add file logging to output directory
-        setup_logging(results["output_dir"])
-
         # Print summary
         print_summary(results)
 
@@ -192,6 +225,8 @@ def main():
         return 1
     except KeyboardInterrupt:
         logger.warning("Experiment interrupted by user")
+        # Let the background writer finish the last completed phase's checkpoint
+        flush_checkpoints()
         # Try to save a checkpoint on interrupt
         if output_dir and Path(output_dir).exists():
             participants = load_participants(output_dir)
@@ -206,6 +241,10 @@ def main():
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         return 1
+    finally:
+        # Drain queued records to experiment.log
+        if log_listener is not None:
+            log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,19 +1,122 @@
 """Moderator LLM logic for clarification and Socratic dialogue."""
 
+import asyncio
+import functools
 import logging
 
-from .llm import call_llm
+from .llm import (
+    async_client_session,
+    call_llm_async,
+    call_responses_async,
+    prompt_cache_key,
+)
 from .participants import Participant
-from .simulator import respond_to_question, respond_to_challenge
+from .simulator import respond_to_question_async, respond_to_challenge_async
 
 logger = logging.getLogger(__name__)
 
+# Reply the moderator sends (alone) to end a dialogue
+SATISFIED = "SATISFIED"
+
+
+@functools.lru_cache(maxsize=32)
+def _clarification_system_prompt(
+    description: str, options: tuple[str, ...], initial_choice: str
+) -> str:
+    """Build the clarification moderator prompt (shared by same-choice participants)."""
+    return f"""You are a neutral moderator helping understand a participant's position on the following topic:
+
+{description}
+
+Available options: {', '.join(options)}
+
+The participant chose "{initial_choice}".
+
+Ask clarifying questions to deeply understand their reasoning. Focus on:
+- The values and priorities driving their choice
+- How they weighed different considerations
+- Their understanding of alternatives
+
+Begin by asking them to explain why they made this choice. When you fully understand their position and the reasoning behind it, respond with exactly "SATISFIED" and nothing else."""
+
+
+@functools.lru_cache(maxsize=32)
+def _adversarial_system_prompt(
+    description: str,
+    options: tuple[str, ...],
+    initial_choice: str,
+    opposition_view: str,
+    cross_pollination_content: str | None,
+) -> str:
+    """Build the Socratic moderator prompt (shared by participants with equal inputs)."""
+    cross_poll_section = ""
+    if cross_pollination_content:
+        cross_poll_section = f"""
+Before this dialogue, the participant was shown the following summary of perspectives from all groups:
+
+{cross_pollination_content}
+
+"""
+
+    return f"""You are a moderator presenting an opposing viewpoint using Socratic questioning.
+
+Topic: {description}
+
+Available options: {', '.join(options)}
+
+The participant chose "{initial_choice}".
+{cross_poll_section}
+Your goal is to help the participant deeply engage with the counterarguments. Present the opposing view: "{opposition_view}".
+
+Challenge the participant's reasoning respectfully but firmly using Socratic questioning:
+- Ask probing questions that reveal assumptions
+- Present concrete scenarios where the opposing view might be better
+- Explore trade-offs they may not have considered
+- Push back on weak reasoning while acknowledging valid points
+- Reference arguments from other perspectives shown above when relevant
+
+When the participant has thoroughly engaged with the opposing arguments (shown genuine consideration, addressed key counterpoints), respond with exactly "SATISFIED" and nothing else."""
+
+
+async def _moderator_turn(
+    messages: list[dict], config: dict, cache_key: str, response_id: str | None
+) -> tuple[str | None, str | None]:
+    """Get the moderator's next message.
+
+    With config 'use_responses_api', the dialogue state lives server-side, so
+    after the first turn only the participant's latest reply is sent instead
+    of the whole message history.
+
+    Args:
+        messages: Full dialogue so far (system prompt first)
+        config: Experiment config
+        cache_key: Prompt cache key for the system prompt
+        response_id: ID of the previous moderator response, if any
+
+    Returns:
+        Tuple of (moderator message or None if failed, new response ID)
+    """
+    if not config.get("use_responses_api", False):
+        response = await call_llm_async(messages, config, prompt_cache_key=cache_key)
+        return response, None
+
+    new_messages = messages if response_id is None else messages[-1:]
+    result = await call_responses_async(
+        new_messages, config, previous_response_id=response_id,
+        prompt_cache_key=cache_key,
+    )
+    if result is None:
+        return None, None
+    return result
+
 
 def run_clarification(
     participant: Participant, topic: dict, config: dict
 ) -> list[dict] | None:
     """Run clarification Q&A between moderator and participant.
 
+    Synchronous wrapper around run_clarification_async().
+
     Args:
         participant: The participant to clarify
         topic: Topic dict with description and options
@@ -22,29 +125,45 @@ def run_clarification(
     Returns:
         Transcript as list of {role, content} dicts, or None if failed
     """
-    max_exchanges = config.get("max_clarification_exchanges", 5)
+    async def clarify() -> list[dict] | None:
+        async with async_client_session():
+            return await run_clarification_async(participant, topic, config)
 
-    system_prompt = f"""You are a neutral moderator helping understand a participant's position on the following topic:
+    return asyncio.run(clarify())
 
-{topic['description']}
 
-Available options: {', '.join(topic['options'])}
+async def run_clarification_async(
+    participant: Participant, topic: dict, config: dict
+) -> list[dict] | None:
+    """Run clarification Q&A between moderator and participant.
 
-The participant chose "{participant.initial_choice}".
+    Turns within a dialogue are sequential; run many participants' dialogues
+    concurrently with asyncio.gather.
 
-Ask clarifying questions to deeply understand their reasoning. Focus on:
-- The values and priorities driving their choice
-- How they weighed different considerations
-- Their understanding of alternatives
+    Args:
+        participant: The participant to clarify
+        topic: Topic dict with description and options
+        config: Experiment config
 
-Begin by asking them to explain why they made this choice. When you fully understand their position and the reasoning behind it, respond with exactly "SATISFIED" and nothing else."""
+    Returns:
+        Transcript as list of {role, content} dicts, or None if failed
+    """
+    max_exchanges = config.get("max_clarification_exchanges", 5)
+
+    system_prompt = _clarification_system_prompt(
+        topic["description"], tuple(topic["options"]), participant.initial_choice
+    )
+    cache_key = prompt_cache_key(system_prompt)
+    response_id = None
 
     transcript = []
     messages = [{"role": "system", "content": system_prompt}]
 
     for exchange in range(max_exchanges):
         # Get moderator's question
-        moderator_response = call_llm(messages, config)
+        moderator_response, response_id = await _moderator_turn(
+            messages, config, cache_key, response_id
+        )
         if moderator_response is None:
             logger.error(f"Moderator LLM failed for {participant.participant_id}")
             return None
@@ -52,7 +171,10 @@ Begin by asking them to explain why they made this choice. When you fully unders
         moderator_response = moderator_response.strip()
 
         # Check if satisfied
-        if moderator_response.upper() == "SATISFIED":
+        if (
+            len(moderator_response) == len(SATISFIED)
+            and moderator_response.upper() == SATISFIED
+        ):
             logger.info(
                 f"Clarification complete for {participant.participant_id} "
                 f"after {exchange} exchanges"
@@ -63,7 +185,7 @@ Begin by asking them to explain why they made this choice. When you fully unders
         messages.append({"role": "assistant", "content": moderator_response})
 
         # Get participant's response
-        participant_response = respond_to_question(
+        participant_response = await respond_to_question_async(
             participant, moderator_response, transcript, topic, config
         )
         if participant_response is None:
@@ -82,6 +204,8 @@ def run_adversarial_dialogue(
 ) -> list[dict] | None:
     """Run Socratic adversarial dialogue between moderator and participant.
 
+    Synchronous wrapper around run_adversarial_dialogue_async().
+
     Args:
         participant: The participant to challenge
         opposition_view: The opposing view/option to present
@@ -91,42 +215,89 @@ def run_adversarial_dialogue(
     Returns:
         Transcript as list of {role, content} dicts, or None if failed
     """
-    max_exchanges = config.get("max_socratic_exchanges", 5)
+    async def challenge() -> list[dict] | None:
+        async with async_client_session():
+            return await run_adversarial_dialogue_async(
+                participant, opposition_view, topic, config,
+                cross_pollination_content=cross_pollination_content,
+            )
 
-    cross_poll_section = ""
-    if cross_pollination_content:
-        cross_poll_section = f"""
-Before this dialogue, the participant was shown the following summary of perspectives from all groups:
+    return asyncio.run(challenge())
 
-{cross_pollination_content}
 
-"""
+def build_adversarial_prompt(
+    topic: dict,
+    initial_choice: str,
+    opposition_view: str,
+    cross_pollination_content: str | None = None,
+) -> str:
+    """Build the Socratic moderator system prompt.
+
+    Participants with the same initial choice, opposition view and
+    cross-pollination content share one prompt, so callers can build it
+    once per group and pass it to run_adversarial_dialogue_async().
+
+    Args:
+        topic: Topic dict with description and options
+        initial_choice: The participant's initial choice
+        opposition_view: The opposing view/option to present
+        cross_pollination_content: Optional cluster summaries shown before dialogue
 
-    system_prompt = f"""You are a moderator presenting an opposing viewpoint using Socratic questioning.
+    Returns:
+        System prompt string
+    """
+    return _adversarial_system_prompt(
+        topic["description"],
+        tuple(topic["options"]),
+        initial_choice,
+        opposition_view,
+        cross_pollination_content,
+    )
 
-Topic: {topic['description']}
 
-Available options: {', '.join(topic['options'])}
+async def run_adversarial_dialogue_async(
+    participant: Participant, opposition_view: str, topic: dict, config: dict,
+    cross_pollination_content: str | None = None,
+    system_prompt: str | None = None,
+    cache_key: str | None = None,
+) -> list[dict] | None:
+    """Run Socratic adversarial dialogue between moderator and participant.
 
-The participant chose "{participant.initial_choice}".
-{cross_poll_section}
-Your goal is to help the participant deeply engage with the counterarguments. Present the opposing view: "{opposition_view}".
+    Turns within a dialogue are sequential; run many participants' dialogues
+    concurrently with asyncio.gather.
 
-Challenge the participant's reasoning respectfully but firmly using Socratic questioning:
-- Ask probing questions that reveal assumptions
-- Present concrete scenarios where the opposing view might be better
-- Explore trade-offs they may not have considered
-- Push back on weak reasoning while acknowledging valid points
-- Reference arguments from other perspectives shown above when relevant
+    Args:
+        participant: The participant to challenge
+        opposition_view: The opposing view/option to present
+        topic: Topic dict with description and options
+        config: Experiment config
+        cross_pollination_content: Optional cluster summaries shown before dialogue
+        system_prompt: Prebuilt moderator prompt (see build_adversarial_prompt);
+            built here if None
+        cache_key: Prompt cache key; derived from the system prompt if None
 
-When the participant has thoroughly engaged with the opposing arguments (shown genuine consideration, addressed key counterpoints), respond with exactly "SATISFIED" and nothing else."""
+    Returns:
+        Transcript as list of {role, content} dicts, or None if failed
+    """
+    max_exchanges = config.get("max_socratic_exchanges", 5)
+
+    if system_prompt is None:
+        system_prompt = build_adversarial_prompt(
+            topic, participant.initial_choice, opposition_view,
+            cross_pollination_content,
+        )
+    if cache_key is None:
+        cache_key = prompt_cache_key(system_prompt)
+    response_id = None
 
     transcript = []
     messages = [{"role": "system", "content": system_prompt}]
 
     for exchange in range(max_exchanges):
         # Get moderator's challenge
-        moderator_response = call_llm(messages, config)
+        moderator_response, response_id = await _moderator_turn(
+            messages, config, cache_key, response_id
+        )
         if moderator_response is None:
             logger.error(
                 f"Moderator LLM failed in adversarial for {participant.participant_id}"
@@ -136,7 +307,10 @@ When the participant has thoroughly engaged with the opposing arguments (shown g
         moderator_response = moderator_response.strip()
 
         # Check if satisfied
-        if moderator_response.upper() == "SATISFIED":
+        if (
+            len(moderator_response) == len(SATISFIED)
+            and moderator_response.upper() == SATISFIED
+        ):
             logger.info(
                 f"Adversarial dialogue complete for {participant.participant_id} "
                 f"after {exchange} exchanges"
@@ -147,7 +321,7 @@ When the participant has thoroughly engaged with the opposing arguments (shown g
         messages.append({"role": "assistant", "content": moderator_response})
 
         # Get participant's response
-        participant_response = respond_to_challenge(
+        participant_response = await respond_to_challenge_async(
             participant, moderator_response, transcript, topic, config,
             cross_pollination_content=cross_pollination_content
         )
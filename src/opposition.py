@@ -5,16 +5,91 @@ To add a new strategy:
 2. Add it to the STRATEGIES dict at the bottom of this file
 """
 
+import hashlib
+import heapq
 import logging
+import random
 from collections import Counter
+from operator import itemgetter
 
 import numpy as np
 
+from .embedding_cache import cache_key
+from .embeddings import (
+    DEFAULT_MODEL,
+    EMBEDDING_DTYPE,
+    MAX_BATCH_SIZE,
+    compact_normalized,
+    cosine_distances_prenormed,
+    get_embeddings,
+)
+from . import semantic_cache
 from .llm import call_llm
-from .participants import Participant
+from .participants import Participant, count_votes, get_normalized_embedding
 
 logger = logging.getLogger(__name__)
 
+# Number of other participants' positions shown to the LLM judge
+LLM_JUDGE_SAMPLE_SIZE = 10
+
+# In-process explanation embeddings, keyed like the on-disk embedding cache
+# (sha256 of model and text) so a model change never reuses stale vectors
+_embed_cache: dict[str, np.ndarray] = {}
+
+
+def precompute_explanation_embeddings(
+    participants: list[Participant], config: dict
+) -> int:
+    """Embed every completed participant's explanation up front.
+
+    Texts not yet in memory are fetched through embeddings.get_embeddings,
+    which reads the persistent on-disk embedding cache before calling the
+    API in batched requests. The vectors of all completed participants with
+    an explanation are then stacked into one L2-normalized matrix
+    (COMPACT_EMBEDDING_DTYPE) stored on config['_explanation_matrix'], so
+    per-participant selection is a single matrix-vector product.
+
+    Args:
+        participants: All participants in the experiment
+        config: Experiment config (see embeddings.get_embeddings)
+
+    Returns:
+        Number of explanations newly embedded
+
+    Raises:
+        RuntimeError: If the embedding API fails after all retries
+    """
+    eligible = [
+        p for p in participants if p.status == "complete" and p.initial_explanation
+    ]
+    model = config.get("embedding_model", DEFAULT_MODEL)
+    keys = [cache_key(model, p.initial_explanation) for p in eligible]
+
+    pending = {
+        key: p.initial_explanation
+        for key, p in zip(keys, eligible)
+        if key not in _embed_cache
+    }
+    if pending:
+        logger.info(f"Embedding {len(pending)} explanations for opposition selection")
+        embeddings = get_embeddings(
+            list(pending.values()), config, batch_size=MAX_BATCH_SIZE
+        )
+        for key, emb in zip(pending, embeddings):
+            _embed_cache[key] = np.asarray(emb, dtype=EMBEDDING_DTYPE)
+
+    if eligible:
+        matrix = compact_normalized(np.vstack([_embed_cache[key] for key in keys]))
+    else:
+        matrix = np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+
+    config["_explanation_matrix"] = {
+        "matrix": matrix,
+        "participants": eligible,
+        "index_of": {p.participant_id: i for i, p in enumerate(eligible)},
+    }
+    return len(pending)
+
 
 def select_opposition(
     participant: Participant, all_participants: list[Participant], config: dict
@@ -40,6 +115,21 @@ def select_opposition(
     return STRATEGIES[method](participant, all_participants, config)
 
 
+def count_completed_votes(participants: list[Participant]) -> Counter:
+    """Count initial votes of completed participants.
+
+    Store the result on config['_vote_counts'] before selecting opposition
+    for many participants so highest_voted does not recount per call.
+
+    Args:
+        participants: All participants in the experiment
+
+    Returns:
+        Counter mapping option -> number of votes
+    """
+    return count_votes([p for p in participants if p.status == "complete"])
+
+
 def _highest_voted(
     participant: Participant, all_participants: list[Participant], config: dict
 ) -> str:
@@ -47,17 +137,14 @@ def _highest_voted(
 
     If participant chose the most popular option, uses second-most popular.
     """
-    # Count votes from completed participants
-    votes = Counter()
-    for p in all_participants:
-        if p.status == "complete" and p.initial_choice:
-            votes[p.initial_choice] += 1
-
-    # Get options sorted by vote count (descending)
-    sorted_options = votes.most_common()
-
-    # Find highest-voted option that's not the participant's choice
-    for option, count in sorted_options:
+    # Phase 5 counts votes once up front; count here when called standalone
+    votes = config.get("_vote_counts")
+    if votes is None:
+        votes = count_completed_votes(all_participants)
+
+    # Only the top two can matter: at most one of them is the participant's
+    # choice. nlargest is O(n) here and breaks ties like most_common()
+    for option, _ in heapq.nlargest(2, votes.items(), key=itemgetter(1)):
         if option != participant.initial_choice:
             return option
 
@@ -80,54 +167,62 @@ def _embedding(
     Finds the participant whose explanation is most distant from this participant's,
     then returns that participant's chosen option.
     """
-    try:
-        from openai import OpenAI
-        from .llm import API_KEY
-
-        client = OpenAI(api_key=API_KEY)
-    except ImportError:
-        logger.warning("OpenAI not available for embeddings, falling back to highest_voted")
+    # Normally already built: phase 5 precomputes every explanation up front
+    if "_explanation_matrix" not in config:
+        try:
+            precompute_explanation_embeddings(all_participants, config)
+        except Exception as e:
+            logger.warning(f"Embedding API failed: {e}, falling back to highest_voted")
+            return _highest_voted(participant, all_participants, config)
+
+    explanation_matrix = config["_explanation_matrix"]
+    matrix = explanation_matrix["matrix"]
+    row = explanation_matrix["index_of"].get(participant.participant_id)
+
+    if row is None or len(matrix) < 2:
+        logger.warning("No explanations available, falling back to highest_voted")
         return _highest_voted(participant, all_participants, config)
 
-    # Get embeddings for all explanations
-    explanations = []
-    participants_with_explanations = []
+    # Rows are already normalized: one distance call against every other row
+    mask = np.ones(len(matrix), dtype=bool)
+    mask[row] = False
+    distances = cosine_distances_prenormed(matrix[row], matrix[mask])
 
-    for p in all_participants:
-        if p.status == "complete" and p.initial_explanation and p != participant:
-            explanations.append(p.initial_explanation)
-            participants_with_explanations.append(p)
+    # Most distant; shift past the masked-out own row
+    idx = int(np.argmax(distances))
+    if idx >= row:
+        idx += 1
+    opposing_participant = explanation_matrix["participants"][idx]
 
-    if not explanations:
-        logger.warning("No explanations available, falling back to highest_voted")
-        return _highest_voted(participant, all_participants, config)
+    return opposing_participant.initial_choice
 
-    # Add participant's explanation first
-    all_texts = [participant.initial_explanation] + explanations
 
-    try:
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=all_texts,
-        )
-        embeddings = [e.embedding for e in response.data]
-    except Exception as e:
-        logger.warning(f"Embedding API failed: {e}, falling back to highest_voted")
-        return _highest_voted(participant, all_participants, config)
+def _sample_positions(
+    participant: Participant,
+    candidates: list[Participant],
+    config: dict,
+    k: int = LLM_JUDGE_SAMPLE_SIZE,
+) -> list[Participant]:
+    """Pick up to k candidate positions to show the LLM judge.
 
-    # Calculate cosine distances from participant's explanation
-    participant_emb = np.array(embeddings[0])
-    other_embs = np.array(embeddings[1:])
+    With summary embeddings (phase 4) the k candidates most distant from
+    the participant are kept. Otherwise a random sample is drawn, seeded by
+    'random_seed' and the participant ID so runs stay reproducible.
+    """
+    if len(candidates) <= k:
+        return candidates
 
-    # Cosine similarity
-    norms = np.linalg.norm(other_embs, axis=1) * np.linalg.norm(participant_emb)
-    similarities = np.dot(other_embs, participant_emb) / norms
+    participant_emb = get_normalized_embedding(participant)
+    candidate_embs = [get_normalized_embedding(p) for p in candidates]
 
-    # Find most distant (lowest similarity)
-    most_distant_idx = np.argmin(similarities)
-    opposing_participant = participants_with_explanations[most_distant_idx]
+    if participant_emb is not None and all(e is not None for e in candidate_embs):
+        distances = cosine_distances_prenormed(participant_emb, np.vstack(candidate_embs))
+        top = np.argpartition(-distances, k)[:k]
+        # Keep original participant order in the prompt
+        return [candidates[i] for i in sorted(top)]
 
-    return opposing_participant.initial_choice
+    rng = random.Random(f"{config.get('random_seed')}:{participant.participant_id}")
+    return rng.sample(candidates, k)
 
 
 def _llm_judge(
@@ -135,18 +230,17 @@ def _llm_judge(
 ) -> str:
     """Use LLM to identify the most opposed position."""
     # Collect sample of other positions
-    other_positions = []
-    for p in all_participants:
-        if (
-            p.status == "complete"
-            and p.initial_choice
-            and p.initial_choice != participant.initial_choice
-        ):
-            other_positions.append(
-                f"Option: {p.initial_choice}\nReasoning: {p.initial_explanation}"
-            )
-        if len(other_positions) >= 10:  # Limit sample size
-            break
+    candidates = [
+        p
+        for p in all_participants
+        if p.status == "complete"
+        and p.initial_choice
+        and p.initial_choice != participant.initial_choice
+    ]
+    other_positions = [
+        f"Option: {p.initial_choice}\nReasoning: {p.initial_explanation}"
+        for p in _sample_positions(participant, candidates, config)
+    ]
 
     if not other_positions:
         return _highest_voted(participant, all_participants, config)
@@ -172,14 +266,50 @@ Consider both the choice itself and the underlying values/reasoning.
 
 Respond with ONLY the exact option text, nothing else."""
 
+    # Participants with the same choice and near-identical reasoning reuse an
+    # earlier judgment instead of another LLM call. Only the participant's
+    # own position is embedded: the rest of the prompt is shared text that
+    # would make every prompt look similar.
+    position_embedding = None
+    if config.get("llm_judge_semantic_cache", False):
+        namespace = _judge_namespace(participant, config)
+        position = (
+            f"Option: {participant.initial_choice}\n"
+            f"Reasoning: {participant.initial_explanation}"
+        )
+        try:
+            position_embedding = get_embeddings([position], config)[0]
+        except Exception as e:
+            logger.warning(f"Could not embed judge prompt for semantic cache: {e}")
+        else:
+            cached = semantic_cache.lookup(
+                namespace,
+                position_embedding,
+                config.get("semantic_cache_threshold", semantic_cache.DEFAULT_THRESHOLD),
+            )
+            if cached in options and cached != participant.initial_choice:
+                return cached
+
     messages = [{"role": "user", "content": prompt}]
     response = call_llm(messages, config)
 
     if response is None:
         return _highest_voted(participant, all_participants, config)
 
-    response = response.strip()
+    choice = _match_option(response.strip(), options)
 
+    if choice is None:
+        # Fallback
+        return _highest_voted(participant, all_participants, config)
+
+    if position_embedding is not None:
+        semantic_cache.insert(namespace, position_embedding, choice)
+
+    return choice
+
+
+def _match_option(response: str, options: list[str]) -> str | None:
+    """Map an LLM response to one of the topic options, or None."""
     # Validate response is a valid option
     if response in options:
         return response
@@ -189,8 +319,24 @@ Respond with ONLY the exact option text, nothing else."""
         if opt.lower() in response.lower() or response.lower() in opt.lower():
             return opt
 
-    # Fallback
-    return _highest_voted(participant, all_participants, config)
+    return None
+
+
+def _judge_namespace(participant: Participant, config: dict) -> str:
+    """Semantic cache namespace for LLM judge answers.
+
+    Answers are shared only within one model, topic and initial choice.
+    """
+    topic = config.get("topic", {})
+    description = topic.get("description", "")
+    options = "\n".join(topic.get("options", []))
+    topic_key = hashlib.sha256(
+        (description + "\n" + options).encode("utf-8")
+    ).hexdigest()
+    return (
+        f"llm_judge:{config.get('model', '')}:{topic_key}:"
+        f"{participant.initial_choice}"
+    )
 
 
 def _predefined(
@@ -246,50 +392,23 @@ def _cluster_embedding(
         )
         return _highest_voted(participant, all_participants, config)
 
-    topic = config.get("topic", {})
-    options = topic.get("options", [])
-
-    # Compute option-level embeddings (weighted mean of cluster embeddings)
-    option_embeddings = {}
-
-    for option in options:
-        clusters = clusters_by_option.get(option, [])
-        if not clusters:
-            continue
-
-        # Get cluster embeddings and weights
-        cluster_embs = []
-        weights = []
-
-        for cluster in clusters:
-            if cluster.embedding:
-                cluster_embs.append(cluster.embedding)
-                weights.append(cluster.member_count)
-
-        if not cluster_embs:
-            continue
-
-        # Compute weighted mean
-        total_weight = sum(weights)
-        if total_weight == 0:
-            continue
+    # Option embeddings depend only on the clusters: build once per phase
+    cached = config.get("_option_matrix")
+    if cached is not None and cached[0] is clusters_by_option:
+        _, option_names, option_matrix = cached
+    else:
+        options = config.get("topic", {}).get("options", [])
+        option_names, option_matrix = _build_option_matrix(clusters_by_option, options)
+        config["_option_matrix"] = (clusters_by_option, option_names, option_matrix)
 
-        normalized_weights = [w / total_weight for w in weights]
-        weighted_mean = np.zeros(len(cluster_embs[0]))
-        for emb, weight in zip(cluster_embs, normalized_weights):
-            weighted_mean += np.array(emb) * weight
-
-        option_embeddings[option] = weighted_mean
-
-    if not option_embeddings:
+    if not option_names:
         logger.warning("No valid option embeddings, falling back to highest_voted")
         return _highest_voted(participant, all_participants, config)
 
     # Calculate distance from participant to each option
-    participant_emb = np.array(participant.individual_summary_embedding)
-    participant_norm = np.linalg.norm(participant_emb)
+    participant_emb = get_normalized_embedding(participant)
 
-    if participant_norm == 0:
+    if participant_emb is None:
         logger.warning(
             f"Zero norm embedding for {participant.participant_id}, falling back to highest_voted"
         )
@@ -298,22 +417,17 @@ def _cluster_embedding(
     max_distance = -1
     furthest_option = None
 
-    for option, opt_emb in option_embeddings.items():
-        # Skip participant's own choice
-        if option == participant.initial_choice:
-            continue
-
-        # Cosine distance
-        opt_norm = np.linalg.norm(opt_emb)
-        if opt_norm == 0:
-            continue
-
-        similarity = np.dot(participant_emb, opt_emb) / (participant_norm * opt_norm)
-        distance = 1.0 - similarity
+    # Skip participant's own choice
+    candidate_mask = np.array(
+        [option != participant.initial_choice for option in option_names]
+    )
 
-        if distance > max_distance:
-            max_distance = distance
-            furthest_option = option
+    if candidate_mask.any():
+        distances = cosine_distances_prenormed(participant_emb, option_matrix)
+        distances[~candidate_mask] = -np.inf
+        best_idx = int(np.argmax(distances))
+        max_distance = float(distances[best_idx])
+        furthest_option = option_names[best_idx]
 
     if furthest_option is None:
         logger.warning(
@@ -329,6 +443,57 @@ def _cluster_embedding(
     return furthest_option
 
 
+def _build_option_matrix(
+    clusters_by_option: dict, options: list[str]
+) -> tuple[list[str], np.ndarray]:
+    """Build L2-normalized option-level embeddings from cluster embeddings.
+
+    Each option's embedding is the member-count-weighted mean of its cluster
+    embeddings. Options without usable clusters or with a zero-norm mean
+    are omitted.
+
+    Args:
+        clusters_by_option: Dict mapping option -> list of ClusterInfo
+        options: Topic options, in order
+
+    Returns:
+        Tuple of (option names, matrix with one normalized row per option,
+        stored as COMPACT_EMBEDDING_DTYPE)
+    """
+    option_names = []
+    option_embeddings = []
+
+    for option in options:
+        # Get cluster embeddings and weights
+        cluster_embs = []
+        weights = []
+
+        for cluster in clusters_by_option.get(option, []):
+            if cluster.embedding:
+                cluster_embs.append(cluster.embedding)
+                weights.append(cluster.member_count)
+
+        if not cluster_embs or sum(weights) == 0:
+            continue
+
+        # Compute weighted mean in one vectorized reduction
+        weighted_mean = np.average(
+            np.asarray(cluster_embs, dtype=EMBEDDING_DTYPE),
+            axis=0,
+            weights=np.asarray(weights, dtype=EMBEDDING_DTYPE),
+        )
+        if np.linalg.norm(weighted_mean) == 0:
+            continue
+
+        option_names.append(option)
+        option_embeddings.append(weighted_mean)
+
+    if not option_embeddings:
+        return [], np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+
+    return option_names, compact_normalized(np.vstack(option_embeddings))
+
+
 # Strategy dispatch dictionary
 # To add a new strategy, add it here
 STRATEGIES = {
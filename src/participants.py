@@ -1,15 +1,26 @@
 """Participant data model and management."""
 
+import functools
 import random
-from dataclasses import dataclass, field, asdict
+import threading
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Any
 
+import numpy as np
+
+from .embeddings import compact_normalized
+
 CONDITIONS = ["simple_voting", "simple_passive", "clarified_passive", "acp"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
-    """Data model for experiment participant."""
+    """Data model for experiment participant.
+
+    Uses __slots__: many participants are held in memory for the whole run.
+    """
 
     participant_id: str
     condition: str  # simple_voting, simple_passive, clarified_passive, acp
@@ -40,6 +51,21 @@ class Participant:
     status: str = "pending"  # pending, complete, failed, skipped
     error_message: str | None = None
 
+    # (source embedding, its normalized copy); never serialized, see
+    # get_normalized_embedding()
+    _normalized_embedding: tuple | None = field(default=None, repr=False, compare=False)
+    # (transcript, entry count, rendered text); never serialized, see
+    # simulator._clarification_text() and summarizer._dialogue_text()
+    _clarification_text: tuple | None = field(default=None, repr=False, compare=False)
+    _rendered_dialogue: tuple | None = field(default=None, repr=False, compare=False)
+
+
+# Field names in declaration order, as written by to_dict() (private
+# in-memory caches excluded)
+PARTICIPANT_FIELDS = tuple(
+    f.name for f in fields(Participant) if not f.name.startswith("_")
+)
+
 
 def create_participants(
     personas: list[dict], config: dict, seed: int | None = None
@@ -54,6 +80,8 @@ def create_participants(
     Returns:
         List of Participant objects assigned to conditions
     """
+    # Also seeds the global generator used later in the run (e.g. option
+    # display order in summaries)
     if seed is not None:
         random.seed(seed)
 
@@ -65,16 +93,15 @@ def create_participants(
             f"Need {total_needed} personas but only have {len(personas)}"
         )
 
-    # Shuffle personas for random assignment
-    shuffled = personas.copy()
-    random.shuffle(shuffled)
+    # Random assignment: permute indices rather than copying the persona list
+    order = np.random.default_rng(seed).permutation(len(personas))
 
     participants = []
     idx = 0
 
     for condition in CONDITIONS:
         for i in range(participants_per_condition):
-            persona = shuffled[idx]
+            persona = personas[order[idx]]
             participant = Participant(
                 participant_id=f"p_{idx + 1:04d}",
                 condition=condition,
@@ -85,20 +112,92 @@ def create_participants(
             participants.append(participant)
             idx += 1
 
+    _index_participants(participants)
     return participants
 
 
-def get_by_condition(participants: list[Participant], condition: str) -> list[Participant]:
+class ParticipantIndex:
+    """Participants of one experiment grouped by condition and status.
+
+    Groups keep the order of the participant list. Conditions never change;
+    statuses change only through mark_failed() and mark_complete(), which
+    update the index.
+    """
+
+    def __init__(self, participants: list[Participant]):
+        self.participants = participants
+        self.size = len(participants)
+        self.position = {p.participant_id: i for i, p in enumerate(participants)}
+        self.by_condition: dict[str, list[Participant]] = {}
+        self.by_status: dict[str, dict[str, Participant]] = {}
+        # status -> group in list order, dropped when the group changes
+        self._ordered: dict[str, list[Participant]] = {}
+        self._lock = threading.Lock()
+
+        for p in participants:
+            self.by_condition.setdefault(p.condition, []).append(p)
+            self.by_status.setdefault(p.status, {})[p.participant_id] = p
+
+    def covers(self, participants: list[Participant]) -> bool:
+        """True if this index was built for this (unmodified) list."""
+        return self.participants is participants and self.size == len(participants)
+
+    def status_group(self, status: str) -> list[Participant]:
+        """Participants with the given status, in list order."""
+        with self._lock:
+            group = self._ordered.get(status)
+            if group is None:
+                group = sorted(
+                    self.by_status.get(status, {}).values(),
+                    key=lambda p: self.position[p.participant_id],
+                )
+                self._ordered[status] = group
+            return list(group)
+
+    def set_status(self, participant: Participant, status: str) -> None:
+        """Set a participant's status and move it to the new status group."""
+        with self._lock:
+            pid = participant.participant_id
+            old_group = self.by_status.get(participant.status, {})
+            if old_group.get(pid) is participant:
+                del old_group[pid]
+                self.by_status.setdefault(status, {})[pid] = participant
+                self._ordered.pop(participant.status, None)
+                self._ordered.pop(status, None)
+            participant.status = status
+
+
+# Index of the participant list most recently filtered or created. Built
+# lazily for lists that did not come from create_participants() (resume).
+_index: ParticipantIndex | None = None
+
+
+def _index_participants(participants: list[Participant]) -> ParticipantIndex:
+    """Get the index for a participant list, building it on first use."""
+    global _index
+    index = _index
+    if index is None or not index.covers(participants):
+        index = _index = ParticipantIndex(participants)
+    return index
+
+
+def get_by_condition(
+    participants: list[Participant], condition: str, status: str | None = None
+) -> list[Participant]:
     """Filter participants by condition.
 
     Args:
         participants: List of all participants
         condition: Condition to filter by
+        status: If given, keep only participants with this status
 
     Returns:
         List of participants in the specified condition
     """
-    return [p for p in participants if p.condition == condition]
+    group = _index_participants(participants).by_condition.get(condition, [])
+    if status is None:
+        return list(group)
+    return [p for p in group if p.status == status]
 
 
 def get_by_status(participants: list[Participant], status: str) -> list[Participant]:
@@ -111,34 +210,80 @@ def get_by_status(participants: list[Participant], status: str) -> list[Particip
     Returns:
         List of participants with the specified status
     """
-    return [p for p in participants if p.status == status]
+    return _index_participants(participants).status_group(status)
 
 
 def get_by_conditions(
-    participants: list[Participant], conditions: list[str]
+    participants: list[Participant],
+    conditions: list[str],
+    status: str | None = None,
 ) -> list[Participant]:
     """Filter participants by multiple conditions.
 
     Args:
         participants: List of all participants
         conditions: List of conditions to include
+        status: If given, keep only participants with this status
 
     Returns:
         List of participants in any of the specified conditions
     """
-    return [p for p in participants if p.condition in conditions]
+    index = _index_participants(participants)
+    group = [
+        p for condition in dict.fromkeys(conditions)
+        for p in index.by_condition.get(condition, [])
+        if status is None or p.status == status
+    ]
+    if len(conditions) > 1:
+        # Restore list order across conditions
+        group.sort(key=lambda p: index.position[p.participant_id])
+    return group
+
+
+def count_votes(
+    participants: list[Participant], field_name: str = "initial_choice"
+) -> Counter:
+    """Count non-empty votes across participants.
+
+    Args:
+        participants: Participants whose votes to count
+        field_name: Vote attribute to count ('initial_choice' or 'final_choice')
+
+    Returns:
+        Counter mapping option -> number of votes
+    """
+    return Counter(filter(None, map(attrgetter(field_name), participants)))
 
 
 def to_dict(participant: Participant) -> dict:
     """Convert participant to dictionary for JSON serialization.
 
+    Values are referenced, not deep-copied as with asdict(); serialize the
+    result before mutating the participant again.
+
     Args:
         participant: Participant object
 
     Returns:
         Dictionary representation
     """
-    return asdict(participant)
+    return {name: getattr(participant, name) for name in PARTICIPANT_FIELDS}
+
+
+def _specialize_to_dict(generic):
+    """Compile to_dict as one dict literal over PARTICIPANT_FIELDS.
+
+    Like dataclasses' generated __init__, the source is built once at import
+    so each field is a plain attribute load instead of a getattr() per loop
+    iteration (about 2x faster). The generic version stays as __wrapped__.
+    """
+    items = ", ".join(f"{name!r}: participant.{name}" for name in PARTICIPANT_FIELDS)
+    namespace = {}
+    exec(f"def to_dict(participant):\n    return {{{items}}}\n", namespace)
+    return functools.update_wrapper(namespace["to_dict"], generic)
+
+
+to_dict = _specialize_to_dict(to_dict)
 
 
 def from_dict(data: dict) -> Participant:
@@ -153,6 +298,43 @@ def from_dict(data: dict) -> Participant:
     return Participant(**data)
 
 
+def get_normalized_embedding(participant: Participant) -> np.ndarray | None:
+    """Get the participant's L2-normalized summary embedding, memoized.
+
+    The normalized copy is recomputed only if individual_summary_embedding
+    is reassigned.
+
+    Args:
+        participant: Participant object
+
+    Returns:
+        Normalized embedding (COMPACT_EMBEDDING_DTYPE), or None if the
+        participant has no embedding or it has zero norm
+    """
+    source = participant.individual_summary_embedding
+    cached = participant._normalized_embedding
+    if cached is not None and cached[0] is source:
+        return cached[1]
+
+    normalized = None
+    if source is not None:
+        vector = compact_normalized(source)
+        if vector.any():
+            normalized = vector
+
+    participant._normalized_embedding = (source, normalized)
+    return normalized
+
+
+def _set_status(participant: Participant, status: str) -> None:
+    """Set a participant's status, keeping the current index in sync."""
+    index = _index
+    if index is not None:
+        index.set_status(participant, status)
+    else:
+        participant.status = status
+
+
 def mark_failed(participant: Participant, error_message: str) -> None:
     """Mark a participant as failed.
 
@@ -160,7 +342,7 @@ def mark_failed(participant: Participant, error_message: str) -> None:
         participant: Participant to mark
         error_message: Description of the failure
     """
-    participant.status = "failed"
+    _set_status(participant, "failed")
     participant.error_message = error_message
 
 
@@ -170,4 +352,4 @@ def mark_complete(participant: Participant) -> None:
     Args:
         participant: Participant to mark
     """
-    participant.status = "complete"
+    _set_status(participant, "complete")
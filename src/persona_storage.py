@@ -6,17 +6,72 @@ Maintains 1.5x requested participants in storage for efficient sampling.
 
 import json
 import logging
+import os
 import random
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json if orjson is unavailable
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-DEFAULT_STORAGE_PATH = Path(__file__).parent.parent / "data" / "personas.json"
+# One persona per line, so new personas are appended without a rewrite
+DEFAULT_STORAGE_PATH = Path(__file__).parent.parent / "data" / "personas.jsonl"
+
+
+def _dumps_line(persona: dict) -> bytes:
+    """Serialize one persona to a JSONL line (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(persona) + b"\n"
+    return (json.dumps(persona, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(line: bytes):
+    """Parse one JSON document (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _intern_demographics(persona: dict) -> dict:
+    """Intern demographic category strings so stored personas share them."""
+    demographics = persona.get("demographics")
+    if isinstance(demographics, dict):
+        persona["demographics"] = {
+            k: sys.intern(v) if isinstance(v, str) else v
+            for k, v in demographics.items()
+        }
+    return persona
+
+
+def _migrate_legacy_storage(storage_path: Path) -> bool:
+    """Convert a legacy personas.json next to storage_path into JSONL.
+
+    The legacy file is left in place.
+
+    Returns:
+        True if a legacy file was found and migrated
+    """
+    legacy_path = storage_path.with_suffix(".json")
+    if legacy_path == storage_path or not legacy_path.exists():
+        return False
+
+    with open(legacy_path, "rb") as f:
+        personas = _loads(f.read()).get("personas", [])
+
+    logger.info(f"Migrating {len(personas)} personas from {legacy_path} to {storage_path}")
+    save_storage(personas, storage_path)
+    return True
 
 
 def load_storage(path: Path | None = None) -> list[dict]:
     """Load personas from storage file.
 
+    A legacy personas.json next to the storage file is migrated on first load.
+
     Args:
         path: Path to storage file. Uses default if None.
 
@@ -25,20 +80,27 @@ def load_storage(path: Path | None = None) -> list[dict]:
     """
     storage_path = path or DEFAULT_STORAGE_PATH
 
-    if not storage_path.exists():
+    if not storage_path.exists() and not _migrate_legacy_storage(storage_path):
         logger.info(f"No persona storage found at {storage_path}")
         return []
 
-    with open(storage_path) as f:
-        data = json.load(f)
+    personas = []
+    with open(storage_path, "rb") as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                personas.append(_intern_demographics(_loads(line)))
+            except ValueError as e:
+                # An interrupted append can leave a partial last line
+                logger.warning(f"Skipping unreadable line {line_num} in {storage_path}: {e}")
 
-    personas = data.get("personas", [])
     logger.info(f"Loaded {len(personas)} personas from storage")
     return personas
 
 
 def save_storage(personas: list[dict], path: Path | None = None) -> None:
-    """Save personas to storage file.
+    """Save personas to storage file, replacing its contents.
 
     Args:
         personas: List of persona dicts
@@ -49,14 +111,29 @@ def save_storage(personas: list[dict], path: Path | None = None) -> None:
     # Ensure directory exists
     storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-    data = {"personas": personas}
-
-    with open(storage_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Write to a temp file and rename so a crash never truncates storage
+    tmp_path = storage_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(b"".join(_dumps_line(p) for p in personas))
+    os.replace(tmp_path, storage_path)
 
     logger.info(f"Saved {len(personas)} personas to storage")
 
 
+def _append_storage(personas: list[dict], path: Path | None = None) -> None:
+    """Append personas to the storage file without rewriting it."""
+    storage_path = path or DEFAULT_STORAGE_PATH
+    storage_path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = b"".join(_dumps_line(p) for p in personas)
+    with open(storage_path, "ab+") as f:
+        # Start on a fresh line if an interrupted append left a partial one
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+
+
 def add_personas(new_personas: list[dict], path: Path | None = None) -> int:
     """Add new personas to storage, avoiding duplicates.
 
@@ -72,18 +149,17 @@ def add_personas(new_personas: list[dict], path: Path | None = None) -> int:
     # Create set of existing base_personas for deduplication
     existing_bases = {p["base_persona"] for p in existing}
 
-    added = 0
+    to_add = []
     for persona in new_personas:
         if persona["base_persona"] not in existing_bases:
-            existing.append(persona)
+            to_add.append(persona)
             existing_bases.add(persona["base_persona"])
-            added += 1
 
-    if added > 0:
-        save_storage(existing, path)
-        logger.info(f"Added {added} new personas to storage")
+    if to_add:
+        _append_storage(to_add, path)
+        logger.info(f"Added {len(to_add)} new personas to storage")
 
-    return added
+    return len(to_add)
 
 
 def get_personas(
@@ -107,10 +183,10 @@ def get_personas(
     Returns:
         List of n persona dicts
     """
-    from .personas import fetch_personas, generate_demographics, enrich_persona
+    from .personas import enrich_personas, fetch_personas, generate_demographics_batch
 
-    if seed is not None:
-        random.seed(seed)
+    # One local Random for the whole call; the global random is left alone
+    rng = random.Random(seed)
 
     target = int(n * 1.5)
     storage = load_storage(path)
@@ -124,28 +200,23 @@ def get_personas(
         logger.info(f"Generating {to_generate} new personas to reach 1.5x target")
 
         # Fetch raw personas
-        raw_personas = fetch_personas(to_generate, seed)
+        raw_personas = fetch_personas(to_generate, rng)
 
-        new_personas = []
-        for i, persona_data in enumerate(raw_personas):
+        # Index stored bases once; also dedupes within the fetched batch
+        existing_bases = {p["base_persona"] for p in storage}
+
+        bases = []
+        for persona_data in raw_personas:
             base = persona_data.get("persona", "")
 
             # Skip if already in storage
-            if any(p["base_persona"] == base for p in storage):
+            if base in existing_bases:
                 continue
+            existing_bases.add(base)
+            bases.append(base)
 
-            logger.info(f"Enriching new persona {i + 1}/{len(raw_personas)}")
-            demographics = generate_demographics(base, config)
-            enriched = enrich_persona(base, demographics, config)
-
-            new_personas.append(
-                {
-                    "base_persona": base,
-                    "demographics": demographics,
-                    "enriched_persona": enriched,
-                }
-            )
-
+        demographics = generate_demographics_batch(len(bases), seed)
+        new_personas = enrich_personas(list(zip(bases, demographics)), config)
         add_personas(new_personas, path)
         storage = load_storage(path)
 
@@ -154,7 +225,7 @@ def get_personas(
         logger.warning(f"Storage has only {len(storage)} personas, need {n}")
         return storage
 
-    selected = random.sample(storage, n)
+    selected = rng.sample(storage, n)
     logger.info(f"Selected {n} personas from storage pool of {len(storage)}")
     return selected
 
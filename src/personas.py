@@ -1,13 +1,45 @@
 """Persona fetching and enrichment."""
 
-import json, logging, random, requests
+import gzip, json, logging, os, random, requests
+from itertools import accumulate
+from pathlib import Path
 
-from .llm import call_llm
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import msgpack
+except ImportError:  # Fall back to a gzipped JSONL persona-hub cache
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json if orjson is unavailable
+    orjson = None
+
+from .llm import call_llm, call_llm_batch
 
 logger = logging.getLogger(__name__)
 
-PERSONA_HUB_URL = "https://raw.githubusercontent.com/tencent-ailab/persona-hub/refs/heads/main/data/persona.jsonl"
+# Faster parse for the persona-hub loop; both raise ValueError subclasses
+_loads = orjson.loads if orjson is not None else json.loads
 
+PERSONA_HUB_URL = "https://raw.githubusercontent.com/tencent-ailab/persona-hub/refs/heads/main/data/persona.jsonl"
+PERSONA_HUB_CACHE_DIR = Path(__file__).parent.parent / "cache" / "persona_hub"
+
+# Shared keep-alive session for persona-hub downloads, retrying transient failures
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+SEX_WEIGHTS = {"M": 0.495, "F": 0.505}
 INCOME_WEIGHTS = {"Low income": 0.30, "Middle income": 0.50, "High income": 0.20}
 LOCATION_WEIGHTS = {"urban": 0.25, "suburban": 0.43, "rural": 0.30}
 AGE_BUCKET_WEIGHTS = {
@@ -42,53 +74,101 @@ IDEOLOGY_WEIGHTS = {
   "very conservative": 0.12,
 }
 
-def weighted_choice(rng: random.Random, weights: dict[str, float]) -> str:
-    items = list(weights.keys())
-    w = list(weights.values())
-    return rng.choices(items, weights=w, k=1)[0]
+def _precompute(weights: dict[str, float]) -> tuple[tuple, tuple]:
+    """Turn a weights dict into (items, cumulative weights) for rng.choices."""
+    return tuple(weights), tuple(accumulate(weights.values()))
+
+
+_AGE = _precompute(AGE_BUCKET_WEIGHTS)
+_SEX = _precompute(SEX_WEIGHTS)
+_RACE = _precompute(RACE_WEIGHTS)
+_EDU = _precompute(EDU_WEIGHTS)
+_INCOME = _precompute(INCOME_WEIGHTS)
+_LOCATION = _precompute(LOCATION_WEIGHTS)
+_IDEOLOGY = _precompute(IDEOLOGY_WEIGHTS)
+
+
+def weighted_choice(rng: random.Random, precomputed: tuple[tuple, tuple]) -> str:
+    items, cum_weights = precomputed
+    return rng.choices(items, cum_weights=cum_weights, k=1)[0]
 
 def generate_demographics_weighted(rng: random.Random) -> dict:
     return {
-        "age_bucket": weighted_choice(rng, AGE_BUCKET_WEIGHTS),
-        "sex": rng.choices(["M", "F"], weights=[0.495, 0.505], k=1)[0],
-        "race": weighted_choice(rng, RACE_WEIGHTS),
-        "education": weighted_choice(rng, EDU_WEIGHTS),
-        "income": weighted_choice(rng, INCOME_WEIGHTS),
-        "location_type": weighted_choice(rng, LOCATION_WEIGHTS),
-        "political_leaning": weighted_choice(rng, IDEOLOGY_WEIGHTS),
+        "age_bucket": weighted_choice(rng, _AGE),
+        "sex": weighted_choice(rng, _SEX),
+        "race": weighted_choice(rng, _RACE),
+        "education": weighted_choice(rng, _EDU),
+        "income": weighted_choice(rng, _INCOME),
+        "location_type": weighted_choice(rng, _LOCATION),
+        "political_leaning": weighted_choice(rng, _IDEOLOGY),
     }
 
 
-def fetch_personas(n: int, seed: int | None = None) -> list[dict]:
-    """Fetch and sample personas from persona-hub.
+# Prompt for enrich_persona(); fields are base_persona plus the demographics keys
+ENRICH_PROMPT_TEMPLATE = """Create a rich, detailed persona description that combines the following base persona with the given demographics. Write it as a cohesive paragraph (2-3 sentences) that a person could use to role-play this character.
+    Base persona: {base_persona}
+
+    Demographics:
+    - Age range: {age_bucket}
+    - Sex: {sex}
+    - Race/ethnicity: {race}
+    - Education: {education}
+    - Income level: {income}
+    - Location type: {location_type}
+    - Political leaning: {political_leaning}
+
+    Write ONLY the persona description, no preamble or explanation."""
+
+# Demographic field -> weights, in the order generate_demographics_weighted uses
+DEMOGRAPHIC_WEIGHTS = {
+    "age_bucket": AGE_BUCKET_WEIGHTS,
+    "sex": SEX_WEIGHTS,
+    "race": RACE_WEIGHTS,
+    "education": EDU_WEIGHTS,
+    "income": INCOME_WEIGHTS,
+    "location_type": LOCATION_WEIGHTS,
+    "political_leaning": IDEOLOGY_WEIGHTS,
+}
+
+
+def generate_demographics_batch(n: int, seed: int | None = None) -> list[dict]:
+    """Draw weighted demographics for n personas at once.
+
+    Vectorized counterpart of generate_demographics_weighted(): one NumPy
+    categorical draw of size n per field.
 
     Args:
-        n: Number of personas to sample
+        n: Number of demographic dicts to draw
         seed: Random seed for reproducibility
 
     Returns:
-        List of persona dictionaries with 'persona' key
+        List of n demographics dicts
     """
-    # if seed is not None:
-    #     random.seed(seed)
-    rng = random.Random(seed)
-    logger.info(f"Fetching personas from {PERSONA_HUB_URL}")
+    rng = np.random.default_rng(seed)
+    columns = []
+    for weights in DEMOGRAPHIC_WEIGHTS.values():
+        # Draw indices and map back to the dict keys, so every persona shares
+        # the same category string objects instead of fresh NumPy-made copies
+        items = tuple(weights)
+        p = np.fromiter(weights.values(), dtype=float)
+        drawn = rng.choice(len(items), size=n, p=p / p.sum())
+        columns.append([items[i] for i in drawn.tolist()])
 
-    response = requests.get(PERSONA_HUB_URL)
-    response.raise_for_status()
+    return [dict(zip(DEMOGRAPHIC_WEIGHTS, row)) for row in zip(*columns)]
 
-    # Parse JSONL format
-    personas = []
-    for line in response.text.strip().split("\n"):
-        if line:
-            try:
-                data = json.loads(line)
-                # Filter to English personas (simple heuristic: check for common English words)
-                persona_text = data.get("persona", "")
-                if _is_likely_english(persona_text):
-                    personas.append(data)
-            except json.JSONDecodeError:
-                continue
+
+def fetch_personas(n: int, rng: random.Random | None = None) -> list[dict]:
+    """Fetch and sample personas from persona-hub.
+
+    Args:
+        n: Number of personas to sample
+        rng: Caller's seeded Random instance; an unseeded one if None
+
+    Returns:
+        List of persona dictionaries with 'persona' key
+    """
+    rng = rng or random.Random()
+    personas = _load_persona_hub()
 
     logger.info(f"Found {len(personas)} English personas, sampling {n}")
 
@@ -97,16 +177,97 @@ def fetch_personas(n: int, seed: int | None = None) -> list[dict]:
             f"Requested {n} personas but only {len(personas)} available. Using all."
         )
         return personas
-    
+
     return rng.sample(personas, n)
 
 
+def _load_persona_hub() -> list[dict]:
+    """Download persona-hub and keep the likely-English personas.
+
+    The filtered list is cached under cache/persona_hub/ with the response
+    ETag, as a single msgpack document when msgpack is installed (no JSON
+    parsing on warm runs) or gzipped JSONL otherwise; later calls send
+    If-None-Match and reuse the cache on 304 (or if the download fails).
+    The body is streamed and parsed line by line.
+
+    Returns:
+        List of persona dictionaries with 'persona' key
+    """
+    etag_path = PERSONA_HUB_CACHE_DIR / "etag"
+    data_path = PERSONA_HUB_CACHE_DIR / (
+        "personas.msgpack" if msgpack is not None else "personas.jsonl.gz"
+    )
+    have_cache = data_path.exists() and etag_path.exists()
+
+    headers = {}
+    if have_cache:
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    logger.info(f"Fetching personas from {PERSONA_HUB_URL}")
+    try:
+        response = _SESSION.get(PERSONA_HUB_URL, headers=headers, stream=True, timeout=60)
+        if response.status_code == 304:
+            logger.info("Persona hub unchanged, using cached copy")
+            return _read_persona_cache(data_path)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if not have_cache:
+            raise
+        logger.warning(f"Persona hub download failed ({e}), using cached copy")
+        return _read_persona_cache(data_path)
+
+    # Parse JSONL format
+    personas = []
+    with response:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            try:
+                data = _loads(line)
+            except ValueError:
+                continue
+            # Filter to English personas (simple heuristic: check for common English words)
+            if _is_likely_english(data.get("persona", "")):
+                personas.append(data)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        _write_persona_cache(data_path, personas)
+        etag_path.write_text(etag)
+
+    return personas
+
+
+def _read_persona_cache(path: Path) -> list[dict]:
+    """Read the filtered persona-hub cache."""
+    if path.suffix == ".msgpack":
+        return msgpack.unpackb(path.read_bytes())
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def _write_persona_cache(path: Path, personas: list[dict]) -> None:
+    """Write the filtered persona-hub cache atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    if path.suffix == ".msgpack":
+        tmp_path.write_bytes(msgpack.packb(personas))
+    else:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for persona in personas:
+                f.write(json.dumps(persona, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+
+
 def _is_likely_english(text: str) -> bool:
     """Simple heuristic to check if text is likely English."""
-    # Check for ASCII characters being dominant
-    ascii_count = sum(1 for c in text if ord(c) < 128)
     if len(text) == 0:
         return False
+    if text.isascii():
+        return True
+    # Check for ASCII characters being dominant; encoding with "ignore" keeps
+    # exactly the ASCII characters and counts them in C
+    ascii_count = len(text.encode("ascii", "ignore"))
     return ascii_count / len(text) > 0.9
 
 # def generate_demographics(base_persona: str, config: dict) -> dict:
@@ -189,33 +350,27 @@ def _is_likely_english(text: str) -> bool:
 #     return result
 
 
-def enrich_persona(base_persona: str, demographics: dict, config: dict) -> str:
-    """Create enriched persona description combining base + demographics.
-    Args:
-        base_persona: The base persona description
-        demographics: Demographics dictionary
-        config: Config dict for LLM calls
+def _enrich_messages(base_persona: str, demographics: dict) -> list[dict]:
+    """Build the enrichment request for one persona."""
+    prompt = ENRICH_PROMPT_TEMPLATE.format(base_persona=base_persona, **demographics)
+    return [{"role": "user", "content": prompt}]
 
-    Returns:
-        Full enriched persona description
-    """
-    prompt = f"""Create a rich, detailed persona description that combines the following base persona with the given demographics. Write it as a cohesive paragraph (2-3 sentences) that a person could use to role-play this character.
-    Base persona: {base_persona}
 
-    Demographics:
-    - Age range: {demographics['age_bucket']}
-    - Sex: {demographics['sex']}
-    - Race/ethnicity: {demographics['race']}
-    - Education: {demographics['education']}
-    - Income level: {demographics['income']}
-    - Location type: {demographics['location_type']}
-    - Political leaning: {demographics['political_leaning']}
+def _enrich_config(config: dict) -> dict:
+    """Config for enrichment calls, with the on-disk LLM cache enabled.
 
-    Write ONLY the persona description, no preamble or explanation."""
+    The prompt is fully determined by (base persona, demographics), so the
+    response is memoized through the LLM cache unless 'enrich_cache' is false.
+    """
+    if config.get("enrich_cache", True) and not config.get("llm_cache", False):
+        return {**config, "llm_cache": True}
+    return config
 
-    messages = [{"role": "user", "content": prompt}]
-    response = call_llm(messages, config)
 
+def _enriched_description(
+    base_persona: str, demographics: dict, response: str | None
+) -> str:
+    """Turn an enrichment response into a description, with a fallback."""
     if response is None:
         # Fallback to simple concatenation
         sex_word = "man" if demographics["sex"] == "M" else "woman"
@@ -229,6 +384,61 @@ def enrich_persona(base_persona: str, demographics: dict, config: dict) -> str:
     return response.strip()
 
 
+def enrich_persona(base_persona: str, demographics: dict, config: dict) -> str:
+    """Create enriched persona description combining base + demographics.
+
+    Responses are cached under cache/llm/ keyed by model and prompt; set
+    'enrich_cache: false' to always sample a fresh description.
+
+    Args:
+        base_persona: The base persona description
+        demographics: Demographics dictionary
+        config: Config dict for LLM calls
+
+    Returns:
+        Full enriched persona description
+    """
+    messages = _enrich_messages(base_persona, demographics)
+    response = call_llm(messages, _enrich_config(config))
+    return _enriched_description(base_persona, demographics, response)
+
+
+def enrich_personas(
+    bases_and_demographics: list[tuple[str, dict]], config: dict
+) -> list[dict]:
+    """Enrich many personas in one batch of LLM calls.
+
+    The enrichment prompts are independent, so they are sent together through
+    call_llm_batch() with up to 'enrich_concurrency' (default 16) in flight;
+    the shared rate limiter still applies. Output order matches input order.
+
+    Args:
+        bases_and_demographics: (base persona, demographics) pairs
+        config: Config dict for LLM calls
+
+    Returns:
+        List of dicts with 'base_persona', 'demographics', 'enriched_persona'
+    """
+    if not bases_and_demographics:
+        return []
+
+    logger.info(f"Enriching {len(bases_and_demographics)} personas")
+    responses = call_llm_batch(
+        [_enrich_messages(base, dems) for base, dems in bases_and_demographics],
+        _enrich_config(config),
+        max_concurrency=config.get("enrich_concurrency", 16),
+    )
+
+    return [
+        {
+            "base_persona": base,
+            "demographics": demographics,
+            "enriched_persona": _enriched_description(base, demographics, response),
+        }
+        for (base, demographics), response in zip(bases_and_demographics, responses)
+    ]
+
+
 def prepare_personas(config: dict) -> list[dict]:
     """Fetch, enrich, and prepare all personas for the experiment.
 
@@ -243,7 +453,6 @@ def prepare_personas(config: dict) -> list[dict]:
     """
     n = config["participants_per_condition"] * 4  # 4 conditions
     seed = config.get("random_seed")
-    rng = random.Random(config.get("random_seed"))
     use_storage = config.get("use_persona_storage", True)
 
     if use_storage:
@@ -252,23 +461,10 @@ def prepare_personas(config: dict) -> list[dict]:
         return get_personas(n, config, seed)
 
     # Legacy behavior: generate fresh personas each time
-    raw_personas = fetch_personas(n, seed)
-    prepared = []
-
-    for i, persona_data in enumerate(raw_personas):
-        base = persona_data.get("persona", "")
-        logger.info(f"Enriching persona {i + 1}/{len(raw_personas)}")
-
-        # demographics = generate_demographics(base, config)
-        demographics = generate_demographics_weighted(rng)
-        enriched = enrich_persona(base, demographics, config)
-
-        prepared.append(
-            {
-                "base_persona": base,
-                "demographics": demographics,
-                "enriched_persona": enriched,
-            }
-        )
+    raw_personas = fetch_personas(n, random.Random(seed))
+
+    bases = [persona_data.get("persona", "") for persona_data in raw_personas]
+    demographics = generate_demographics_batch(len(bases), seed)
+    to_enrich = list(zip(bases, demographics))
 
-    return prepared
+    return enrich_personas(to_enrich, config)
@@ -1,18 +1,25 @@
 # Phase modules for experiment execution
+#
+# Submodules are imported lazily on first attribute access (PEP 562), so
+# running a single phase does not pay the import cost of all the others.
 
-from . import phase1_initial_vote
-from . import phase2_threshold_check
-from . import phase3_clarification
-from . import phase4_summaries
-from . import phase5_opposition
-from . import phase6_cross_pollination
-from . import phase7_acp
-from . import phase8_final_vote
-from . import phase9_save
+import importlib
 
-# Backwards compatibility alias
-phase6_passive_exposure = phase6_cross_pollination
-phase8_save = phase9_save
+# Attribute name -> submodule that provides it
+_LAZY = {
+    "phase1_initial_vote": "phase1_initial_vote",
+    "phase2_threshold_check": "phase2_threshold_check",
+    "phase3_clarification": "phase3_clarification",
+    "phase4_summaries": "phase4_summaries",
+    "phase5_opposition": "phase5_opposition",
+    "phase6_cross_pollination": "phase6_cross_pollination",
+    "phase7_acp": "phase7_acp",
+    "phase8_final_vote": "phase8_final_vote",
+    "phase9_save": "phase9_save",
+    # Backwards compatibility aliases
+    "phase6_passive_exposure": "phase6_cross_pollination",
+    "phase8_save": "phase9_save",
+}
 
 __all__ = [
     "phase1_initial_vote",
@@ -27,3 +34,15 @@ __all__ = [
     "phase8_save",  # alias for backwards compatibility
     "phase9_save",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
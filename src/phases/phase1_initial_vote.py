@@ -1,9 +1,12 @@
 """Phase 1: Initial Vote - All participants make their initial choice."""
 
+import asyncio
 import logging
 
+from ..llm import async_client_session
 from ..participants import Participant, mark_failed, mark_complete
-from ..simulator import make_initial_vote
+from ..progress import should_log_progress
+from ..simulator import make_initial_vote_async
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +15,8 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     """Run Phase 1: Initial Vote.
 
     All participants choose one option (without explanation).
-    Reasoning is captured later in the clarification phase.
+    Reasoning is captured later in the clarification phase. Votes are
+    independent, so up to 'vote_max_concurrency' LLM calls run at once.
 
     Args:
         participants: All participants
@@ -28,11 +32,26 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
 
     logger.info(f"Phase 1: Starting initial vote for {total} participants")
 
-    for i, participant in enumerate(participants):
-        logger.info(f"Phase 1: Processing participant {i + 1}/{total}")
+    semaphore = asyncio.Semaphore(config.get("vote_max_concurrency", 16))
 
-        choice = make_initial_vote(participant, topic, config)
+    async def vote(i: int, participant: Participant) -> str | None:
+        async with semaphore:
+            if should_log_progress(i, total):
+                logger.info(
+                    f"Phase 1: Processing {participant.condition} participant "
+                    f"{i + 1}/{total}"
+                )
+            return await make_initial_vote_async(participant, topic, config)
 
+    async def vote_all() -> list[str | None]:
+        async with async_client_session():
+            return await asyncio.gather(
+                *(vote(i, p) for i, p in enumerate(participants))
+            )
+
+    choices = asyncio.run(vote_all()) if participants else []
+
+    for participant, choice in zip(participants, choices):
         if choice is None:
             mark_failed(participant, "Failed to get initial vote from LLM")
             failed += 1
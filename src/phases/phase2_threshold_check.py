@@ -1,9 +1,9 @@
 """Phase 2: Threshold Check - Check if any option has majority."""
 
 import logging
-from collections import Counter
+from operator import itemgetter
 
-from ..participants import Participant, get_by_status
+from ..participants import Participant
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +25,17 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     threshold = config.get("disagreement_threshold", 0.5)
     min_responses = config.get("min_responses_for_threshold", 50)
 
-    # Count votes from completed participants
-    completed = get_by_status(participants, "complete")
-    votes = Counter(p.initial_choice for p in completed if p.initial_choice)
-
-    total_votes = sum(votes.values())
+    # Count votes from completed participants in a single pass
+    votes: dict[str, int] = {}
+    total_votes = 0
+    for p in participants:
+        choice = p.initial_choice
+        if choice and p.status == "complete":
+            votes[choice] = votes.get(choice, 0) + 1
+            total_votes += 1
 
     logger.info(f"Phase 2: Vote counts from {total_votes} participants:")
-    for option, count in votes.most_common():
+    for option, count in sorted(votes.items(), key=itemgetter(1), reverse=True):
         pct = count / total_votes * 100 if total_votes > 0 else 0
         logger.info(f"  {option}: {count} ({pct:.1f}%)")
 
@@ -46,8 +49,10 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
             f"before checking threshold. Continuing."
         )
     else:
-        for option, count in votes.items():
-            proportion = count / total_votes if total_votes > 0 else 0
+        # If any option reaches the threshold, the leading one does
+        if votes:
+            option, count = max(votes.items(), key=itemgetter(1))
+            proportion = count / total_votes
             if proportion >= threshold:
                 should_terminate = True
                 termination_option = option
@@ -56,7 +61,6 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
                     f"({total_votes} responses), exceeding threshold of {threshold:.1%}. "
                     f"Experiment will terminate."
                 )
-                break
 
         if not should_terminate:
             logger.info(
@@ -66,7 +70,7 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     return {
         "phase": 2,
         "continue": not should_terminate,
-        "vote_counts": dict(votes),
+        "vote_counts": votes,
         "total_votes": total_votes,
         "threshold": threshold,
         "termination_option": termination_option,
@@ -1,9 +1,12 @@
 """Phase 3: Clarification - Q&A for clarified_passive and ACP participants."""
 
+import asyncio
 import logging
 
+from ..llm import async_client_session
 from ..participants import Participant, get_by_conditions, mark_failed
-from ..moderator import run_clarification
+from ..progress import should_log_progress
+from ..moderator import run_clarification_async
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +15,8 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     """Run Phase 3: Clarification.
 
     Moderator asks clarifying questions to participants in
-    clarified_passive and acp conditions.
+    clarified_passive and acp conditions. Up to 'dialogue_max_concurrency'
+    dialogues run at once; turns within a dialogue stay sequential.
 
     Args:
         participants: All participants
@@ -23,10 +27,11 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     """
     topic = config["topic"]
 
-    # Get participants needing clarification
-    to_clarify = get_by_conditions(participants, ["clarified_passive", "acp"])
-    # Filter to only completed participants (who have initial votes)
-    to_clarify = [p for p in to_clarify if p.status == "complete"]
+    # Get participants needing clarification: only completed participants
+    # (who have initial votes)
+    to_clarify = get_by_conditions(
+        participants, ["clarified_passive", "acp"], status="complete"
+    )
 
     total = len(to_clarify)
     succeeded = 0
@@ -34,11 +39,23 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
 
     logger.info(f"Phase 3: Starting clarification for {total} participants")
 
-    for i, participant in enumerate(to_clarify):
-        logger.info(f"Phase 3: Processing participant {i + 1}/{total}")
+    semaphore = asyncio.Semaphore(config.get("dialogue_max_concurrency", 4))
+
+    async def clarify(i: int, participant: Participant) -> list[dict] | None:
+        async with semaphore:
+            if should_log_progress(i, total):
+                logger.info(f"Phase 3: Processing participant {i + 1}/{total}")
+            return await run_clarification_async(participant, topic, config)
+
+    async def clarify_all() -> list[list[dict] | None]:
+        async with async_client_session():
+            return await asyncio.gather(
+                *(clarify(i, p) for i, p in enumerate(to_clarify))
+            )
 
-        transcript = run_clarification(participant, topic, config)
+    transcripts = asyncio.run(clarify_all()) if to_clarify else []
 
+    for participant, transcript in zip(to_clarify, transcripts):
         if transcript is None:
             mark_failed(participant, "Failed during clarification")
             failed += 1
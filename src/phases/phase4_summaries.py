@@ -2,13 +2,21 @@
 
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from ..participants import Participant, get_by_conditions
-from ..summarizer import extract_individual_summary, generate_cluster_description
-from ..embeddings import get_embeddings
+from ..summarizer import (
+    extract_individual_summaries,
+    extract_individual_summaries_concurrent,
+    generate_cluster_descriptions,
+    generate_cluster_descriptions_concurrent,
+)
+from ..embeddings import EMBEDDING_DTYPE, MAX_BATCH_SIZE, get_embeddings
+from ..embedding_cache import cache_stats
 from ..clustering import (
     cluster_embeddings,
-    get_cluster_members,
     ClusterInfo,
 )
 
@@ -38,8 +46,9 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     algorithm = config.get("clustering_algorithm", "kmeans")
 
     # Get clarified participants (clarified_passive + acp)
-    clarified = get_by_conditions(participants, ["clarified_passive", "acp"])
-    clarified = [p for p in clarified if p.status == "complete"]
+    clarified = get_by_conditions(
+        participants, ["clarified_passive", "acp"], status="complete"
+    )
 
     logger.info(f"Phase 4: Processing {len(clarified)} clarified participants")
 
@@ -52,11 +61,36 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
             "clusters_by_option": {},
         }
 
-    # Step 1: Extract individual summaries
+    max_workers = config.get("llm_max_concurrency", 16)
+
+    # Step 1: Extract individual summaries (independent LLM calls, run
+    # concurrently; the shared rate limiter still applies). With
+    # summary_batch_size > 1 each call covers a batch of participants.
     logger.info("Phase 4: Step 1 - Extracting individual summaries")
     summaries_extracted = 0
-    for participant in clarified:
-        summary = extract_individual_summary(participant, config)
+    batch_size = config.get("summary_batch_size", 1)
+    if batch_size > 1:
+        batches = [
+            clarified[i:i + batch_size]
+            for i in range(0, len(clarified), batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            extracted = [
+                summary
+                for batch_summaries in pool.map(
+                    lambda b: extract_individual_summaries(b, config, batch_size),
+                    batches,
+                )
+                for summary in batch_summaries
+            ]
+    else:
+        extracted = extract_individual_summaries_concurrent(
+            clarified, config, max_workers
+        )
+
+    # Apply summaries and collect participants with valid summaries in one pass
+    participants_with_summaries = []
+    for participant, summary in zip(clarified, extracted):
         if summary:
             participant.individual_summary = summary
             summaries_extracted += 1
@@ -64,14 +98,11 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
             logger.warning(
                 f"Phase 4: Failed to extract summary for {participant.participant_id}"
             )
+        if participant.individual_summary is not None:
+            participants_with_summaries.append(participant)
 
     logger.info(f"Phase 4: Extracted {summaries_extracted} individual summaries")
 
-    # Get participants with valid summaries
-    participants_with_summaries = [
-        p for p in clarified if p.individual_summary is not None
-    ]
-
     if not participants_with_summaries:
         logger.warning("Phase 4: No valid individual summaries extracted")
         return {
@@ -83,12 +114,17 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
 
     # Step 2: Calculate embeddings for individual summaries
     logger.info("Phase 4: Step 2 - Calculating individual summary embeddings")
+    cache_before = cache_stats()
     summaries = [p.individual_summary for p in participants_with_summaries]
 
     try:
-        individual_embeddings = get_embeddings(summaries, config)
+        individual_embeddings = get_embeddings(
+            summaries, config, batch_size=MAX_BATCH_SIZE
+        )
         for i, participant in enumerate(participants_with_summaries):
             participant.individual_summary_embedding = individual_embeddings[i]
+        # Stack once; each option clusters a contiguous row selection of this
+        summary_matrix = np.asarray(individual_embeddings, dtype=EMBEDDING_DTYPE)
         logger.info(f"Phase 4: Calculated {len(individual_embeddings)} embeddings")
     except RuntimeError as e:
         logger.error(f"Phase 4: Failed to calculate embeddings: {e}")
@@ -98,66 +134,94 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
             "clusters": [],
             "clusters_by_option": {},
             "error": str(e),
+            **_cache_counts(cache_before),
         }
 
     # Step 3: Cluster by option
     logger.info("Phase 4: Step 3 - Clustering participants by option")
 
-    # Group participants by their initial choice
+    # Group participants (and their summary_matrix rows) by initial choice
     participants_by_option = defaultdict(list)
-    for p in participants_with_summaries:
+    rows_by_option = defaultdict(list)
+    for row, p in enumerate(participants_with_summaries):
         participants_by_option[p.initial_choice].append(p)
+        rows_by_option[p.initial_choice].append(row)
 
     all_clusters = []
     clusters_by_option = {}
+    clustered_options = [o for o in options if participants_by_option.get(o)]
 
-    for option in options:
-        option_participants = participants_by_option.get(option, [])
-        if not option_participants:
-            clusters_by_option[option] = []
-            continue
-
+    def cluster_option(option: str) -> list[int]:
         logger.info(
-            f"Phase 4: Clustering {len(option_participants)} participants for '{option}'"
+            f"Phase 4: Clustering {len(participants_by_option[option])} "
+            f"participants for '{option}'"
         )
-
-        # Get embeddings for this option's participants
-        option_embeddings = [
-            p.individual_summary_embedding for p in option_participants
-        ]
-        option_ids = [p.participant_id for p in option_participants]
-
-        # Cluster
-        labels = cluster_embeddings(
-            option_embeddings,
+        # Fancy indexing yields a contiguous float32 copy of the option's rows
+        return cluster_embeddings(
+            summary_matrix[rows_by_option[option]],
             max_clusters=max_clusters,
             algorithm=algorithm,
+            early_stop=config.get("silhouette_early_stop", True),
         )
 
-        # Group by cluster
-        cluster_members = get_cluster_members(labels, option_ids)
+    # Options cluster independently, so run them in parallel; NumPy and
+    # scikit-learn release the GIL in their numeric kernels
+    with ThreadPoolExecutor(max_workers=max(1, len(clustered_options))) as pool:
+        labels_by_option = dict(
+            zip(clustered_options, pool.map(cluster_option, clustered_options))
+        )
 
-        # Assign cluster IDs to participants
-        for label, member_ids in cluster_members.items():
-            cluster_id = f"{option}_cluster_{label}"
-            for p in option_participants:
-                if p.participant_id in member_ids:
-                    p.cluster_id = cluster_id
+    # Group participants by cluster and assign cluster IDs in one pass
+    members_by_option: dict[str, dict[int, list[Participant]]] = {}
+    for option in clustered_options:
+        members_by_label = members_by_option[option] = {}
+        for p, label in zip(participants_by_option[option], labels_by_option[option]):
+            members_by_label.setdefault(label, []).append(p)
+            p.cluster_id = f"{option}_cluster_{label}"
+
+    # Generate all cluster descriptions, across options, concurrently
+    description_jobs = [
+        ([p.individual_summary for p in members], option)
+        for option in clustered_options
+        for members in members_by_option[option].values()
+    ]
+    # With description_batch_size > 1 each call covers a batch of clusters
+    description_batch_size = config.get("description_batch_size", 1)
+    if description_batch_size > 1:
+        job_batches = [
+            description_jobs[i:i + description_batch_size]
+            for i in range(0, len(description_jobs), description_batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            descriptions = iter([
+                description
+                for batch_descriptions in pool.map(
+                    lambda b: generate_cluster_descriptions(
+                        b, config, description_batch_size
+                    ),
+                    job_batches,
+                )
+                for description in batch_descriptions
+            ])
+    else:
+        descriptions = iter(
+            generate_cluster_descriptions_concurrent(
+                description_jobs, config, max_workers
+            )
+        )
 
-        # Create cluster info objects
+    for option in options:
+        if option not in members_by_option:
+            clusters_by_option[option] = []
+            continue
+
+        # Create cluster info objects (descriptions are in job order)
         option_clusters = []
-        for label, member_ids in cluster_members.items():
+        for label, members in members_by_option[option].items():
             cluster_id = f"{option}_cluster_{label}"
+            member_ids = [p.participant_id for p in members]
 
-            # Get individual summaries for this cluster
-            cluster_summaries = [
-                p.individual_summary
-                for p in option_participants
-                if p.participant_id in member_ids
-            ]
-
-            # Generate cluster description
-            description = generate_cluster_description(cluster_summaries, option, config)
+            description = next(descriptions)
             if not description:
                 description = f"Participants who chose {option}."
 
@@ -181,7 +245,9 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     if all_clusters:
         cluster_descriptions = [c.description for c in all_clusters]
         try:
-            cluster_embeddings_list = get_embeddings(cluster_descriptions, config)
+            cluster_embeddings_list = get_embeddings(
+                cluster_descriptions, config, batch_size=MAX_BATCH_SIZE
+            )
             for i, cluster in enumerate(all_clusters):
                 cluster.embedding = cluster_embeddings_list[i]
             logger.info(
@@ -200,4 +266,14 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
         "participants_summarized": summaries_extracted,
         "clusters": all_clusters,
         "clusters_by_option": clusters_by_option,
+        **_cache_counts(cache_before),
+    }
+
+
+def _cache_counts(before: dict) -> dict:
+    """Embedding cache hits and misses since the 'before' snapshot."""
+    after = cache_stats()
+    return {
+        "cache_hits": after["hits"] - before["hits"],
+        "cache_misses": after["misses"] - before["misses"],
     }
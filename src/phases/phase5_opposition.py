@@ -3,7 +3,12 @@
 import logging
 
 from ..participants import Participant, get_by_condition, mark_failed
-from ..opposition import select_opposition
+from ..progress import should_log_progress
+from ..opposition import (
+    count_completed_votes,
+    precompute_explanation_embeddings,
+    select_opposition,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +25,8 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     Returns:
         Dict with status info
     """
-    # Get ACP participants
-    acp_participants = get_by_condition(participants, "acp")
-    # Filter to completed
-    acp_participants = [p for p in acp_participants if p.status == "complete"]
+    # Get completed ACP participants
+    acp_participants = get_by_condition(participants, "acp", status="complete")
 
     total = len(acp_participants)
     succeeded = 0
@@ -34,8 +37,19 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
         f"using method '{config.get('opposition_method')}'"
     )
 
+    # Votes are fixed during this phase: count once, not per participant
+    config["_vote_counts"] = count_completed_votes(participants)
+
+    # Embed all explanations in one batched pass instead of once per participant
+    if config.get("opposition_method") == "embedding" and acp_participants:
+        try:
+            precompute_explanation_embeddings(participants, config)
+        except Exception as e:
+            logger.warning(f"Phase 5: Embedding precompute failed: {e}")
+
     for i, participant in enumerate(acp_participants):
-        logger.info(f"Phase 5: Processing participant {i + 1}/{total}")
+        if should_log_progress(i, total):
+            logger.info(f"Phase 5: Processing participant {i + 1}/{total}")
 
         try:
             opposition = select_opposition(participant, participants, config)
@@ -47,6 +61,8 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
             )
         except Exception as e:
             mark_failed(participant, f"Failed during opposition selection: {e}")
+            # A failed participant's vote no longer counts
+            config["_vote_counts"] = count_completed_votes(participants)
             failed += 1
             logger.warning(f"Phase 5: Failed for {participant.participant_id}: {e}")
 
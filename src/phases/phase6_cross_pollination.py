@@ -1,8 +1,10 @@
 """Phase 6: Cross-Pollination - Show cluster summaries to all exposed groups."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from ..participants import Participant, get_by_conditions, mark_failed
+from ..progress import should_log_progress
 from ..simulator import make_final_vote_after_summary, make_final_vote_simple
 from ..summarizer import format_cross_pollination_content
 
@@ -20,6 +22,7 @@ def run(
     Show cluster descriptions to simple_passive, clarified_passive, AND acp.
     - Passive groups (simple_passive, clarified_passive) vote after viewing
     - ACP participants view but don't vote yet (vote happens after dialogue in Phase 7)
+    The three groups are processed concurrently on separate threads.
 
     Args:
         participants: All participants
@@ -42,18 +45,28 @@ def run(
 
     logger.debug(f"Phase 6: Cross-pollination content:\n{cross_pollination_content}")
 
-    # Process simple_voting group (revisit vote with no extra info)
-    simple_result = _process_simple_voting_group(participants, config, topic)
+    # The groups are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        # Process simple_voting group (revisit vote with no extra info)
+        simple_future = pool.submit(
+            _process_simple_voting_group, participants, config, topic
+        )
 
-    # Process passive groups (they vote after viewing)
-    passive_result = _process_passive_groups(
-        participants, config, topic, cross_pollination_content
-    )
+        # Process passive groups (they vote after viewing)
+        passive_future = pool.submit(
+            _process_passive_groups,
+            participants, config, topic, cross_pollination_content,
+        )
 
-    # Process ACP group (they view but don't vote yet)
-    acp_result = _process_acp_group(
-        participants, config, cross_pollination_content
-    )
+        # Process ACP group (they view but don't vote yet); no need to wait
+        # for the votes above
+        acp_future = pool.submit(
+            _process_acp_group, participants, config, cross_pollination_content
+        )
+
+        simple_result = simple_future.result()
+        passive_result = passive_future.result()
+        acp_result = acp_future.result()
 
     total = simple_result["total"] + passive_result["total"] + acp_result["total"]
 
@@ -96,8 +109,7 @@ def _process_simple_voting_group(
     Returns:
         Dict with simple_voting group results
     """
-    simple = get_by_conditions(participants, ["simple_voting"])
-    simple = [p for p in simple if p.status == "complete"]
+    simple = get_by_conditions(participants, ["simple_voting"], status="complete")
 
     total = len(simple)
     succeeded = 0
@@ -106,11 +118,18 @@ def _process_simple_voting_group(
 
     logger.info(f"Phase 6: Getting final votes from {total} simple_voting participants")
 
-    for i, participant in enumerate(simple):
-        logger.info(f"Phase 6: Processing simple_voting participant {i + 1}/{total}")
+    def vote(item: tuple[int, Participant]) -> str | None:
+        i, participant = item
+        if should_log_progress(i, total):
+            logger.info(f"Phase 6: Processing simple_voting participant {i + 1}/{total}")
+        return make_final_vote_simple(participant, topic, config)
 
-        final_choice = make_final_vote_simple(participant, topic, config)
+    # Final votes are independent LLM calls, so run them in parallel
+    max_workers = config.get("llm_max_concurrency", 16)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        final_choices = list(pool.map(vote, enumerate(simple)))
 
+    for participant, final_choice in zip(simple, final_choices):
         if final_choice is None:
             mark_failed(participant, "Failed to get final vote")
             failed += 1
@@ -147,8 +166,9 @@ def _process_passive_groups(
     Returns:
         Dict with passive group results
     """
-    passive = get_by_conditions(participants, ["simple_passive", "clarified_passive"])
-    passive = [p for p in passive if p.status == "complete"]
+    passive = get_by_conditions(
+        participants, ["simple_passive", "clarified_passive"], status="complete"
+    )
 
     total = len(passive)
     succeeded = 0
@@ -157,13 +177,18 @@ def _process_passive_groups(
 
     logger.info(f"Phase 6: Getting final votes from {total} passive participants")
 
-    for i, participant in enumerate(passive):
-        logger.info(f"Phase 6: Processing passive participant {i + 1}/{total}")
+    def vote(item: tuple[int, Participant]) -> str | None:
+        i, participant = item
+        if should_log_progress(i, total):
+            logger.info(f"Phase 6: Processing passive participant {i + 1}/{total}")
+        return make_final_vote_after_summary(participant, content, topic, config)
 
-        final_choice = make_final_vote_after_summary(
-            participant, content, topic, config
-        )
+    # Final votes are independent LLM calls, so run them in parallel
+    max_workers = config.get("llm_max_concurrency", 16)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        final_choices = list(pool.map(vote, enumerate(passive)))
 
+    for participant, final_choice in zip(passive, final_choices):
         if final_choice is None:
             mark_failed(participant, "Failed to get final vote")
             failed += 1
@@ -201,8 +226,7 @@ def _process_acp_group(
     Returns:
         Dict with ACP group results
     """
-    acp = get_by_conditions(participants, ["acp"])
-    acp = [p for p in acp if p.status == "complete"]
+    acp = get_by_conditions(participants, ["acp"], status="complete")
 
     total = len(acp)
     viewed = 0
@@ -3,6 +3,7 @@
 import logging
 
 from ..participants import Participant, get_by_conditions, mark_failed
+from ..progress import should_log_progress
 from ..simulator import make_final_vote_after_summary
 
 logger = logging.getLogger(__name__)
@@ -26,10 +27,10 @@ def run(
     """
     topic = config["topic"]
 
-    # Get passive exposure participants
-    passive = get_by_conditions(participants, ["simple_passive", "clarified_passive"])
-    # Filter to completed
-    passive = [p for p in passive if p.status == "complete"]
+    # Get completed passive exposure participants
+    passive = get_by_conditions(
+        participants, ["simple_passive", "clarified_passive"], status="complete"
+    )
 
     total = len(passive)
     succeeded = 0
@@ -39,7 +40,8 @@ def run(
     logger.info(f"Phase 6: Getting final votes from {total} passive participants")
 
     for i, participant in enumerate(passive):
-        logger.info(f"Phase 6: Processing participant {i + 1}/{total}")
+        if should_log_progress(i, total):
+            logger.info(f"Phase 6: Processing participant {i + 1}/{total}")
 
         final_choice = make_final_vote_after_summary(participant, summary, topic, config)
 
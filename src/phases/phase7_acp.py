@@ -1,10 +1,13 @@
 """Phase 7: ACP Round 2 - Adversarial dialogue and final votes."""
 
+import asyncio
 import logging
 
 from ..participants import Participant, get_by_condition, mark_failed
-from ..moderator import run_adversarial_dialogue
-from ..simulator import make_final_vote_after_dialogue
+from ..progress import should_log_progress
+from ..llm import async_client_session, prompt_cache_key
+from ..moderator import build_adversarial_prompt, run_adversarial_dialogue_async
+from ..simulator import make_final_vote_after_dialogue_async
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,9 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     """Run Phase 7: ACP Round 2.
 
     Run Socratic adversarial dialogue with ACP participants,
-    then get their final votes.
+    then get their final votes. Up to 'dialogue_max_concurrency'
+    dialogues (each followed by its final vote) run at once; turns
+    within a dialogue stay sequential.
 
     Args:
         participants: All participants
@@ -25,8 +30,10 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     topic = config["topic"]
 
     # Get ACP participants with opposition views set
-    acp = get_by_condition(participants, "acp")
-    acp = [p for p in acp if p.status == "complete" and p.opposition_view]
+    acp = [
+        p for p in get_by_condition(participants, "acp", status="complete")
+        if p.opposition_view
+    ]
 
     total = len(acp)
     succeeded = 0
@@ -35,15 +42,59 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
 
     logger.info(f"Phase 7: Running adversarial dialogue for {total} ACP participants")
 
-    for i, participant in enumerate(acp):
-        logger.info(f"Phase 7: Processing participant {i + 1}/{total}")
-
-        # Run adversarial dialogue
-        transcript = run_adversarial_dialogue(
-            participant, participant.opposition_view, topic, config,
-            cross_pollination_content=participant.cross_pollination_content
+    # One moderator prompt and prompt cache key per distinct
+    # (initial choice, opposition view, cross-pollination content)
+    group_prompts: dict[tuple, tuple[str, str]] = {}
+    dialogue_prompts = []
+    for participant in acp:
+        key = (
+            participant.initial_choice,
+            participant.opposition_view,
+            participant.cross_pollination_content,
         )
-
+        if key not in group_prompts:
+            group_prompts[key] = (
+                build_adversarial_prompt(topic, *key),
+                prompt_cache_key(
+                    f"acp:{participant.initial_choice}:{participant.opposition_view}"
+                ),
+            )
+        dialogue_prompts.append(group_prompts[key])
+
+    semaphore = asyncio.Semaphore(config.get("dialogue_max_concurrency", 4))
+
+    async def challenge(
+        i: int, participant: Participant, system_prompt: str, cache_key: str
+    ) -> tuple[list[dict] | None, str | None]:
+        async with semaphore:
+            if should_log_progress(i, total):
+                logger.info(f"Phase 7: Processing participant {i + 1}/{total}")
+            transcript = await run_adversarial_dialogue_async(
+                participant, participant.opposition_view, topic, config,
+                cross_pollination_content=participant.cross_pollination_content,
+                system_prompt=system_prompt,
+                cache_key=cache_key,
+            )
+            if transcript is None:
+                return None, None
+            # Final vote right after its dialogue, in the same slot
+            final_choice = await make_final_vote_after_dialogue_async(
+                participant, transcript, topic, config
+            )
+            return transcript, final_choice
+
+    async def challenge_all() -> list[tuple[list[dict] | None, str | None]]:
+        async with async_client_session():
+            return await asyncio.gather(
+                *(
+                    challenge(i, p, *prompt)
+                    for i, (p, prompt) in enumerate(zip(acp, dialogue_prompts))
+                )
+            )
+
+    results = asyncio.run(challenge_all()) if acp else []
+
+    for participant, (transcript, final_choice) in zip(acp, results):
         if transcript is None:
             mark_failed(participant, "Failed during adversarial dialogue")
             failed += 1
@@ -52,11 +103,6 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
 
         participant.adversarial_transcript = transcript
 
-        # Get final vote
-        final_choice = make_final_vote_after_dialogue(
-            participant, transcript, topic, config
-        )
-
         if final_choice is None:
             mark_failed(participant, "Failed to get final vote after dialogue")
             failed += 1
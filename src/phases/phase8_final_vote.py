@@ -10,7 +10,7 @@ This phase logs the final vote statistics.
 import logging
 from collections import Counter
 
-from ..participants import Participant, get_by_conditions
+from ..participants import Participant, get_by_condition
 
 logger = logging.getLogger(__name__)
 
@@ -39,28 +39,36 @@ def run(participants: list[Participant], config: dict, **kwargs) -> dict:
     total_changed = 0
 
     for condition in conditions:
-        condition_participants = get_by_conditions(participants, [condition])
-        completed = [p for p in condition_participants if p.status == "complete"]
-        voted = [p for p in completed if p.final_choice is not None]
-        changed = [p for p in voted if p.position_changed]
-
-        # Count vote distribution
-        vote_counts = Counter(p.final_choice for p in voted if p.final_choice)
+        completed = get_by_condition(participants, condition, status="complete")
+
+        # Count votes, changes and the vote distribution in one pass
+        vote_counts = Counter()
+        voted = 0
+        changed = 0
+        for p in completed:
+            if p.final_choice is None:
+                continue
+            voted += 1
+            if p.position_changed:
+                changed += 1
+            if p.final_choice:
+                vote_counts[p.final_choice] += 1
 
         stats_by_condition[condition] = {
             "total": len(completed),
-            "voted": len(voted),
-            "changed": len(changed),
-            "change_rate": len(changed) / len(voted) if voted else 0,
+            "voted": voted,
+            "changed": changed,
+            "change_rate": changed / voted if voted else 0,
             "vote_distribution": dict(vote_counts),
         }
 
-        total_voted += len(voted)
-        total_changed += len(changed)
+        total_voted += voted
+        total_changed += changed
 
     # simple_voting has no final vote
-    simple_voting = get_by_conditions(participants, ["simple_voting"])
-    simple_voting_completed = [p for p in simple_voting if p.status == "complete"]
+    simple_voting_completed = get_by_condition(
+        participants, "simple_voting", status="complete"
+    )
     stats_by_condition["simple_voting"] = {
         "total": len(simple_voting_completed),
         "voted": 0,
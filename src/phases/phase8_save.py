@@ -2,13 +2,14 @@
 
 import json
 import logging
-from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
-from ..participants import Participant, to_dict, get_by_condition, get_by_status
+from ..participants import (
+    Participant, to_dict, count_votes, get_by_condition, get_by_status
+)
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +97,7 @@ def _calculate_summary(
         failed = [p for p in group if p.status == "failed"]
 
         # Initial vote distribution
-        initial_votes = Counter(p.initial_choice for p in completed if p.initial_choice)
+        initial_votes = count_votes(completed)
 
         condition_summary = {
             "total": len(group),
@@ -107,7 +108,7 @@ def _calculate_summary(
 
         # Final vote stats (for conditions with final votes)
         if condition != "simple_voting":
-            final_votes = Counter(p.final_choice for p in completed if p.final_choice)
+            final_votes = count_votes(completed, "final_choice")
             changed = sum(1 for p in completed if p.position_changed)
 
             condition_summary["final_vote_distribution"] = dict(final_votes)
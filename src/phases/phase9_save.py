@@ -2,17 +2,56 @@
 
 import json
 import logging
-from collections import Counter
-from datetime import datetime
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import yaml
 
-from ..participants import Participant, to_dict, get_by_condition, get_by_status
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json if orjson is unavailable
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Only needed for embedding_format: msgpack
+    msgpack = None
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _SafeDumper
+
+from ..participants import CONDITIONS, Participant
 from ..clustering import ClusterInfo
+from ..embeddings import EMBEDDING_DTYPE
+from ..checkpoint import (
+    INDIVIDUAL_EMBEDDINGS_NPY,
+    atomic_open,
+    atomic_write_bytes,
+    embeddings_npy_bytes,
+    participant_record,
+)
 
 logger = logging.getLogger(__name__)
 
+# Strings matching this (and not a YAML keyword) can be written unquoted
+_PLAIN_YAML_STRING = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*\Z")
+_YAML_KEYWORDS = frozenset({
+    "true", "false", "yes", "no", "on", "off", "y", "n", "null", "~",
+})
+
+# participants.ndjson header version
+NDJSON_SCHEMA_VERSION = 1
+
+# Buffer for record-by-record writes (the io default is 8 KiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def run(
     participants: list[Participant],
@@ -40,6 +79,8 @@ def run(
         Dict with file paths
     """
     output_path = Path(output_dir)
+    # One timestamp for every file written by this save
+    generated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     logger.info(f"Phase 9: Saving results to {output_path}")
 
@@ -47,61 +88,138 @@ def run(
     config_path = output_path / "config.yaml"
     # Remove internal keys before saving
     config_to_save = {k: v for k, v in config.items() if not k.startswith("_")}
-    with open(config_path, "w") as f:
-        yaml.dump(config_to_save, f, default_flow_style=False)
+    try:
+        config_yaml = _dump_simple_yaml(config_to_save)
+    except TypeError:
+        config_yaml = yaml.dump(
+            config_to_save, Dumper=_SafeDumper, default_flow_style=False
+        )
+    atomic_write_bytes(config_path, config_yaml.encode("utf-8"))
     logger.info(f"Phase 9: Saved config to {config_path}")
 
+    # The artifact files are independent, so they are written in parallel;
+    # each entry is (write callable, log message).
+    writes = []
+
     # Save participants
     participants_path = output_path / "participants.json"
-    participants_data = {
-        "pilot_id": config["pilot_id"],
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "participants": [to_dict(p) for p in participants],
-    }
-    with open(participants_path, "w") as f:
-        json.dump(participants_data, f, indent=2)
-    logger.info(f"Phase 9: Saved {len(participants)} participants to {participants_path}")
+    writes.append((
+        partial(
+            _write_participants,
+            participants_path,
+            config["pilot_id"],
+            generated_at,
+            participants,
+        ),
+        f"Phase 9: Saved {len(participants)} participants to {participants_path}",
+    ))
+
+    # Optional line-delimited copy for streaming readers
+    ndjson_path = None
+    if config.get("participants_ndjson", False):
+        ndjson_path = output_path / "participants.ndjson"
+        writes.append((
+            partial(
+                _write_participants_ndjson,
+                ndjson_path,
+                config["pilot_id"],
+                generated_at,
+                participants,
+            ),
+            f"Phase 9: Saved {len(participants)} participants to {ndjson_path}",
+        ))
 
     # Save cluster embeddings
     if clusters:
         clusters_path = output_path / "cluster_embeddings.json"
         clusters_data = {
             "pilot_id": config["pilot_id"],
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": generated_at,
             "clusters": [
                 c.to_dict() if hasattr(c, "to_dict") else _cluster_to_dict(c)
                 for c in clusters
             ],
         }
-        with open(clusters_path, "w") as f:
-            json.dump(clusters_data, f, indent=2)
-        logger.info(f"Phase 9: Saved {len(clusters)} clusters to {clusters_path}")
+        writes.append((
+            partial(atomic_write_bytes, clusters_path, _dumps(clusters_data)),
+            f"Phase 9: Saved {len(clusters)} clusters to {clusters_path}",
+        ))
+
+        if config.get("embedding_format", "json") == "msgpack":
+            if msgpack is None:
+                logger.warning(
+                    "Phase 9: msgpack is not installed; "
+                    "skipping cluster_embeddings.msgpack"
+                )
+            else:
+                msgpack_path = output_path / "cluster_embeddings.msgpack"
+                writes.append((
+                    partial(
+                        atomic_write_bytes,
+                        msgpack_path,
+                        msgpack.packb(
+                            clusters_data, use_bin_type=True, default=_msgpack_default
+                        ),
+                    ),
+                    f"Phase 9: Saved {len(clusters)} clusters to {msgpack_path}",
+                ))
+
+        embedded = [c for c in clusters if c.embedding is not None]
+        if embedded:
+            cluster_npz_path = output_path / "cluster_embeddings.npz"
+            writes.append((
+                partial(
+                    _write_npz,
+                    cluster_npz_path,
+                    [c.cluster_id for c in embedded],
+                    [c.embedding for c in embedded],
+                ),
+                f"Phase 9: Saved {len(embedded)} cluster embeddings "
+                f"to {cluster_npz_path}",
+            ))
     else:
         clusters_path = None
 
-    # Save individual embeddings
-    individual_embeddings = [
-        {
-            "participant_id": p.participant_id,
-            "embedding": p.individual_summary_embedding,
-        }
-        for p in participants
-        if p.individual_summary_embedding is not None
+    # Save individual embeddings (ids + float32 matrix; JSON only on request)
+    with_embeddings = [
+        p for p in participants if p.individual_summary_embedding is not None
     ]
 
-    if individual_embeddings:
-        embeddings_path = output_path / "individual_embeddings.json"
-        embeddings_data = {
-            "pilot_id": config["pilot_id"],
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "embeddings": individual_embeddings,
-        }
-        with open(embeddings_path, "w") as f:
-            json.dump(embeddings_data, f, indent=2)
-        logger.info(
-            f"Phase 9: Saved {len(individual_embeddings)} individual embeddings "
-            f"to {embeddings_path}"
-        )
+    embeddings_json_path = None
+    if with_embeddings:
+        embeddings_path = output_path / "individual_embeddings.npz"
+        writes.append((
+            partial(
+                _write_npz,
+                embeddings_path,
+                [p.participant_id for p in with_embeddings],
+                [p.individual_summary_embedding for p in with_embeddings],
+            ),
+            f"Phase 9: Saved {len(with_embeddings)} individual embeddings "
+            f"to {embeddings_path}",
+        ))
+
+        if config.get("embeddings_json", False):
+            embeddings_json_path = output_path / "individual_embeddings.json"
+            writes.append((
+                partial(
+                    _write_streamed,
+                    embeddings_json_path,
+                    config["pilot_id"],
+                    generated_at,
+                    "embeddings",
+                    (
+                        {
+                            "participant_id": p.participant_id,
+                            "embedding": p.individual_summary_embedding,
+                        }
+                        for p in with_embeddings
+                    ),
+                    indent=False,
+                ),
+                f"Phase 9: Saved {len(with_embeddings)} individual embeddings "
+                f"to {embeddings_json_path}",
+            ))
     else:
         embeddings_path = None
 
@@ -110,20 +228,207 @@ def run(
         participants, config, terminated_early, termination_reason
     )
     summary_path = output_path / "summary.json"
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
-    logger.info(f"Phase 9: Saved summary to {summary_path}")
+    writes.append((
+        partial(atomic_write_bytes, summary_path, _dumps(summary)),
+        f"Phase 9: Saved summary to {summary_path}",
+    ))
+
+    with ThreadPoolExecutor(max_workers=len(writes)) as pool:
+        futures = [pool.submit(write) for write, _ in writes]
+        for future, (_, message) in zip(futures, writes):
+            future.result()
+            logger.info(message)
 
     return {
         "phase": 9,
         "config_path": str(config_path),
         "participants_path": str(participants_path),
+        "participants_ndjson_path": str(ndjson_path) if ndjson_path else None,
         "clusters_path": str(clusters_path) if clusters_path else None,
         "embeddings_path": str(embeddings_path) if embeddings_path else None,
+        "embeddings_json_path": (
+            str(embeddings_json_path) if embeddings_json_path else None
+        ),
         "summary_path": str(summary_path),
     }
 
 
+def _yaml_scalar(value) -> str:
+    """Format a scalar as YAML, raising TypeError for unsupported types."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        text = repr(value)
+        # YAML 1.1 only resolves exponent floats that contain a dot
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, str):
+        if _PLAIN_YAML_STRING.match(value) and value.lower() not in _YAML_KEYWORDS:
+            return value
+        # A JSON string is a valid YAML double-quoted scalar
+        return json.dumps(value)
+    raise TypeError(f"Unsupported YAML value: {value!r}")
+
+
+def _dump_simple_yaml(d: dict, indent: str = "") -> str:
+    """Write a config-style dict as block YAML without the PyYAML emitter.
+
+    Handles string keys with scalar, list-of-scalar and nested dict values,
+    with keys sorted as yaml.dump does.
+
+    Args:
+        d: Dict to write
+        indent: Prefix for every line (used for nested dicts)
+
+    Returns:
+        YAML text
+
+    Raises:
+        TypeError: If the dict holds anything else, so the caller can fall
+            back to yaml.dump
+    """
+    lines = []
+    for key in sorted(d):
+        if not isinstance(key, str):
+            raise TypeError(f"Unsupported YAML key: {key!r}")
+        value = d[key]
+        name = _yaml_scalar(key)
+        if isinstance(value, dict) and value:
+            lines.append(f"{indent}{name}:\n" + _dump_simple_yaml(value, indent + "  "))
+        elif isinstance(value, (list, tuple)) and value:
+            lines.append(f"{indent}{name}:\n")
+            lines.extend(f"{indent}- {_yaml_scalar(item)}\n" for item in value)
+        elif isinstance(value, dict):
+            lines.append(f"{indent}{name}: {{}}\n")
+        elif isinstance(value, (list, tuple)):
+            lines.append(f"{indent}{name}: []\n")
+        else:
+            lines.append(f"{indent}{name}: {_yaml_scalar(value)}\n")
+    return "".join(lines)
+
+
+def _dumps(obj, indent: bool = True) -> bytes:
+    """Serialize object to JSON bytes (orjson if available).
+
+    Args:
+        obj: Object to serialize
+        indent: Indent by two spaces; otherwise write compact JSON for
+            machine-read data such as embeddings
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_streamed(
+    path: Path,
+    pilot_id: str,
+    generated_at: str,
+    key: str,
+    records,
+    indent: bool = True,
+) -> None:
+    """Write a results document whose ``key`` array is streamed record by record.
+
+    Only one record is serialized at a time, so peak memory stays at one
+    record rather than the whole document.
+
+    Args:
+        path: File to write
+        pilot_id: Pilot identifier for the header
+        generated_at: Timestamp for the header
+        key: Name of the array field
+        records: Iterable of JSON-serializable records
+        indent: Indent each record (see _dumps)
+    """
+    with atomic_open(path, WRITE_BUFFER_SIZE) as f:
+        f.write(
+            b'{\n  "pilot_id": ' + _dumps(pilot_id)
+            + b',\n  "generated_at": ' + _dumps(generated_at)
+            + b',\n  ' + _dumps(key) + b': ['
+        )
+        for i, record in enumerate(records):
+            f.write(b",\n" if i else b"\n")
+            f.write(_dumps(record, indent))
+        f.write(b"\n  ]\n}\n")
+
+
+def _msgpack_default(obj):
+    """Convert numpy values msgpack cannot pack natively."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to msgpack")
+
+
+def _write_npz(path: Path, ids: list[str], embeddings: list) -> None:
+    """Write ids and their embeddings as parallel arrays to an .npz file.
+
+    Load with ``np.load(path)``; ``ids[i]`` belongs to ``embeddings[i]``.
+    """
+    with atomic_open(path) as f:
+        np.savez(
+            f,
+            ids=np.array(ids, dtype=str),
+            embeddings=np.asarray(embeddings, dtype=EMBEDDING_DTYPE),
+        )
+
+
+def _write_participants(
+    path: Path, pilot_id: str, generated_at: str, participants: list[Participant]
+) -> None:
+    """Write participants.json one participant at a time.
+
+    Summary embeddings go to the individual_embeddings.npy sidecar next to
+    it (see checkpoint.participant_record).
+    """
+    rows = []
+    _write_streamed(
+        path,
+        pilot_id,
+        generated_at,
+        "participants",
+        (participant_record(p, rows) for p in participants),
+    )
+
+    npy_bytes = embeddings_npy_bytes(rows)
+    if npy_bytes is not None:
+        atomic_write_bytes(path.parent / INDIVIDUAL_EMBEDDINGS_NPY, npy_bytes)
+
+
+def _write_participants_ndjson(
+    path: Path, pilot_id: str, generated_at: str, participants: list[Participant]
+) -> None:
+    """Write participants as NDJSON: a header line, then one record per line.
+
+    Records match participants.json, including individual_summary_embedding_idx
+    into the same individual_embeddings.npy sidecar. Readers skip the
+    first (header) line and parse the rest one line at a time.
+    """
+    header = {
+        "pilot_id": pilot_id,
+        "generated_at": generated_at,
+        "schema_version": NDJSON_SCHEMA_VERSION,
+    }
+    rows = []
+    with atomic_open(path, WRITE_BUFFER_SIZE) as f:
+        f.write(_dumps(header, indent=False) + b"\n")
+        for p in participants:
+            f.write(_dumps(participant_record(p, rows), indent=False) + b"\n")
+
+
 def _cluster_to_dict(cluster) -> dict:
     """Convert ClusterInfo to dict (fallback if to_dict not available)."""
     return {
@@ -143,7 +448,38 @@ def _calculate_summary(
     termination_reason: str | None,
 ) -> dict:
     """Calculate summary statistics."""
-    conditions = ["simple_voting", "simple_passive", "clarified_passive", "acp"]
+    # One pass over all participants into per-condition accumulators
+    buckets = {
+        condition: {
+            "total": 0,
+            "completed": 0,
+            "failed": 0,
+            "initial": {},
+            "final": {},
+            "changed": 0,
+        }
+        for condition in CONDITIONS
+    }
+    for p in participants:
+        bucket = buckets.get(p.condition)
+        if bucket is None:
+            continue
+        bucket["total"] += 1
+        status = p.status
+        if status == "complete":
+            bucket["completed"] += 1
+            choice = p.initial_choice
+            if choice:
+                initial = bucket["initial"]
+                initial[choice] = initial.get(choice, 0) + 1
+            choice = p.final_choice
+            if choice:
+                final = bucket["final"]
+                final[choice] = final.get(choice, 0) + 1
+            if p.position_changed:
+                bucket["changed"] += 1
+        elif status == "failed":
+            bucket["failed"] += 1
 
     summary = {
         "pilot_id": config["pilot_id"],
@@ -153,30 +489,22 @@ def _calculate_summary(
         "by_condition": {},
     }
 
-    for condition in conditions:
-        group = get_by_condition(participants, condition)
-        completed = [p for p in group if p.status == "complete"]
-        failed = [p for p in group if p.status == "failed"]
-
-        # Initial vote distribution
-        initial_votes = Counter(p.initial_choice for p in completed if p.initial_choice)
-
+    for condition, bucket in buckets.items():
+        completed = bucket["completed"]
         condition_summary = {
-            "total": len(group),
-            "completed": len(completed),
-            "failed": len(failed),
-            "initial_vote_distribution": dict(initial_votes),
+            "total": bucket["total"],
+            "completed": completed,
+            "failed": bucket["failed"],
+            "initial_vote_distribution": bucket["initial"],
         }
 
         # Final vote stats (for conditions with final votes)
         if condition != "simple_voting":
-            final_votes = Counter(p.final_choice for p in completed if p.final_choice)
-            changed = sum(1 for p in completed if p.position_changed)
-
-            condition_summary["final_vote_distribution"] = dict(final_votes)
+            changed = bucket["changed"]
+            condition_summary["final_vote_distribution"] = bucket["final"]
             condition_summary["position_changed"] = changed
             condition_summary["position_changed_rate"] = (
-                changed / len(completed) if completed else 0
+                changed / completed if completed else 0
             )
         else:
             condition_summary["position_changed"] = None
@@ -0,0 +1,21 @@
+"""Throttled progress logging for per-participant phase loops."""
+
+# Number of progress lines logged over one loop (every 5%)
+PROGRESS_LOG_STEPS = 20
+
+
+def should_log_progress(index: int, total: int) -> bool:
+    """Whether to log progress for the participant at this index.
+
+    Logs the first and the last participant, plus about PROGRESS_LOG_STEPS
+    evenly spaced ones in between, instead of one line per participant.
+
+    Args:
+        index: 0-based position of the participant in the loop
+        total: Number of participants in the loop
+
+    Returns:
+        True if a progress line should be logged
+    """
+    step = max(1, total // PROGRESS_LOG_STEPS)
+    return index == 0 or (index + 1) % step == 0 or index + 1 == total
@@ -0,0 +1,72 @@
+"""In-process semantic cache for short LLM answers.
+
+Entries are looked up by cosine similarity of prompt embeddings rather than
+by exact prompt text, so near-identical prompts share one LLM call. Entries
+are grouped by namespace (e.g. model and topic) to keep unrelated prompts
+apart.
+"""
+
+import logging
+
+import numpy as np
+
+from .embeddings import (
+    EMBEDDING_DTYPE,
+    compact_normalized,
+    cosine_distances_prenormed,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.95
+
+# namespace -> (normalized embedding matrix, responses)
+_entries: dict[str, tuple[np.ndarray, list[str]]] = {}
+
+
+def lookup(
+    namespace: str, embedding: list[float], threshold: float = DEFAULT_THRESHOLD
+) -> str | None:
+    """Find the cached response for the most similar prompt.
+
+    Args:
+        namespace: Cache namespace
+        embedding: Embedding of the prompt
+        threshold: Minimum cosine similarity for a hit
+
+    Returns:
+        Cached response, or None if no prompt is similar enough
+    """
+    entry = _entries.get(namespace)
+    if entry is None:
+        return None
+
+    matrix, responses = entry
+    distances = cosine_distances_prenormed(compact_normalized(embedding), matrix)
+    best_idx = int(np.argmin(distances))
+    similarity = 1.0 - float(distances[best_idx])
+
+    if similarity < threshold:
+        return None
+
+    logger.debug(f"Semantic cache hit in '{namespace}' (similarity {similarity:.3f})")
+    return responses[best_idx]
+
+
+def insert(namespace: str, embedding: list[float], response: str) -> None:
+    """Add a prompt embedding and its response to the cache.
+
+    Args:
+        namespace: Cache namespace
+        embedding: Embedding of the prompt
+        response: Response to return for similar prompts
+    """
+    row = compact_normalized(np.asarray(embedding, dtype=EMBEDDING_DTYPE))[None]
+    matrix, responses = _entries.get(namespace, (None, []))
+    matrix = row if matrix is None else np.vstack([matrix, row])
+    _entries[namespace] = (matrix, responses + [response])
+
+
+def clear() -> None:
+    """Drop all cached entries."""
+    _entries.clear()
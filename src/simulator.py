@@ -1,24 +1,46 @@
 """Simulated participant LLM logic."""
 
+import functools
 import json
 import logging
 
-from .llm import call_llm
+from .llm import call_llm, call_llm_async, prompt_cache_key
 from .participants import Participant
 
 logger = logging.getLogger(__name__)
 
 
+# Multi-turn dialogues rebuild the same persona prompt for every call
+SYSTEM_PROMPT_CACHE_SIZE = 4096
+
+
 def _build_system_prompt(participant: Participant, topic: dict) -> str:
-    """Build system prompt for participant simulation."""
-    return f"""You are {participant.enriched_persona}
+    """Build system prompt for participant simulation.
+
+    The base prompt is cached per persona and topic, so every call for a
+    participant returns the same string; callers append their
+    call-specific context after it, keeping the shared prefix intact.
+    Keep per-call values such as timestamps out of system prompts, or
+    provider prefix caching can no longer match them.
+    """
+    return _persona_system_prompt(
+        participant.enriched_persona, topic["description"], tuple(topic["options"])
+    )
+
+
+@functools.lru_cache(maxsize=SYSTEM_PROMPT_CACHE_SIZE)
+def _persona_system_prompt(
+    enriched_persona: str, description: str, options: tuple[str, ...]
+) -> str:
+    """Build the persona and topic part of the participant system prompt."""
+    return f"""You are {enriched_persona}
 
 You are participating in a decision-making exercise about the following topic:
 
-{topic['description']}
+{description}
 
 Available options:
-{chr(10).join(f'- {opt}' for opt in topic['options'])}
+{chr(10).join(f'- {opt}' for opt in options)}
 
 Respond authentically based on your background, values, and experiences. Stay in character throughout.
 
@@ -38,19 +60,92 @@ Your writing style:
 """
 
 
-def make_initial_vote(
-    participant: Participant, topic: dict, config: dict
+@functools.lru_cache(maxsize=32)
+def _option_lookup(
+    options: tuple[str, ...]
+) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Option set and lowercased options for _match_option(), built once."""
+    return frozenset(options), tuple(opt.lower() for opt in options)
+
+
+def _match_option(choice: str, topic: dict) -> str | None:
+    """Match a response to a topic option, exactly or by substring.
+
+    Args:
+        choice: Stripped response text
+        topic: Topic dict with 'options'
+
+    Returns:
+        The matching option, or None if no option matches
+    """
+    options = tuple(topic["options"])
+    option_set, options_lower = _option_lookup(options)
+
+    # Common case: the response is exactly an option
+    if choice in option_set:
+        return choice
+
+    choice_lower = choice.lower()
+    for opt, opt_lower in zip(options, options_lower):
+        if opt_lower in choice_lower or choice_lower in opt_lower:
+            return opt
+    return None
+
+
+def _parse_choice(
+    response: str | None,
+    topic: dict,
+    fallback: str | None,
+    label: str,
+    fallback_note: str,
 ) -> str | None:
-    """Have participant make initial choice (without explanation).
+    """Map a vote response to one of the topic options.
 
     Args:
-        participant: The participant making the vote
-        topic: Topic dict with 'description' and 'options'
-        config: Experiment config
+        response: Raw LLM response (None if the call failed)
+        topic: Topic dict with 'options'
+        fallback: Choice to return when the response matches no option
+        label: Vote name used in the warning ("choice", "final choice")
+        fallback_note: What the warning says happens instead
 
     Returns:
-        Chosen option string or None if failed
+        Matching option, fallback, or None if the call failed
+    """
+    if response is None:
+        return None
+
+    choice = response.strip()
+
+    matched = _match_option(choice, topic)
+    if matched is None:
+        logger.warning(f"Invalid {label} '{choice}', {fallback_note}")
+        return fallback
+
+    return matched
+
+
+def _clarification_text(participant: Participant) -> str:
+    """Format a participant's clarification transcript for a system prompt.
+
+    The text is built once and kept on the participant for every dialogue
+    turn and final vote; it is rebuilt if the transcript is reassigned or
+    has grown.
     """
+    transcript = participant.clarification_transcript
+    cached = participant._clarification_text
+    if cached is not None and cached[0] is transcript and cached[1] == len(transcript):
+        return cached[2]
+
+    text = "\n".join(
+        f"{'Moderator' if e['role'] == 'moderator' else 'You'}: {e['content']}"
+        for e in transcript
+    )
+    participant._clarification_text = (transcript, len(transcript), text)
+    return text
+
+
+def _initial_vote_messages(participant: Participant, topic: dict) -> list[dict]:
+    """Build chat messages for the initial vote."""
     system_prompt = _build_system_prompt(participant, topic)
     options_list = "\n".join(f"{i+1}. {opt}" for i, opt in enumerate(topic["options"]))
 
@@ -61,48 +156,78 @@ Options:
 
 Respond with ONLY the exact text of your chosen option, nothing else."""
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt},
     ]
 
-    response = call_llm(messages, config)
-    if response is None:
-        return None
 
-    choice = response.strip()
+def _parse_initial_choice(response: str | None, topic: dict) -> str | None:
+    """Map an initial-vote response to one of the topic options."""
+    return _parse_choice(
+        response, topic, topic["options"][0], "choice", "defaulting to first option"
+    )
 
-    # Validate choice is one of the options
-    if choice not in topic["options"]:
-        # Try to match partially
-        for opt in topic["options"]:
-            if opt.lower() in choice.lower() or choice.lower() in opt.lower():
-                return opt
-        logger.warning(f"Invalid choice '{choice}', defaulting to first option")
-        return topic["options"][0]
 
-    return choice
+def _parse_final_choice(
+    response: str | None, participant: Participant, topic: dict
+) -> str | None:
+    """Map a final-vote response to a topic option, keeping the original if invalid."""
+    return _parse_choice(
+        response,
+        topic,
+        participant.initial_choice,
+        "final choice",
+        "keeping original",
+    )
 
 
-def respond_to_question(
-    participant: Participant,
-    question: str,
-    transcript: list[dict],
-    topic: dict,
-    config: dict,
+def make_initial_vote(
+    participant: Participant, topic: dict, config: dict
 ) -> str | None:
-    """Have participant respond to a clarifying question.
+    """Have participant make initial choice (without explanation).
 
     Args:
-        participant: The participant
-        question: The moderator's question
-        transcript: Previous exchanges in this conversation
-        topic: Topic dict
+        participant: The participant making the vote
+        topic: Topic dict with 'description' and 'options'
         config: Experiment config
 
     Returns:
-        Response string or None if failed
+        Chosen option string or None if failed
     """
+    messages = _initial_vote_messages(participant, topic)
+    return _parse_initial_choice(call_llm(messages, config), topic)
+
+
+async def make_initial_vote_async(
+    participant: Participant, topic: dict, config: dict
+) -> str | None:
+    """Async version of make_initial_vote().
+
+    Returns:
+        Chosen option string or None if failed
+    """
+    messages = _initial_vote_messages(participant, topic)
+    return _parse_initial_choice(await call_llm_async(messages, config), topic)
+
+
+def _dialogue_cache_key(messages: list[dict]) -> str:
+    """Prompt cache key for a dialogue turn.
+
+    The system message is identical on every turn of a participant's
+    dialogue and the transcript only grows after it, so keying on it sends
+    all turns to the same provider cache.
+    """
+    return prompt_cache_key(messages[0]["content"])
+
+
+def _question_messages(
+    participant: Participant,
+    question: str,
+    transcript: list[dict],
+    topic: dict,
+) -> list[dict]:
+    """Build chat messages for answering a clarifying question."""
     system_prompt = _build_system_prompt(participant, topic)
     system_prompt += f"""
 
@@ -119,32 +244,58 @@ A moderator is asking you clarifying questions to better understand your positio
 
     # Add current question
     messages.append({"role": "user", "content": question})
+    return messages
 
-    response = call_llm(messages, config)
-    return response
 
-
-def respond_to_challenge(
+def respond_to_question(
     participant: Participant,
-    challenge: str,
+    question: str,
     transcript: list[dict],
     topic: dict,
     config: dict,
-    cross_pollination_content: str | None = None,
 ) -> str | None:
-    """Have participant respond to an adversarial challenge.
+    """Have participant respond to a clarifying question.
 
     Args:
         participant: The participant
-        challenge: The moderator's challenge/question
-        transcript: Previous exchanges in this adversarial dialogue
+        question: The moderator's question
+        transcript: Previous exchanges in this conversation
         topic: Topic dict
         config: Experiment config
-        cross_pollination_content: Optional cluster summaries shown before dialogue
 
     Returns:
         Response string or None if failed
     """
+    messages = _question_messages(participant, question, transcript, topic)
+    return call_llm(messages, config, prompt_cache_key=_dialogue_cache_key(messages))
+
+
+async def respond_to_question_async(
+    participant: Participant,
+    question: str,
+    transcript: list[dict],
+    topic: dict,
+    config: dict,
+) -> str | None:
+    """Async version of respond_to_question().
+
+    Returns:
+        Response string or None if failed
+    """
+    messages = _question_messages(participant, question, transcript, topic)
+    return await call_llm_async(
+        messages, config, prompt_cache_key=_dialogue_cache_key(messages)
+    )
+
+
+def _challenge_messages(
+    participant: Participant,
+    challenge: str,
+    transcript: list[dict],
+    topic: dict,
+    cross_pollination_content: str | None = None,
+) -> list[dict]:
+    """Build chat messages for answering an adversarial challenge."""
     system_prompt = _build_system_prompt(participant, topic)
     system_prompt += f"""
 
@@ -152,10 +303,7 @@ You previously chose "{participant.initial_choice}"."""
 
     # Include clarification transcript if available (ACP participants have this)
     if participant.clarification_transcript:
-        clarification_text = "\n".join(
-            f"{'Moderator' if e['role'] == 'moderator' else 'You'}: {e['content']}"
-            for e in participant.clarification_transcript
-        )
+        clarification_text = _clarification_text(participant)
         system_prompt += f"""
 
 You previously explained your reasoning in the following exchange:
@@ -183,9 +331,55 @@ A moderator is presenting you with opposing viewpoints and challenging your reas
 
     # Add current challenge
     messages.append({"role": "user", "content": challenge})
+    return messages
+
+
+def respond_to_challenge(
+    participant: Participant,
+    challenge: str,
+    transcript: list[dict],
+    topic: dict,
+    config: dict,
+    cross_pollination_content: str | None = None,
+) -> str | None:
+    """Have participant respond to an adversarial challenge.
+
+    Args:
+        participant: The participant
+        challenge: The moderator's challenge/question
+        transcript: Previous exchanges in this adversarial dialogue
+        topic: Topic dict
+        config: Experiment config
+        cross_pollination_content: Optional cluster summaries shown before dialogue
+
+    Returns:
+        Response string or None if failed
+    """
+    messages = _challenge_messages(
+        participant, challenge, transcript, topic, cross_pollination_content
+    )
+    return call_llm(messages, config, prompt_cache_key=_dialogue_cache_key(messages))
 
-    response = call_llm(messages, config)
-    return response
+
+async def respond_to_challenge_async(
+    participant: Participant,
+    challenge: str,
+    transcript: list[dict],
+    topic: dict,
+    config: dict,
+    cross_pollination_content: str | None = None,
+) -> str | None:
+    """Async version of respond_to_challenge().
+
+    Returns:
+        Response string or None if failed
+    """
+    messages = _challenge_messages(
+        participant, challenge, transcript, topic, cross_pollination_content
+    )
+    return await call_llm_async(
+        messages, config, prompt_cache_key=_dialogue_cache_key(messages)
+    )
 
 
 def make_final_vote_after_summary(
@@ -209,10 +403,7 @@ You previously chose "{participant.initial_choice}"."""
 
     # Include clarification transcript if available (clarified_passive has this)
     if participant.clarification_transcript:
-        clarification_text = "\n".join(
-            f"{'Moderator' if e['role'] == 'moderator' else 'You'}: {e['content']}"
-            for e in participant.clarification_transcript
-        )
+        clarification_text = _clarification_text(participant)
         system_prompt += f"""
 
 You previously explained your reasoning in the following exchange:
@@ -234,40 +425,13 @@ Respond with ONLY the exact text of your chosen option, nothing else."""
         {"role": "user", "content": user_prompt},
     ]
 
-    response = call_llm(messages, config)
-    if response is None:
-        return None
-
-    choice = response.strip()
-
-    # Validate choice
-    if choice not in topic["options"]:
-        for opt in topic["options"]:
-            if opt.lower() in choice.lower() or choice.lower() in opt.lower():
-                return opt
-        logger.warning(f"Invalid final choice '{choice}', keeping original")
-        return participant.initial_choice
-
-    return choice
+    return _parse_final_choice(call_llm(messages, config), participant, topic)
 
 
-def make_final_vote_after_dialogue(
-    participant: Participant,
-    transcript: list[dict],
-    topic: dict,
-    config: dict,
-) -> str | None:
-    """Have participant make final choice after adversarial dialogue.
-
-    Args:
-        participant: The participant
-        transcript: The adversarial dialogue transcript
-        topic: Topic dict
-        config: Experiment config
-
-    Returns:
-        Final choice string or None if failed
-    """
+def _final_vote_after_dialogue_messages(
+    participant: Participant, transcript: list[dict], topic: dict
+) -> list[dict]:
+    """Build chat messages for the final vote after adversarial dialogue."""
     system_prompt = _build_system_prompt(participant, topic)
     system_prompt += f"""
 
@@ -275,10 +439,7 @@ You previously chose "{participant.initial_choice}"."""
 
     # Include clarification transcript (ACP participants have this)
     if participant.clarification_transcript:
-        clarification_text = "\n".join(
-            f"{'Moderator' if e['role'] == 'moderator' else 'You'}: {e['content']}"
-            for e in participant.clarification_transcript
-        )
+        clarification_text = _clarification_text(participant)
         system_prompt += f"""
 
 You previously explained your reasoning in the following exchange:
@@ -303,26 +464,48 @@ Now, you have an opportunity to revisit your vote. You may stick with your origi
 
 Respond with ONLY the exact text of your chosen option, nothing else."""
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt},
     ]
 
-    response = call_llm(messages, config)
-    if response is None:
-        return None
 
-    choice = response.strip()
+def make_final_vote_after_dialogue(
+    participant: Participant,
+    transcript: list[dict],
+    topic: dict,
+    config: dict,
+) -> str | None:
+    """Have participant make final choice after adversarial dialogue.
 
-    # Validate choice
-    if choice not in topic["options"]:
-        for opt in topic["options"]:
-            if opt.lower() in choice.lower() or choice.lower() in opt.lower():
-                return opt
-        logger.warning(f"Invalid final choice '{choice}', keeping original")
-        return participant.initial_choice
+    Args:
+        participant: The participant
+        transcript: The adversarial dialogue transcript
+        topic: Topic dict
+        config: Experiment config
 
-    return choice
+    Returns:
+        Final choice string or None if failed
+    """
+    messages = _final_vote_after_dialogue_messages(participant, transcript, topic)
+    return _parse_final_choice(call_llm(messages, config), participant, topic)
+
+
+async def make_final_vote_after_dialogue_async(
+    participant: Participant,
+    transcript: list[dict],
+    topic: dict,
+    config: dict,
+) -> str | None:
+    """Async version of make_final_vote_after_dialogue().
+
+    Returns:
+        Final choice string or None if failed
+    """
+    messages = _final_vote_after_dialogue_messages(participant, transcript, topic)
+    return _parse_final_choice(
+        await call_llm_async(messages, config), participant, topic
+    )
 
 
 def make_final_vote_simple(
@@ -355,18 +538,4 @@ Respond with ONLY the exact text of your chosen option, nothing else."""
         {"role": "user", "content": user_prompt},
     ]
 
-    response = call_llm(messages, config)
-    if response is None:
-        return None
-
-    choice = response.strip()
-
-    # Validate choice
-    if choice not in topic["options"]:
-        for opt in topic["options"]:
-            if opt.lower() in choice.lower() or choice.lower() in opt.lower():
-                return opt
-        logger.warning(f"Invalid final choice '{choice}', keeping original")
-        return participant.initial_choice
-
-    return choice
+    return _parse_final_choice(call_llm(messages, config), participant, topic)
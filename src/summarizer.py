@@ -1,12 +1,101 @@
 """Summary generation for individual positions and clusters."""
 
+import functools
+import io
+import json
 import logging
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
-from .llm import call_llm
+try:
+    import tiktoken
+except ImportError:  # Fall back to a character-based token estimate
+    tiktoken = None
+
+from .llm import call_llm, call_llm_batch
 from .participants import Participant
 
 logger = logging.getLogger(__name__)
 
+# Task instructions are fixed system messages, with the per-participant or
+# per-cluster content in the user message after them, so every request of a
+# kind starts with the same prefix for provider-side prompt caching.
+INDIVIDUAL_SUMMARY_INSTRUCTIONS = """You are analyzing a dialogue between a moderator and a participant about their decision.
+
+Summarize the participant's position and key arguments in 1-3 sentences.
+Focus ONLY on the participant's stance and reasoning (not the moderator's questions).
+Capture the core values, priorities, and reasoning behind their choice.
+
+Respond with ONLY the summary, no other text."""
+
+BATCH_SUMMARY_INSTRUCTIONS = """You are analyzing dialogues between a moderator and several participants about their decisions. Each dialogue is labeled with the participant (P1, P2, ...) and the option they chose.
+
+For each participant, summarize their position and key arguments in 1-3 sentences.
+Focus ONLY on the participant's stance and reasoning (not the moderator's questions).
+Capture the core values, priorities, and reasoning behind their choice.
+
+Respond with one block per participant, exactly in this form:
+<<<P1>>>summary of participant P1<<<END>>>
+<<<P2>>>summary of participant P2<<<END>>>
+
+Respond with ONLY these blocks, no other text."""
+
+CLUSTER_DESCRIPTION_INSTRUCTIONS = """You are analyzing a group of participants who all chose the same option in a decision-making exercise. You will be given the option and summaries of their individual positions.
+
+These participants share similar reasoning patterns. Create a unified description of this cluster's position in exactly 3 sentences:
+1. The core argument or value driving this group's choice
+2. The key reasoning or evidence they emphasize
+3. What distinguishes this perspective from others who made the same choice
+
+Respond with ONLY the 3-sentence description, no numbering or other text."""
+
+BATCH_CLUSTER_DESCRIPTION_INSTRUCTIONS = """You are analyzing several groups of participants in a decision-making exercise. Each group is labeled (C1, C2, ...) with the option all of its members chose, followed by summaries of their individual positions.
+
+The participants in each group share similar reasoning patterns. For each group, create a unified description of its position in exactly 3 sentences:
+1. The core argument or value driving this group's choice
+2. The key reasoning or evidence they emphasize
+3. What distinguishes this perspective from others who made the same choice
+
+Respond with a JSON object mapping each group label to its 3-sentence description, e.g. {"C1": "description of group C1", "C2": "description of group C2"}. Do not include numbering or any other text."""
+
+ARGUMENT_EXTRACTION_INSTRUCTIONS = """You are analyzing arguments in favor of one option in a decision-making exercise. You will be given the option and the arguments submitted by participants.
+
+Identify the STRONGEST and most compelling arguments for choosing that option.
+For each argument, write a clear, concise summary (1-2 sentences) that captures the key point.
+
+Respond with a JSON object of the form {"arguments": ["first argument", "second argument", ...]} holding the requested number of arguments, strongest first. Do not include any other text."""
+
+# Largest batch for extract_individual_summaries; bigger prompts make the
+# per-participant blocks less reliable
+SUMMARY_BATCH_MAX = 16
+_BATCH_SUMMARY_BLOCK = re.compile(r"<<<P(\d+)>>>(.*?)<<<END>>>", re.DOTALL)
+# Largest batch for generate_cluster_descriptions
+DESCRIPTION_BATCH_MAX = 12
+# Summary/argument prompt input limits: item count and token budget
+MAX_INPUT_ITEMS = 20
+DEFAULT_MAX_INPUT_TOKENS = 6000
+
+# Speaker labels for transcript roles in summary prompts
+_ROLE_LABELS = {"moderator": "Moderator", "participant": "Participant"}
+
+# JSON mode for argument extraction and batched cluster descriptions, so
+# the reply parses with json.loads
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+
+def _summary_config(config: dict) -> dict:
+    """Config for summarizer calls, with the on-disk LLM cache enabled.
+
+    Summary prompts are fully determined by their transcripts or summaries,
+    so reruns and resumes reuse earlier responses through the LLM cache
+    unless 'summary_cache' is false.
+    """
+    if config.get("summary_cache", True) and not config.get("llm_cache", False):
+        return {**config, "llm_cache": True}
+    return config
+
 
 def extract_individual_summary(
     participant: Participant, config: dict
@@ -20,36 +109,92 @@ def extract_individual_summary(
     Returns:
         1-3 sentence summary of participant's position, or None if failed
     """
+    existing = _existing_summary(participant, config)
+    if existing is not None:
+        return existing
+    messages = _individual_summary_messages(participant)
+    if messages is None:
+        return None
+    response = call_llm(messages, _summary_config(config))
+    return _parse_individual_summary(participant, response)
+
+
+def extract_individual_summaries_concurrent(
+    participants: list[Participant], config: dict, max_concurrency: int = 16
+) -> list[str | None]:
+    """Extract individual summaries with up to max_concurrency calls in flight.
+
+    Same prompts and results as calling extract_individual_summary() for
+    each participant, but all requests run as one call_llm_batch().
+
+    Args:
+        participants: Participants with clarification_transcript
+        config: Experiment config
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Summaries aligned with participants (None where extraction failed)
+    """
+    existing = [_existing_summary(p, config) for p in participants]
+    messages_by_index = {}
+    for i, participant in enumerate(participants):
+        if existing[i] is not None:
+            continue
+        messages = _individual_summary_messages(participant)
+        if messages is not None:
+            messages_by_index[i] = messages
+
+    responses = dict(zip(
+        messages_by_index,
+        call_llm_batch(
+            list(messages_by_index.values()), _summary_config(config), max_concurrency
+        ),
+    ))
+    return [
+        existing[i] if existing[i] is not None
+        else _parse_individual_summary(p, responses[i]) if i in responses
+        else None
+        for i, p in enumerate(participants)
+    ]
+
+
+def _existing_summary(participant: Participant, config: dict) -> str | None:
+    """Summary already on the participant, unless 'force_resummarize' is set.
+
+    Summaries are saved with the participant, so a rerun or a run that adds
+    participants re-extracts only the ones still missing.
+    """
+    if config.get("force_resummarize", False):
+        return None
+    return participant.individual_summary or None
+
+
+def _individual_summary_messages(participant: Participant) -> list[dict] | None:
+    """Build the summary extraction messages, or None without a transcript."""
     if not participant.clarification_transcript:
         logger.warning(
             f"No clarification transcript for {participant.participant_id}"
         )
         return None
 
-    # Build dialogue text focusing on participant's responses
-    dialogue_parts = []
-    for entry in participant.clarification_transcript:
-        role_label = "Moderator" if entry["role"] == "moderator" else "Participant"
-        dialogue_parts.append(f"{role_label}: {entry['content']}")
-    dialogue_text = "\n\n".join(dialogue_parts)
+    dialogue_text = _dialogue_text(participant)
 
-    prompt = f"""You are analyzing a dialogue between a moderator and a participant about their decision.
-
-The participant chose: "{participant.initial_choice}"
+    prompt = f"""The participant chose: "{participant.initial_choice}"
 
 Here is their clarification dialogue:
 
-{dialogue_text}
-
-Summarize the participant's position and key arguments in 1-3 sentences.
-Focus ONLY on the participant's stance and reasoning (not the moderator's questions).
-Capture the core values, priorities, and reasoning behind their choice.
+{dialogue_text}"""
 
-Respond with ONLY the summary, no other text."""
+    return [
+        {"role": "system", "content": INDIVIDUAL_SUMMARY_INSTRUCTIONS},
+        {"role": "user", "content": prompt},
+    ]
 
-    messages = [{"role": "user", "content": prompt}]
-    response = call_llm(messages, config)
 
+def _parse_individual_summary(
+    participant: Participant, response: str | None
+) -> str | None:
+    """Strip a summary response, logging failed calls."""
     if response is None:
         logger.warning(
             f"Failed to extract summary for {participant.participant_id}"
@@ -59,6 +204,140 @@ Respond with ONLY the summary, no other text."""
     return response.strip()
 
 
+def extract_individual_summaries(
+    participants: list[Participant], config: dict, batch_size: int = 8
+) -> list[str | None]:
+    """Extract individual summaries with several participants per LLM call.
+
+    Each batch shares one instruction prompt followed by labeled dialogues,
+    and the model answers with one delimited block per participant.
+    Participants whose block is missing or empty fall back to
+    extract_individual_summary().
+
+    Args:
+        participants: Participants with clarification_transcript
+        config: Experiment config
+        batch_size: Dialogues per call (capped at SUMMARY_BATCH_MAX)
+
+    Returns:
+        Summaries aligned with participants (None where extraction failed)
+    """
+    batch_size = max(1, min(batch_size, SUMMARY_BATCH_MAX))
+    summaries = []
+    for start in range(0, len(participants), batch_size):
+        summaries.extend(
+            _extract_summary_batch(participants[start:start + batch_size], config)
+        )
+    return summaries
+
+
+def _extract_summary_batch(
+    batch: list[Participant], config: dict
+) -> list[str | None]:
+    """Summarize one batch of participants in a single call."""
+    labeled = [
+        p for p in batch
+        if p.clarification_transcript and _existing_summary(p, config) is None
+    ]
+    if len(labeled) <= 1:
+        return [extract_individual_summary(p, config) for p in batch]
+
+    blocks = "\n\n".join(
+        f'=== Participant P{i} (chose "{p.initial_choice}") ===\n\n{_dialogue_text(p)}'
+        for i, p in enumerate(labeled, 1)
+    )
+
+    messages = [
+        {"role": "system", "content": BATCH_SUMMARY_INSTRUCTIONS},
+        {"role": "user", "content": blocks},
+    ]
+    response = call_llm(messages, _summary_config(config))
+
+    parsed = {}
+    if response is not None:
+        for label, text in _BATCH_SUMMARY_BLOCK.findall(response):
+            text = text.strip()
+            if text:
+                parsed[int(label)] = text
+
+    by_id = {
+        p.participant_id: parsed.get(i) for i, p in enumerate(labeled, 1)
+    }
+    missing = sum(1 for summary in by_id.values() if summary is None)
+    if missing:
+        logger.warning(
+            f"Batched summary missing {missing} of {len(labeled)} participants; "
+            f"extracting them individually"
+        )
+
+    return [
+        by_id.get(p.participant_id) or extract_individual_summary(p, config)
+        for p in batch
+    ]
+
+
+def _pack_by_tokens(items: list[str], config: dict) -> list[str]:
+    """Take leading items that fit the prompt input budget.
+
+    At most MAX_INPUT_ITEMS items are used, and items are added in order
+    until the next one would push the total past 'max_input_tokens'. The
+    first item is always kept, so a prompt is never left empty.
+
+    Args:
+        items: Texts to include in a prompt, in priority order
+        config: Experiment config ('max_input_tokens', 'model')
+
+    Returns:
+        Leading items within the budget
+    """
+    budget = config.get("max_input_tokens", DEFAULT_MAX_INPUT_TOKENS)
+    count_tokens = _token_counter(config.get("model", "gpt-4o"))
+    packed = []
+    used = 0
+    for item in islice(items, MAX_INPUT_ITEMS):
+        used += count_tokens(item)
+        if packed and used > budget:
+            break
+        packed.append(item)
+    return packed
+
+
+@functools.lru_cache(maxsize=8)
+def _token_counter(model: str):
+    """Token counting function for a model (tiktoken if available)."""
+    if tiktoken is not None:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+            return lambda text: len(encoding.encode(text))
+        except KeyError:  # Unknown model name
+            pass
+    # Same ~4 characters per token estimate as the rate limiter
+    return lambda text: len(text) // 4 + 1
+
+
+def _dialogue_text(participant: Participant) -> str:
+    """Format a clarification transcript, labeling each speaker.
+
+    The text is built once and kept on the participant for batched and
+    fallback extraction; it is rebuilt if the transcript is reassigned or
+    has grown.
+    """
+    transcript = participant.clarification_transcript
+    cached = participant._rendered_dialogue
+    if cached is not None and cached[0] is transcript and cached[1] == len(transcript):
+        return cached[2]
+
+    buffer = io.StringIO()
+    for i, entry in enumerate(transcript):
+        if i:
+            buffer.write("\n\n")
+        role_label = _ROLE_LABELS.get(entry["role"], "Participant")
+        buffer.write(f"{role_label}: {entry['content']}")
+    text = buffer.getvalue()
+    participant._rendered_dialogue = (transcript, len(transcript), text)
+    return text
+
+
 def generate_cluster_description(
     individual_summaries: list[str], option: str, config: dict
 ) -> str | None:
@@ -75,28 +354,140 @@ def generate_cluster_description(
     if not individual_summaries:
         return None
 
+    messages = _cluster_description_messages(individual_summaries, option, config)
+    response = call_llm(messages, _summary_config(config))
+    return _parse_cluster_description(option, response)
+
+
+def generate_cluster_descriptions_concurrent(
+    jobs: list[tuple[list[str], str]], config: dict, max_concurrency: int = 16
+) -> list[str | None]:
+    """Generate many cluster descriptions with up to max_concurrency calls in flight.
+
+    Args:
+        jobs: (individual summaries, option) pairs, one per cluster
+        config: Experiment config
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Descriptions aligned with jobs (None where generation failed)
+    """
+    indices = [i for i, (summaries, _) in enumerate(jobs) if summaries]
+    responses = dict(zip(
+        indices,
+        call_llm_batch(
+            [_cluster_description_messages(*jobs[i], config) for i in indices],
+            _summary_config(config),
+            max_concurrency,
+        ),
+    ))
+    return [
+        _parse_cluster_description(option, responses[i]) if i in responses else None
+        for i, (_, option) in enumerate(jobs)
+    ]
+
+
+def generate_cluster_descriptions(
+    jobs: list[tuple[list[str], str]], config: dict, batch_size: int = 12
+) -> list[str | None]:
+    """Generate cluster descriptions with several clusters per LLM call.
+
+    Each batch shares one instruction prompt followed by labeled clusters,
+    and the model answers with a JSON object keyed by cluster label.
+    Clusters whose description is missing or empty fall back to
+    generate_cluster_description().
+
+    Args:
+        jobs: (individual summaries, option) pairs, one per cluster
+        config: Experiment config
+        batch_size: Clusters per call (capped at DESCRIPTION_BATCH_MAX)
+
+    Returns:
+        Descriptions aligned with jobs (None where generation failed)
+    """
+    batch_size = max(1, min(batch_size, DESCRIPTION_BATCH_MAX))
+    descriptions = []
+    for start in range(0, len(jobs), batch_size):
+        descriptions.extend(
+            _generate_description_batch(jobs[start:start + batch_size], config)
+        )
+    return descriptions
+
+
+def _generate_description_batch(
+    batch: list[tuple[list[str], str]], config: dict
+) -> list[str | None]:
+    """Describe one batch of clusters in a single call."""
+    labeled = [i for i, (summaries, _) in enumerate(batch) if summaries]
+    if len(labeled) <= 1:
+        return [generate_cluster_description(*job, config) for job in batch]
+
+    blocks = "\n\n".join(
+        f'=== Cluster C{n} (chose "{batch[i][1]}") ===\n\n'
+        + "\n\n".join(
+            f"Position {j+1}: {summary}"
+            for j, summary in enumerate(_pack_by_tokens(batch[i][0], config))
+        )
+        for n, i in enumerate(labeled, 1)
+    )
+
+    messages = [
+        {"role": "system", "content": BATCH_CLUSTER_DESCRIPTION_INSTRUCTIONS},
+        {"role": "user", "content": blocks},
+    ]
+    response = call_llm(
+        messages, _summary_config(config), response_format=JSON_RESPONSE_FORMAT
+    )
+
+    parsed = {}
+    if response is not None:
+        try:
+            data = json.loads(response)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            for n, i in enumerate(labeled, 1):
+                text = data.get(f"C{n}")
+                if isinstance(text, str) and text.strip():
+                    parsed[i] = text.strip()
+
+    missing = len(labeled) - len(parsed)
+    if missing:
+        logger.warning(
+            f"Batched description missing {missing} of {len(labeled)} clusters; "
+            f"generating them individually"
+        )
+
+    return [
+        parsed.get(i) or generate_cluster_description(*job, config)
+        for i, job in enumerate(batch)
+    ]
+
+
+def _cluster_description_messages(
+    individual_summaries: list[str], option: str, config: dict
+) -> list[dict]:
+    """Build the cluster description messages."""
     # Format summaries for prompt
     summaries_text = "\n\n".join(
         f"Position {i+1}: {summary}"
-        for i, summary in enumerate(individual_summaries[:20])  # Limit input
+        for i, summary in enumerate(_pack_by_tokens(individual_summaries, config))
     )
 
-    prompt = f"""You are analyzing a group of participants who all chose "{option}" in a decision-making exercise.
+    prompt = f"""The participants all chose "{option}".
 
 Here are summaries of their individual positions:
 
-{summaries_text}
+{summaries_text}"""
 
-These participants share similar reasoning patterns. Create a unified description of this cluster's position in exactly 3 sentences:
-1. The core argument or value driving this group's choice
-2. The key reasoning or evidence they emphasize
-3. What distinguishes this perspective from others who made the same choice
+    return [
+        {"role": "system", "content": CLUSTER_DESCRIPTION_INSTRUCTIONS},
+        {"role": "user", "content": prompt},
+    ]
 
-Respond with ONLY the 3-sentence description, no numbering or other text."""
-
-    messages = [{"role": "user", "content": prompt}]
-    response = call_llm(messages, config)
 
+def _parse_cluster_description(option: str, response: str | None) -> str | None:
+    """Strip a cluster description response, logging failed calls."""
     if response is None:
         logger.warning(f"Failed to generate cluster description for {option}")
         return None
@@ -117,32 +508,29 @@ def format_cross_pollination_content(
     Returns:
         Formatted markdown string with cluster descriptions
     """
-    import random
-
     intro = (
         "Here is a summary of the positions that other participants have "
         "expressed on the issue and their key arguments."
     )
 
-    display_options = options.copy()
-    if randomize:
-        random.shuffle(display_options)
+    display_options = random.sample(options, len(options)) if randomize else options
 
-    sections = [intro, ""]
+    # Written straight into one buffer; each section is preceded by a
+    # blank line
+    buffer = io.StringIO()
+    buffer.write(f"{intro}\n")
 
     for option in display_options:
         clusters = clusters_by_option.get(option, [])
         if not clusters:
             continue
 
-        sections.append(f"## {option}")
-        sections.append("")
+        buffer.write(f"\n## {option}\n")
 
         for i, cluster in enumerate(clusters, 1):
-            sections.append(f"Position {i}: {cluster.description}")
-            sections.append("")
+            buffer.write(f"\nPosition {i}: {cluster.description}\n")
 
-    return "\n".join(sections)
+    return buffer.getvalue()
 
 
 # Keep legacy function for backwards compatibility during transition
@@ -168,40 +556,53 @@ def generate_summary(participants: list[Participant], config: dict) -> str:
 
     # Group explanations by choice
     explanations_by_option = defaultdict(list)
-    vote_counts = defaultdict(int)
 
     for p in participants:
         if p.status == "complete" and p.initial_choice and p.initial_explanation:
             explanations_by_option[p.initial_choice].append(p.initial_explanation)
-            vote_counts[p.initial_choice] += 1
+
+    # Each counted vote contributed exactly one explanation
+    vote_counts = {
+        option: len(explanations)
+        for option, explanations in explanations_by_option.items()
+    }
+    total_votes = sum(vote_counts.values())
+
+    # Extract top arguments for all options concurrently (independent LLM calls)
+    argued_options = [o for o in options if explanations_by_option.get(o)]
+    arguments_by_option = {}
+    if argued_options:
+        max_workers = min(len(argued_options), config.get("llm_max_concurrency", 16))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            arguments_by_option = dict(zip(
+                argued_options,
+                pool.map(
+                    lambda o: _extract_arguments(
+                        explanations_by_option[o], o, n_arguments, config
+                    ),
+                    argued_options,
+                ),
+            ))
 
     # Build summary for each option
     summary_parts = []
 
-    for option in options:
-        explanations = explanations_by_option.get(option, [])
-
-        if not explanations:
-            continue
-
-        # Extract top arguments using LLM
-        top_arguments = _extract_arguments(explanations, option, n_arguments, config)
+    for option in argued_options:
+        top_arguments = arguments_by_option[option]
 
         # Format option section
-        section = f"## {option}"
+        parts = [f"## {option}"]
         if include_votes:
-            total = sum(vote_counts.values())
-            pct = (vote_counts[option] / total * 100) if total > 0 else 0
-            section += f" ({vote_counts[option]} votes, {pct:.1f}%)"
-        section += "\n"
+            pct = (vote_counts[option] / total_votes * 100) if total_votes > 0 else 0
+            parts.append(f" ({vote_counts[option]} votes, {pct:.1f}%)")
+        parts.append("\n")
 
         if top_arguments:
-            for i, arg in enumerate(top_arguments, 1):
-                section += f"{i}. {arg}\n"
+            parts.extend(f"{i}. {arg}\n" for i, arg in enumerate(top_arguments, 1))
         else:
-            section += "No arguments available.\n"
+            parts.append("No arguments available.\n")
 
-        summary_parts.append(section)
+        summary_parts.append("".join(parts))
 
     if not summary_parts:
         return "No arguments were submitted."
@@ -232,38 +633,43 @@ def _extract_arguments(
 
     # Use LLM to extract strongest arguments
     explanations_text = "\n\n".join(
-        f"Argument {i+1}: {exp}" for i, exp in enumerate(explanations[:20])  # Limit input
+        f"Argument {i+1}: {exp}"
+        for i, exp in enumerate(_pack_by_tokens(explanations, config))
     )
 
-    prompt = f"""You are analyzing arguments in favor of "{option}" in a decision-making exercise.
+    prompt = f"""The option is "{option}".
 
 Here are the arguments submitted by participants:
 
 {explanations_text}
 
-Identify the {n} STRONGEST and most compelling arguments for choosing "{option}".
-For each argument, write a clear, concise summary (1-2 sentences) that captures the key point.
-
-Respond with exactly {n} arguments, one per line, numbered 1-{n}. Do not include any other text."""
+Respond with exactly {n} arguments."""
 
-    messages = [{"role": "user", "content": prompt}]
-    response = call_llm(messages, config)
+    messages = [
+        {"role": "system", "content": ARGUMENT_EXTRACTION_INSTRUCTIONS},
+        {"role": "user", "content": prompt},
+    ]
+    response = call_llm(
+        messages, _summary_config(config), response_format=JSON_RESPONSE_FORMAT
+    )
 
     if response is None:
         # Fallback: return first n explanations
         return explanations[:n]
 
-    # Parse response
-    arguments = []
-    for line in response.strip().split("\n"):
-        line = line.strip()
-        if line:
-            # Remove numbering if present
-            if line[0].isdigit() and (line[1] == "." or line[1] == ")"):
-                line = line[2:].strip()
-            elif line[0].isdigit() and line[1].isdigit() and line[2] in ".)":
-                line = line[3:].strip()
-            if line:
-                arguments.append(line)
-
+    arguments = _parse_arguments(response)
     return arguments[:n] if arguments else explanations[:n]
+
+
+def _parse_arguments(response: str) -> list[str]:
+    """Parse the arguments out of a JSON-mode {"arguments": [...]} reply.
+
+    Returns no arguments if the reply is not JSON of that shape.
+    """
+    try:
+        data = json.loads(response)
+    except ValueError:
+        return []
+    if not isinstance(data, dict) or not isinstance(data.get("arguments"), list):
+        return []
+    return [str(a).strip() for a in data["arguments"] if str(a).strip()]